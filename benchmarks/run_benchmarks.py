@@ -0,0 +1,271 @@
+"""
+Benchmark suite for solsysgen and waterio.
+
+Measures wall time (best of several repeats), peak traced memory
+(``tracemalloc``, one extra run) and throughput for:
+
+- ``generate_planets`` at several N
+- ``SolarSystem.step`` and ``state_m`` (plain planets and the array engine)
+- JSON round trip through ``save_json`` / ``load_json``
+- ``save_checkpoint`` / ``load_checkpoint`` at several array sizes
+- cold ``import`` of the packages in a fresh interpreter
+
+Run:
+  python benchmarks/run_benchmarks.py --out bench.json
+  python benchmarks/run_benchmarks.py --quick --baseline bench.json --threshold 0.2
+
+With ``--baseline`` every case is compared with the saved run by throughput;
+the script exits with status 1 if any case is more than ``--threshold``
+(a fraction) slower.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import numpy as np  # noqa: E402
+
+from solsysgen import SolarSystem, Sun, generate_planets  # noqa: E402
+from solsysgen.io import load_json, save_json  # noqa: E402
+from waterio import load_checkpoint, save_checkpoint  # noqa: E402
+
+RESULTS_VERSION = 1
+
+
+@dataclass
+class Case:
+    """One benchmark: ``run(state)`` returns the units of work it did."""
+
+    name: str
+    unit: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], float]
+
+
+def _system(n: int) -> SolarSystem:
+    sun = Sun()
+    return SolarSystem(sun=sun, planets=generate_planets(sun, n, seed=1))
+
+
+def _step(steps: int) -> Callable[[SolarSystem], float]:
+    def run(system: SolarSystem) -> float:
+        for _ in range(steps):
+            system.step(3600.0)
+        return steps * len(system)
+
+    return run
+
+
+def _json_roundtrip(state: Any) -> float:
+    system, path = state
+    save_json(path, system)
+    load_json(path)
+    return 2 * path.stat().st_size
+
+
+def _checkpoint(compression: str) -> Callable[[Any], float]:
+    def run(state: Any) -> float:
+        arr, path = state
+        save_checkpoint(path, compression=compression, positions=arr)
+        load_checkpoint(path)
+        return 2 * arr.nbytes
+
+    return run
+
+
+def _cold_import(module: str) -> Callable[[Any], float]:
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+
+    def run(_: Any) -> float:
+        subprocess.run([sys.executable, "-c", f"import {module}"], env=env, check=True)
+        return 1
+
+    return run
+
+
+def build_cases(quick: bool, workdir: Path) -> List[Case]:
+    sizes = [100, 1000] if quick else [100, 1000, 10000]
+    cases = [
+        Case(
+            f"generate_planets[{n}]",
+            "planets",
+            lambda: None,
+            lambda _, n=n: len(generate_planets(Sun(), n, seed=0)),
+        )
+        for n in sizes
+    ]
+
+    n = 2000 if quick else 20000
+    cases += [
+        Case(f"step[list,{n}]", "planet-steps", lambda n=n: _system(n), _step(10)),
+        Case(
+            f"step[arrays,{n * 10}]",
+            "planet-steps",
+            lambda n=n: _system(n * 10).use_arrays(),
+            _step(10),
+        ),
+        Case(
+            f"state_m[{n}]",
+            "planets",
+            lambda n=n: _system(n),
+            lambda s: len(s.state_m()),
+        ),
+    ]
+
+    for n in sizes:
+        path = workdir / f"system_{n}.json"
+        cases.append(
+            Case(
+                f"json_roundtrip[{n}]",
+                "bytes",
+                lambda n=n, path=path: (_system(n), path),
+                _json_roundtrip,
+            )
+        )
+
+    mib = [1, 4] if quick else [1, 16, 64]
+    rng = np.random.default_rng(0)
+    for size in mib:
+        for compression in ("none", "default"):
+            path = workdir / f"ckpt_{size}_{compression}.npz"
+            cases.append(
+                Case(
+                    f"checkpoint[{size}MiB,{compression}]",
+                    "bytes",
+                    lambda size=size, path=path: (
+                        np.cumsum(rng.normal(size=size * 2**17)),
+                        path,
+                    ),
+                    _checkpoint(compression),
+                )
+            )
+
+    # Includes interpreter start-up; compare runs against each other only
+    for module in ("solsysgen", "solsysgen.models", "solsysgen.system", "waterio"):
+        cases.append(
+            Case(f"import[{module}]", "imports", lambda: None, _cold_import(module))
+        )
+    return cases
+
+
+def measure(case: Case, repeat: int) -> Dict[str, Any]:
+    state = case.setup()
+    case.run(state)  # warm-up
+    best = float("inf")
+    units = 0.0
+    for _ in range(repeat):
+        state = case.setup()
+        t0 = time.perf_counter()
+        units = case.run(state)
+        best = min(best, time.perf_counter() - t0)
+
+    state = case.setup()
+    tracemalloc.start()
+    try:
+        case.run(state)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "wall_s": best,
+        "peak_bytes": peak,
+        "throughput": units / best if best > 0 else float("inf"),
+        "unit": f"{case.unit}/s",
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run_suite(
+    quick: bool = False, repeat: int = 3, select: Optional[str] = None
+) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in build_cases(quick, Path(tmp)):
+            if select and select not in case.name:
+                continue
+            results[case.name] = measure(case, repeat)
+            r = results[case.name]
+            print(
+                f"{case.name:32} {r['wall_s'] * 1e3:10.2f} ms "
+                f"{r['peak_bytes'] / 2**20:9.2f} MiB "
+                f"{r['throughput']:14.4g} {r['unit']}"
+            )
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Return the cases whose throughput fell by more than ``threshold``."""
+    regressions = []
+    for name, base in baseline["results"].items():
+        now = current["results"].get(name)
+        if now is None:
+            continue
+        ratio = now["throughput"] / base["throughput"]
+        if ratio < 1.0 - threshold:
+            regressions.append(name)
+            print(f"REGRESSION {name}: {ratio:.2f}x baseline throughput")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="smaller sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--select", help="only run cases containing this text")
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare to")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.quick, args.repeat, args.select)
+    if args.out:
+        args.out.write_text(json.dumps(current, indent=2), encoding="utf-8")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if compare(current, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
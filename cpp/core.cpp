@@ -1,18 +1,76 @@
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 
+#include <cmath>
+#include <cstddef>
+#include <stdexcept>
+
 namespace py = pybind11;
 
-class Counter {
-public:
-    explicit Counter(int start) : value(start) {}
-    int inc() { return ++value; }
-private:
-    int value;
-};
-
-PYBIND11_MODULE(_core, m) {
-    m.doc() = "Example C++ extension (pybind11)";
-    py::class_<Counter>(m, "Counter")
-        .def(py::init<int>(), py::arg("start"))
-        .def("inc", &Counter::inc, "Increment and return the counter");
+namespace {
+
+constexpr double TAU = 6.283185307179586;
+
+// Same result as Python's float % and numpy.remainder for a positive divisor.
+inline double wrap_phase(double x) {
+    double r = std::fmod(x, TAU);
+    if (r != 0.0) {
+        if (r < 0.0) {
+            r += TAU;
+        }
+    } else {
+        r = 0.0;
+    }
+    return r;
+}
+
+using InArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+using OutArray = py::array_t<double, py::array::c_style>;
+
+void propagate(InArray distance, OutArray phase, InArray omega, double dt,
+               py::ssize_t steps, OutArray out) {
+    if (dt < 0.0) {
+        throw std::invalid_argument("dt_s must be >= 0");
+    }
+    if (steps < 0) {
+        throw std::invalid_argument("steps must be >= 0");
+    }
+    if (distance.ndim() != 1 || phase.ndim() != 1 || omega.ndim() != 1) {
+        throw std::invalid_argument("distance, phase and omega must be 1-D");
+    }
+    const py::ssize_t n = phase.shape(0);
+    if (distance.shape(0) != n || omega.shape(0) != n) {
+        throw std::invalid_argument("distance, phase and omega must have equal length");
+    }
+    if (out.ndim() != 3 || out.shape(0) != steps || out.shape(1) != n ||
+        out.shape(2) != 2) {
+        throw std::invalid_argument("out must have shape (steps, N, 2)");
+    }
+
+    const double *d = distance.data();
+    const double *w = omega.data();
+    double *p = phase.mutable_data();
+    double *o = out.mutable_data();
+
+    py::gil_scoped_release release;
+    for (py::ssize_t k = 0; k < steps; ++k) {
+        double *frame = o + k * n * 2;
+        for (py::ssize_t i = 0; i < n; ++i) {
+            frame[2 * i] = d[i] * std::cos(p[i]);
+            frame[2 * i + 1] = d[i] * std::sin(p[i]);
+            // Two roundings, as in NumPy; needs -ffp-contract=off (no FMA)
+            p[i] = wrap_phase(p[i] + w[i] * dt);
+        }
+    }
+}
+
+}  // namespace
+
+PYBIND11_MODULE(solsysgen_native, m) {
+    m.doc() = "Native propagation kernels for solsysgen (pybind11)";
+    // phase and out are written in place, so they must not be converted.
+    m.def("propagate", &propagate, py::arg("distance"), py::arg("phase").noconvert(),
+          py::arg("omega"), py::arg("dt"), py::arg("steps"), py::arg("out").noconvert(),
+          "Record positions into out[k] and advance phase in place, for k < steps.\n"
+          "Runs without the GIL.");
 }
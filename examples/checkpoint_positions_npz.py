@@ -1,5 +1,9 @@
 """
-Save a checkpoint of planet positions over time using waterio.
+Save planet positions over time using waterio.
+
+Positions are produced in fixed-size chunks and streamed to disk as they are
+generated, so memory use does not grow with the number of steps. The final
+system state is then saved as a regular NPZ checkpoint.
 
 Run:
   python3 examples/checkpoint_positions_npz.py
@@ -11,7 +15,7 @@ import numpy as np
 
 from solsysgen import SolarSystem, Sun, generate_planets
 from solsysgen.constants import DAY_S
-from waterio import load_checkpoint, save_checkpoint
+from waterio import load_checkpoint, save_checkpoint, save_frames
 
 
 def main() -> None:
@@ -22,19 +26,20 @@ def main() -> None:
     steps = 20
     dt = 5 * DAY_S
 
-    # positions[t, i, xy]
-    pos = np.zeros((steps, len(planets), 2), dtype=np.float64)
+    # positions[t, i, xy], written chunk by chunk
+    chunks = system.iter_positions(dt, steps, chunk_steps=8)
+    n = save_frames("examples/positions_frames.npy", chunks)
 
-    for t in range(steps):
-        for i, p in enumerate(system.planets):
-            pos[t, i, :] = np.array(p.position_m(), dtype=np.float64)
-        system.step(dt)
+    pos = np.load("examples/positions_frames.npy", mmap_mode="r")
+    print("Streamed frames:", n, pos.shape)
+    print("Example first planet first frame:", pos[0, 0])
 
-    save_checkpoint("examples/positions_ckpt.npz", positions=pos)
+    system.step(steps * dt)
+    phases = np.array([p.phase_rad for p in system.planets], dtype=np.float64)
+    save_checkpoint("examples/positions_ckpt.npz", phase_rad=phases)
 
     out = load_checkpoint("examples/positions_ckpt.npz")
-    print("Saved positions:", out["positions"].shape)
-    print("Example first planet first frame:", out["positions"][0, 0])
+    print("Saved final phases:", out["phase_rad"].shape)
 
 
 if __name__ == "__main__":
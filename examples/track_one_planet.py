@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
 from solsysgen import SolarSystem, Sun, generate_planets
 from solsysgen.constants import DAY_S
 
@@ -19,20 +21,21 @@ def main() -> None:
     system = SolarSystem(sun=sun, planets=planets)
 
     # Pick a mid-distance planet (more interesting than the innermost)
-    target = system.planets[len(system.planets) // 2]
+    idx = len(system.planets) // 2
+    target = system.planets[idx]
     print("Target:", target.name, f"kind={target.kind}", f"a={target.distance_m:.3e} m")
 
     steps = 12
     dt = 10 * DAY_S  # 10 days per step
 
+    # Evaluate every sample time in closed form instead of stepping the system.
+    times = np.arange(steps + 1) * dt
+    positions = system.positions_at(times)[:, idx]
+
     print("\nstep   t_days      x_m            y_m         r_m")
-    t = 0.0
-    for i in range(steps + 1):
-        x, y = target.position_m()
+    for i, (t, (x, y)) in enumerate(zip(times, positions)):
         r = math.hypot(x, y)
         print(f"{i:>4} {t/DAY_S:>8.1f} {x:>13.3e} {y:>13.3e} {r:>11.3e}")
-        system.step(dt)
-        t += dt
 
 
 if __name__ == "__main__":
@@ -1,24 +1,94 @@
 # solsysgen/__init__.py
+"""
+solsysgen: procedural 2D solar systems with circular Kepler orbits.
+
+Public names are imported on first access (module ``__getattr__``), so
+``import solsysgen`` and ``from solsysgen.models import Planet`` stay cheap:
+NumPy and the optional native extension are only loaded by the features
+that need them.
+"""
+
 from __future__ import annotations
 
-from .constants import AU_M, DAY_S, TAU, YEAR_S, G
-from .generation import generate_planets
-from .io import load_json, save_json, to_json
-from .models import Planet, PlanetType, Sun
-from .system import SolarSystem
-
-__all__ = [
-    "G",
-    "AU_M",
-    "DAY_S",
-    "YEAR_S",
-    "TAU",
-    "Sun",
-    "Planet",
-    "PlanetType",
-    "SolarSystem",
-    "generate_planets",
-    "to_json",
-    "save_json",
-    "load_json",
-]
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# public name -> submodule that defines it
+_EXPORTS: Dict[str, str] = {
+    "G": "constants",
+    "AU_M": "constants",
+    "DAY_S": "constants",
+    "YEAR_S": "constants",
+    "TAU": "constants",
+    "Sun": "models",
+    "Planet": "models",
+    "PlanetType": "models",
+    "PlanetArrays": "soa",
+    "PlanetView": "soa",
+    "SolarSystem": "system",
+    "SystemBatch": "system_batch",
+    "generate_planets": "generation",
+    "PlanetBatch": "batch",
+    "generate_planet_batch": "batch",
+    "Catalog": "catalog",
+    "generate_catalog": "catalog",
+    "system_seed": "catalog",
+    "save_catalog": "catalog",
+    "load_catalog": "catalog",
+    "set_threads": "kernels",
+    "get_threads": "kernels",
+    "StatePublisher": "live",
+    "find_events": "events",
+    "separation_intervals": "events",
+    "find_transits": "events",
+    "GridIndex": "spatial",
+    "SharedSystem": "shared",
+    "to_json": "io",
+    "save_json": "io",
+    "load_json": "io",
+}
+
+# submodules exposed as attributes
+_SUBMODULES = ("instrument",)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        value: Any = importlib.import_module(f".{name}", __name__)
+    elif name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from . import instrument
+    from .batch import PlanetBatch, generate_planet_batch
+    from .catalog import (
+        Catalog,
+        generate_catalog,
+        load_catalog,
+        save_catalog,
+        system_seed,
+    )
+    from .constants import AU_M, DAY_S, TAU, YEAR_S, G
+    from .events import find_events, find_transits, separation_intervals
+    from .generation import generate_planets
+    from .io import load_json, save_json, to_json
+    from .kernels import get_threads, set_threads
+    from .live import StatePublisher
+    from .models import Planet, PlanetType, Sun
+    from .shared import SharedSystem
+    from .soa import PlanetArrays, PlanetView
+    from .spatial import GridIndex
+    from .system import SolarSystem
+    from .system_batch import SystemBatch
+
+__all__ = [*_SUBMODULES, *_EXPORTS]
@@ -0,0 +1,318 @@
+# solsysgen/catalog.py
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .generation import generate_planets
+from .models import PLANET_KINDS, Planet, Sun
+from .system import SolarSystem
+
+_KIND_CODES = {k: i for i, k in enumerate(PLANET_KINDS)}
+
+CATALOG_FORMAT_VERSION = 1
+
+# Blocks queued per worker process; bounds the futures (and results) in flight
+_BLOCKS_PER_WORKER = 2
+
+_PLANET_FLOATS = (
+    "mass_kg",
+    "radius_m",
+    "distance_m",
+    "phase_rad",
+    "period_s",
+    "orbital_speed_mps",
+)
+
+
+@dataclass(slots=True)
+class Catalog:
+    """
+    Columnar store for many solar systems.
+
+    Suns are one row per system (``sun_*`` columns). Planets of all systems
+    are concatenated into flat columns; the planets of system ``i`` are rows
+    ``offsets[i]:offsets[i + 1]``. ``kind`` holds int8 codes into
+    ``PLANET_KINDS``.
+    """
+
+    sun_name: np.ndarray
+    sun_mass_kg: np.ndarray
+    sun_radius_m: np.ndarray
+    sun_luminosity_w: np.ndarray
+    offsets: np.ndarray
+    name: np.ndarray
+    kind: np.ndarray
+    mass_kg: np.ndarray
+    radius_m: np.ndarray
+    distance_m: np.ndarray
+    phase_rad: np.ndarray
+    period_s: np.ndarray
+    orbital_speed_mps: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def n_planets(self) -> int:
+        return int(self.offsets[-1])
+
+    def sun(self, i: int) -> Sun:
+        return Sun(
+            name=str(self.sun_name[i]),
+            mass_kg=float(self.sun_mass_kg[i]),
+            radius_m=float(self.sun_radius_m[i]),
+            luminosity_w=float(self.sun_luminosity_w[i]),
+        )
+
+    def system(self, i: int) -> SolarSystem:
+        """Materialize system ``i`` as a ``SolarSystem`` of ``Planet`` objects."""
+        if not -len(self) <= i < len(self):
+            raise IndexError("system index out of range")
+        i %= len(self)
+        lo, hi = int(self.offsets[i]), int(self.offsets[i + 1])
+        planets = [
+            Planet(
+                name=name,
+                kind=PLANET_KINDS[code],
+                mass_kg=m,
+                radius_m=r,
+                distance_m=d,
+                phase_rad=ph,
+                period_s=T,
+                orbital_speed_mps=v,
+            )
+            for name, code, m, r, d, ph, T, v in zip(
+                self.name[lo:hi].tolist(),
+                self.kind[lo:hi].tolist(),
+                self.mass_kg[lo:hi].tolist(),
+                self.radius_m[lo:hi].tolist(),
+                self.distance_m[lo:hi].tolist(),
+                self.phase_rad[lo:hi].tolist(),
+                self.period_s[lo:hi].tolist(),
+                self.orbital_speed_mps[lo:hi].tolist(),
+            )
+        ]
+        return SolarSystem(sun=self.sun(i), planets=planets)
+
+    def systems(self) -> Iterator[SolarSystem]:
+        for i in range(len(self)):
+            yield self.system(i)
+
+    @staticmethod
+    def from_systems(systems: Iterable[SolarSystem]) -> "Catalog":
+        """Pack ``SolarSystem`` objects into a catalog."""
+        suns: List[Sun] = []
+        planets: List[Planet] = []
+        counts: List[int] = []
+        for s in systems:
+            suns.append(s.sun)
+            planets.extend(s.planets)
+            counts.append(len(s.planets))
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        n = len(planets)
+        return Catalog(
+            sun_name=np.array([s.name for s in suns], dtype=str),
+            sun_mass_kg=np.array([s.mass_kg for s in suns], dtype=np.float64),
+            sun_radius_m=np.array([s.radius_m for s in suns], dtype=np.float64),
+            sun_luminosity_w=np.array([s.luminosity_w for s in suns], dtype=np.float64),
+            offsets=offsets,
+            name=np.array([p.name for p in planets], dtype=str),
+            kind=np.fromiter((_KIND_CODES[p.kind] for p in planets), np.int8, count=n),
+            **{
+                f: np.fromiter((getattr(p, f) for p in planets), np.float64, count=n)
+                for f in _PLANET_FLOATS
+            },
+        )
+
+
+def system_seed(root_seed: int, index: int) -> int:
+    """
+    Seed for system ``index`` of a catalog built from ``root_seed``.
+
+    ``generate_planets(sun, n, seed=system_seed(root_seed, i))`` reproduces
+    system ``i`` of ``generate_catalog(..., root_seed=root_seed)``.
+    """
+    seq = np.random.SeedSequence(root_seed, spawn_key=(index,))
+    return int(seq.generate_state(1, np.uint64)[0])
+
+
+def _generate_block(
+    args: Tuple[Sun, int, int, int, int, float, float, str],
+) -> Dict[str, np.ndarray]:
+    sun, start, stop, n_planets, root_seed, inner_au, outer_au, name_dtype = args
+    n = (stop - start) * n_planets
+    cols = {f: np.empty(n, dtype=np.float64) for f in _PLANET_FLOATS}
+    cols["kind"] = np.empty(n, dtype=np.int8)
+    names: List[str] = []
+    row = 0
+    for i in range(start, stop):
+        planets = generate_planets(
+            sun,
+            n_planets,
+            seed=system_seed(root_seed, i),
+            inner_au=inner_au,
+            outer_au=outer_au,
+        )
+        for p in planets:
+            for f in _PLANET_FLOATS:
+                cols[f][row] = getattr(p, f)
+            cols["kind"][row] = _KIND_CODES[p.kind]
+            names.append(p.name)
+            row += 1
+    cols["name"] = np.array(names, dtype=name_dtype)
+    return cols
+
+
+def generate_catalog(
+    sun: Sun,
+    n_systems: int,
+    n_planets: int,
+    *,
+    root_seed: int,
+    workers: Optional[int] = None,
+    block_systems: int = 1024,
+    inner_au: float = 0.4,
+    outer_au: float = 40.0,
+) -> Catalog:
+    """
+    Generate ``n_systems`` systems around ``sun`` on a process pool.
+
+    System ``i`` is built by :func:`generate_planets` with the seed
+    ``system_seed(root_seed, i)``, so the catalog is identical for any
+    ``workers`` and ``block_systems``. Workers return each block of
+    ``block_systems`` systems as column arrays, which are copied into the
+    preallocated catalog columns as they arrive; at most
+    ``2 * workers`` blocks are queued at a time. ``workers=None`` uses every
+    core; ``workers=1`` runs in-process.
+    """
+    if n_systems < 0:
+        raise ValueError("n_systems must be >= 0")
+    if n_planets < 0:
+        raise ValueError("n_planets must be >= 0")
+    if block_systems <= 0:
+        raise ValueError("block_systems must be > 0")
+    if inner_au <= 0 or outer_au <= 0 or outer_au <= inner_au:
+        raise ValueError("inner_au and outer_au must be > 0 and outer_au > inner_au")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError("workers must be >= 1 (or None for every core)")
+
+    total = n_systems * n_planets
+    name_dtype = f"<U{len(f'Planet {n_planets}')}"
+    offsets = np.arange(n_systems + 1, dtype=np.int64) * n_planets
+    catalog = Catalog(
+        sun_name=np.full(n_systems, sun.name),
+        sun_mass_kg=np.full(n_systems, sun.mass_kg, dtype=np.float64),
+        sun_radius_m=np.full(n_systems, sun.radius_m, dtype=np.float64),
+        sun_luminosity_w=np.full(n_systems, sun.luminosity_w, dtype=np.float64),
+        offsets=offsets,
+        name=np.empty(total, dtype=name_dtype),
+        kind=np.empty(total, dtype=np.int8),
+        **{f: np.empty(total, dtype=np.float64) for f in _PLANET_FLOATS},
+    )
+
+    blocks = [
+        (
+            sun,
+            start,
+            min(start + block_systems, n_systems),
+            n_planets,
+            root_seed,
+            inner_au,
+            outer_au,
+            name_dtype,
+        )
+        for start in range(0, n_systems, block_systems)
+    ]
+
+    def _store(block: Tuple, cols: Dict[str, np.ndarray]) -> None:
+        lo, hi = block[1] * n_planets, block[2] * n_planets
+        for key, values in cols.items():
+            getattr(catalog, key)[lo:hi] = values
+
+    if workers == 1 or len(blocks) <= 1:
+        for block in blocks:
+            _store(block, _generate_block(block))
+    else:
+        queue = iter(blocks)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: Dict[Future, Tuple] = {
+                pool.submit(_generate_block, block): block
+                for block in itertools.islice(queue, _BLOCKS_PER_WORKER * workers)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _store(pending.pop(future), future.result())
+                    block = next(queue, None)
+                    if block is not None:
+                        pending[pool.submit(_generate_block, block)] = block
+    return catalog
+
+
+def _npz_path(path: str | Path) -> Path:
+    # Same rule as np.savez: append ".npz" unless the name already ends with it
+    path = Path(path)
+    return path if path.name.endswith(".npz") else path.with_name(path.name + ".npz")
+
+
+def save_catalog(path: str | Path, catalog: Catalog) -> None:
+    """
+    Save a catalog as an uncompressed NPZ of its columns.
+
+    Each column is stored as one ``.npy`` member; the ``kind`` vocabulary is
+    stored alongside the codes so files stay readable if ``PLANET_KINDS``
+    grows. As with ``np.savez``, ``.npz`` is appended to ``path`` if missing.
+    """
+    columns = {f.name: getattr(catalog, f.name) for f in fields(Catalog)}
+    np.savez(
+        _npz_path(path),
+        format_version=np.array(CATALOG_FORMAT_VERSION),
+        kinds=np.array(PLANET_KINDS),
+        **columns,
+    )
+
+
+def load_catalog(path: str | Path) -> Catalog:
+    """
+    Load a catalog written by :func:`save_catalog`.
+
+    ``path`` is resolved like on save, so ``load_catalog("cat")`` reads
+    ``cat.npz``.
+    """
+    path = _npz_path(path)
+    if not path.exists():
+        raise FileNotFoundError(path)
+    with np.load(path, allow_pickle=False) as data:
+        version = int(data["format_version"])
+        if version != CATALOG_FORMAT_VERSION:
+            raise ValueError(f"Unsupported catalog format version: {version}")
+        columns = {f.name: data[f.name] for f in fields(Catalog)}
+        stored_kinds = data["kinds"].tolist()
+
+    if stored_kinds != list(PLANET_KINDS[: len(stored_kinds)]):
+        unknown = set(stored_kinds) - set(PLANET_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown planet kinds in catalog: {sorted(unknown)}")
+        remap = np.array([_KIND_CODES[k] for k in stored_kinds], dtype=np.int8)
+        columns["kind"] = remap[columns["kind"]]
+    return Catalog(**columns)
+
+
+__all__ = [
+    "CATALOG_FORMAT_VERSION",
+    "Catalog",
+    "generate_catalog",
+    "system_seed",
+    "save_catalog",
+    "load_catalog",
+]
@@ -0,0 +1,296 @@
+# solsysgen/events.py
+"""
+Closed-form search for planet alignments.
+
+On circular orbits the phase difference of two planets is linear in time,
+``Δ(t) = Δ0 + Δω t``, so the times at which it takes a given value modulo
+``2π`` form an arithmetic sequence. Every event in a span is written down
+directly instead of being found by stepping: the cost is proportional to the
+number of events returned, however long the span.
+
+Times are offsets in seconds from the current state of the system, as in
+``SolarSystem.positions_at``. Planet indices refer to ``system.planets``.
+
+Transits are a special case: in this coplanar model the inner planet of a
+pair crosses the Sun's disc, as seen from the outer one, around every
+conjunction of the two, for as long as their heliocentric separation is
+small enough for the discs to overlap.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from .constants import TAU
+from .soa import PlanetArrays, _view_rows
+
+# Relative phase targets and their repeat period for each event kind
+_EVENT_KINDS = {
+    "conjunction": (0.0, TAU),
+    "opposition": (math.pi, TAU),
+    "syzygy": (0.0, math.pi),
+}
+
+
+@dataclass(slots=True)
+class Events:
+    """Alignment times sorted by time; planet ``i`` and ``j`` of each event."""
+
+    time_s: np.ndarray
+    i: np.ndarray
+    j: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.time_s)
+
+
+@dataclass(slots=True)
+class Intervals:
+    """Time intervals ``[start_s, stop_s]`` sorted by start, per pair ``(i, j)``."""
+
+    start_s: np.ndarray
+    stop_s: np.ndarray
+    i: np.ndarray
+    j: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.start_s)
+
+
+def _columns(system: Any, *names: str) -> Tuple[np.ndarray, ...]:
+    """Return the named float columns in ``system.planets`` order."""
+    if isinstance(system, PlanetArrays):
+        return tuple(getattr(system, name) for name in names)
+    planets = system.planets
+    arrays = getattr(system, "arrays", None)
+    if arrays is not None:
+        # Views may have been reordered in place since the arrays were packed
+        rows = _view_rows(planets, arrays)
+        if np.array_equal(rows, np.arange(len(rows))):
+            return tuple(getattr(arrays, name) for name in names)
+        if np.all(rows >= 0):
+            return tuple(getattr(arrays, name)[rows] for name in names)
+    arrays = PlanetArrays.from_planets(planets)
+    return tuple(getattr(arrays, name) for name in names)
+
+
+def _pairs(
+    phase: np.ndarray, omega: np.ndarray, pairs: Optional[Any]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    if pairs is None:
+        i, j = np.triu_indices(len(phase), k=1)
+    else:
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        i, j = pairs[:, 0], pairs[:, 1]
+        if np.any(i == j):
+            raise ValueError("pairs must name two different planets")
+    d0 = phase[i] - phase[j]
+    dw = omega[i] - omega[j]
+    return i, j, d0, dw
+
+
+def _counts(
+    d0: np.ndarray,
+    dw: np.ndarray,
+    target: float,
+    period: float,
+    t0: np.ndarray,
+    t1: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    a = d0 + dw * t0 - target
+    b = d0 + dw * t1 - target
+    k_lo = np.ceil(np.minimum(a, b) / period)
+    k_hi = np.floor(np.maximum(a, b) / period)
+    counts = np.where(dw != 0, k_hi - k_lo + 1, 0).clip(min=0).astype(np.int64)
+    return k_lo, counts
+
+
+def _crossings(
+    d0: np.ndarray,
+    dw: np.ndarray,
+    target: float,
+    period: float,
+    t0: np.ndarray,
+    t1: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Times in ``[t0, t1]`` at which ``d0 + dw t ≡ target (mod period)``.
+
+    Returns ``(pair, time)`` with one entry per crossing. Pairs with equal
+    angular speeds never cross (or never separate) and are skipped.
+    """
+    k_lo, counts = _counts(d0, dw, target, period, t0, t1)
+    pair = np.repeat(np.arange(len(d0)), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    k = k_lo[pair] + (np.arange(len(pair)) - first)
+    t = (target + k * period - d0[pair]) / dw[pair]
+    # Rounding can move a crossing at the very edge just outside the span
+    t = np.clip(t, t0[pair], t1[pair])
+    return pair, t
+
+
+def _span(t_start_s: float, t_stop_s: float) -> None:
+    if not t_stop_s >= t_start_s:
+        raise ValueError("t_stop_s must be >= t_start_s")
+
+
+def _event_kind(kind: str) -> Tuple[float, float]:
+    if kind not in _EVENT_KINDS:
+        raise ValueError(f"kind must be one of {tuple(_EVENT_KINDS)}, got {kind!r}")
+    return _EVENT_KINDS[kind]
+
+
+def count_events(
+    system: Any,
+    t_start_s: float,
+    t_stop_s: float,
+    *,
+    kind: str = "conjunction",
+    pairs: Optional[Any] = None,
+) -> np.ndarray:
+    """
+    Return the number of events per pair without listing them.
+
+    Costs O(pairs) for any span, so it can size a search before running
+    :func:`find_events` over a span too long to hold every event.
+    """
+    target, period = _event_kind(kind)
+    _span(t_start_s, t_stop_s)
+    _, _, d0, dw = _pairs(*_columns(system, "phase_rad", "omega_rad_s"), pairs)
+    t0 = np.full(len(d0), float(t_start_s))
+    t1 = np.full(len(d0), float(t_stop_s))
+    return _counts(d0, dw, target, period, t0, t1)[1]
+
+
+def find_events(
+    system: Any,
+    t_start_s: float,
+    t_stop_s: float,
+    *,
+    kind: str = "conjunction",
+    pairs: Optional[Any] = None,
+) -> Events:
+    """
+    Find every alignment of ``kind`` between ``t_start_s`` and ``t_stop_s``.
+
+    ``kind`` is ``"conjunction"`` (same heliocentric longitude),
+    ``"opposition"`` (longitudes differ by π) or ``"syzygy"`` (either).
+    ``system`` is a ``SolarSystem`` or ``PlanetArrays``; ``pairs`` is an
+    optional ``(P, 2)`` array of planet indices and defaults to every pair.
+    """
+    target, period = _event_kind(kind)
+    _span(t_start_s, t_stop_s)
+    i, j, d0, dw = _pairs(*_columns(system, "phase_rad", "omega_rad_s"), pairs)
+    t0 = np.full(len(d0), float(t_start_s))
+    t1 = np.full(len(d0), float(t_stop_s))
+    pair, t = _crossings(d0, dw, target, period, t0, t1)
+    order = np.argsort(t, kind="stable")
+    return Events(time_s=t[order], i=i[pair[order]], j=j[pair[order]])
+
+
+def _within(
+    i: np.ndarray,
+    j: np.ndarray,
+    d0: np.ndarray,
+    dw: np.ndarray,
+    max_sep_rad: np.ndarray,
+    t_start_s: float,
+    t_stop_s: float,
+) -> Intervals:
+    """Intervals in which pair ``k`` is within ``max_sep_rad[k]`` of conjunction."""
+    with np.errstate(divide="ignore"):
+        half = max_sep_rad / np.abs(dw)
+    pad = np.where(np.isfinite(half), half, 0.0)
+    pair, centre = _crossings(d0, dw, 0.0, TAU, t_start_s - pad, t_stop_s + pad)
+    start = np.maximum(centre - half[pair], t_start_s)
+    stop = np.minimum(centre + half[pair], t_stop_s)
+    keep = stop > start
+    pair, start, stop = pair[keep], start[keep], stop[keep]
+
+    # Pairs moving in lockstep are either always or never within range
+    sep = np.abs(np.remainder(d0 + math.pi, TAU) - math.pi)
+    (locked,) = np.nonzero((dw == 0) & (sep <= max_sep_rad))
+    if len(locked) and t_stop_s > t_start_s:
+        pair = np.concatenate([pair, locked])
+        start = np.concatenate([start, np.full(len(locked), float(t_start_s))])
+        stop = np.concatenate([stop, np.full(len(locked), float(t_stop_s))])
+    order = np.argsort(start, kind="stable")
+    return Intervals(
+        start_s=start[order],
+        stop_s=stop[order],
+        i=i[pair[order]],
+        j=j[pair[order]],
+    )
+
+
+def separation_intervals(
+    system: Any,
+    max_sep_rad: float,
+    t_start_s: float,
+    t_stop_s: float,
+    *,
+    pairs: Optional[Any] = None,
+) -> Intervals:
+    """
+    Find the intervals in which two planets are within ``max_sep_rad``.
+
+    The separation is the heliocentric angle between the planets, wrapped to
+    ``[0, π]``. Each interval is centred on a conjunction and lasts
+    ``2 * max_sep_rad / |Δω|``; intervals are clipped to the span.
+    """
+    if not 0 < max_sep_rad < math.pi:
+        raise ValueError("max_sep_rad must be in (0, π)")
+    _span(t_start_s, t_stop_s)
+    i, j, d0, dw = _pairs(*_columns(system, "phase_rad", "omega_rad_s"), pairs)
+    limit = np.full(len(d0), float(max_sep_rad))
+    return _within(i, j, d0, dw, limit, t_start_s, t_stop_s)
+
+
+def find_transits(
+    system: Any,
+    t_start_s: float,
+    t_stop_s: float,
+    *,
+    pairs: Optional[Any] = None,
+) -> Intervals:
+    """
+    Find when one planet is seen crossing the Sun's disc from another.
+
+    In each returned interval planet ``i`` (the inner one, orbit ``r``)
+    overlaps the Sun's disc as seen from planet ``j`` (orbit ``d``): its
+    distance from the line joining ``j`` and the Sun is below
+    ``R_sun * (d - r) / d + R_i``, the Sun's disc as seen from ``j`` scaled
+    to the orbit of ``i``, plus the radius of ``i``. ``system`` must be a
+    ``SolarSystem`` (the Sun's radius is needed); pairs at equal orbital
+    radii never transit.
+    """
+    _span(t_start_s, t_stop_s)
+    phase, omega, distance, radius = _columns(
+        system, "phase_rad", "omega_rad_s", "distance_m", "radius_m"
+    )
+    i, j, _, _ = _pairs(phase, omega, pairs)
+    inner = np.where(distance[i] < distance[j], i, j)
+    outer = np.where(distance[i] < distance[j], j, i)
+    keep = distance[inner] < distance[outer]
+    inner, outer = inner[keep], outer[keep]
+
+    r, d = distance[inner], distance[outer]
+    reach = system.sun.radius_m * (d - r) / d + radius[inner]
+    limit = np.arcsin(np.minimum(reach / r, 1.0))
+    d0 = phase[inner] - phase[outer]
+    dw = omega[inner] - omega[outer]
+    return _within(inner, outer, d0, dw, limit, t_start_s, t_stop_s)
+
+
+__all__ = [
+    "Events",
+    "Intervals",
+    "count_events",
+    "find_events",
+    "separation_intervals",
+    "find_transits",
+]
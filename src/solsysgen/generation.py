@@ -5,8 +5,9 @@ import math
 import random
 from typing import List, Optional
 
+from . import instrument
 from .constants import AU_M, DAY_S
-from .kepler import circular_speed_mps, period_s
+from .kepler import orbit
 from .models import Planet, PlanetType, Sun
 
 """
@@ -18,6 +19,18 @@ were reviewed and approved by the project author.
 """
 
 
+# Per-kind (low, high, unit) ranges for mass_kg and radius_m
+_KIND_HEURISTICS = {
+    "rocky": ((0.05, 5.0, 5.972e24), (0.3, 1.6, 6.371e6)),
+    "gas_giant": ((0.1, 3.0, 1.898e27), (0.7, 1.3, 6.9911e7)),
+    "ice_giant": ((0.5, 2.0, 8.681e25), (0.7, 1.2, 2.5362e7)),
+    "dwarf": ((0.0001, 0.01, 5.972e24), (0.05, 0.3, 6.371e6)),
+}
+
+# Kind boundaries as multiples of the snowline distance
+_SNOWLINE_EDGES = (0.8, 2.5, 8.0)
+
+
 def _snowline_au(luminosity_w: float) -> float:
     """
     Rough snowline estimate:
@@ -30,15 +43,17 @@ def _snowline_au(luminosity_w: float) -> float:
 
 def _pick_kind(distance_au: float, snowline_au: float) -> PlanetType:
     # Simple, believable rule:
-    if distance_au < snowline_au * 0.8:
+    rocky_edge, gas_edge, ice_edge = _SNOWLINE_EDGES
+    if distance_au < snowline_au * rocky_edge:
         return "rocky"
-    if distance_au < snowline_au * 2.5:
+    if distance_au < snowline_au * gas_edge:
         return "gas_giant"
-    if distance_au < snowline_au * 8.0:
+    if distance_au < snowline_au * ice_edge:
         return "ice_giant"
     return "dwarf"
 
 
+@instrument.timed("solsysgen.generate_planets")
 def generate_planets(
     sun: Sun,
     n_planets: int,
@@ -76,21 +91,11 @@ def generate_planets(
         kind = _pick_kind(distance_au, snow)
 
         # Rough physical heuristics (SI):
-        if kind == "rocky":
-            mass_kg = rng.uniform(0.05, 5.0) * 5.972e24
-            radius_m = rng.uniform(0.3, 1.6) * 6.371e6
-        elif kind == "gas_giant":
-            mass_kg = rng.uniform(0.1, 3.0) * 1.898e27
-            radius_m = rng.uniform(0.7, 1.3) * 6.9911e7
-        elif kind == "ice_giant":
-            mass_kg = rng.uniform(0.5, 2.0) * 8.681e25
-            radius_m = rng.uniform(0.7, 1.2) * 2.5362e7
-        else:
-            mass_kg = rng.uniform(0.0001, 0.01) * 5.972e24
-            radius_m = rng.uniform(0.05, 0.3) * 6.371e6
-
-        T = period_s(distance_m, sun.mass_kg)
-        v = circular_speed_mps(distance_m, sun.mass_kg)
+        (m_lo, m_hi, m_unit), (r_lo, r_hi, r_unit) = _KIND_HEURISTICS[kind]
+        mass_kg = rng.uniform(m_lo, m_hi) * m_unit
+        radius_m = rng.uniform(r_lo, r_hi) * r_unit
+
+        T, v = orbit(distance_m, sun.mass_kg)
         phase = rng.uniform(0.0, 2.0 * math.pi)
 
         planets.append(
@@ -107,6 +112,7 @@ def generate_planets(
         )
 
     planets.sort(key=lambda p: p.distance_m)
+    instrument.count("solsysgen.planets_generated", len(planets))
     return planets
 
 
@@ -129,6 +135,7 @@ def add_custom_planet(
     - distance_au must be > 0
     - phase_deg is wrapped into [0, 360)
     - period and orbital speed are derived from Kepler using the system Sun mass
+    - the overlap check and insertion use the system's radius index
     """
 
     if distance_au <= 0:
@@ -136,20 +143,13 @@ def add_custom_planet(
 
     distance_m = distance_au * AU_M
 
-    # Optional: avoid identical orbital radius
-    if not allow_overlap:
-        existing_m = [p.distance_m for p in system.planets]
-        if any(abs(distance_m - d) < 1e-3 for d in existing_m):
-            raise ValueError("A planet with the same orbital distance already exists.")
-
     # Wrap phase into [0, 360)
     phase_rad = math.radians(phase_deg % 360.0)
 
     # Kepler-derived values
-    T = period_s(distance_m, system.sun.mass_kg)
-    v = circular_speed_mps(distance_m, system.sun.mass_kg)
+    T, v = orbit(distance_m, system.sun.mass_kg)
 
-    # Create and append
+    # Create and insert in radius order
     p = Planet(
         name=name,
         kind=kind,
@@ -161,5 +161,4 @@ def add_custom_planet(
         orbital_speed_mps=v,
     )
 
-    system.planets.append(p)
-    system.planets.sort(key=lambda pl: pl.distance_m)
+    system.add_planet(p, allow_overlap=allow_overlap)
@@ -0,0 +1,212 @@
+# solsysgen/instrument.py
+"""
+Opt-in instrumentation for solsysgen and waterio hot paths.
+
+Named spans time a block of code, counters accumulate totals (planets
+stepped, bytes written) and gauges keep the last value of a measurement
+(compression ratio). Everything is recorded in an in-process
+:class:`Registry` that can be read with :func:`snapshot` or written to a
+JSON file with :func:`export_json`.
+
+Instrumentation is off by default and switched at runtime with
+:func:`enable` / :func:`disable`, or at start-up by setting the environment
+variable ``SOLSYSGEN_INSTRUMENT=1``. While off, a span is a shared no-op
+context manager and counters return after one flag check.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_enabled = os.environ.get("SOLSYSGEN_INSTRUMENT", "") not in ("", "0")
+
+
+class SpanStats:
+    """Call count and timing totals of one named span."""
+
+    __slots__ = ("count", "total_s", "min_s", "max_s")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_s = 0.0
+        self.min_s = float("inf")
+        self.max_s = 0.0
+
+    def add(self, elapsed_s: float) -> None:
+        self.count += 1
+        self.total_s += elapsed_s
+        self.min_s = min(self.min_s, elapsed_s)
+        self.max_s = max(self.max_s, elapsed_s)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_s": self.total_s,
+            "mean_s": self.total_s / self.count if self.count else 0.0,
+            "min_s": self.min_s if self.count else 0.0,
+            "max_s": self.max_s,
+        }
+
+
+class Registry:
+    """Thread-safe store of span timings, counters and gauges."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.spans: Dict[str, SpanStats] = {}
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+
+    def record_span(self, name: str, elapsed_s: float) -> None:
+        with self._lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.add(elapsed_s)
+
+    def add(self, name: str, value: float) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def set(self, name: str, value: float) -> None:
+        with self._lock:
+            self.gauges[name] = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "spans": {k: v.to_dict() for k, v in self.spans.items()},
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+            self.gauges.clear()
+
+
+REGISTRY = Registry()
+
+
+def enable() -> None:
+    """Start recording spans, counters and gauges."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording; what has been recorded so far is kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+class _Span:
+    __slots__ = ("name", "_t0")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        REGISTRY.record_span(self.name, time.perf_counter() - self._t0)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str) -> Any:
+    """Context manager timing its block under ``name`` while enabled."""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator recording every call of the function as span ``name``."""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return fn(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                REGISTRY.record_span(name, time.perf_counter() - t0)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def count(name: str, value: float = 1) -> None:
+    """Add ``value`` to counter ``name`` while enabled."""
+    if _enabled:
+        REGISTRY.add(name, value)
+
+
+def gauge(name: str, value: float) -> None:
+    """Set gauge ``name`` to ``value`` while enabled."""
+    if _enabled:
+        REGISTRY.set(name, value)
+
+
+def snapshot() -> Dict[str, Any]:
+    """Return everything recorded so far as plain dicts."""
+    return REGISTRY.snapshot()
+
+
+def reset() -> None:
+    """Clear all recorded spans, counters and gauges."""
+    REGISTRY.reset()
+
+
+def export_json(path: str | Path, *, extra: Optional[Dict[str, Any]] = None) -> None:
+    """Write :func:`snapshot` (plus ``extra`` metadata) to a JSON file."""
+    data = snapshot()
+    if extra:
+        data["meta"] = extra
+    Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+__all__ = [
+    "REGISTRY",
+    "Registry",
+    "SpanStats",
+    "enable",
+    "disable",
+    "is_enabled",
+    "span",
+    "timed",
+    "count",
+    "gauge",
+    "snapshot",
+    "reset",
+    "export_json",
+]
@@ -3,21 +3,169 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
 
+import numpy as np
+
+from . import instrument
+from .soa import _view_rows
 from .system import SolarSystem
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+# Planets encoded per call by the streaming writers
+_CHUNK_PLANETS = 1024
+
+
+def _dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON, compact when ``indent`` is None."""
+    if indent is not None:
+        # Pretty output stays on the stdlib so its float formatting matches
+        # files written before the orjson backend
+        return json.dumps(obj, indent=indent).encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _planet_dicts(system: SolarSystem) -> Iterator[Dict[str, Any]]:
+    arrays = system.arrays
+    rows = None if arrays is None else _view_rows(system.planets, arrays)
+    if rows is None or np.any(rows < 0):
+        for p in system.planets:
+            yield p.to_dict()
+        return
+    # Array engine: read whole columns once instead of one view per field,
+    # in ``planets`` order even if the views were reordered in place
+    names, kinds = list(arrays.names), arrays.kinds.tolist()
+    columns = zip(
+        [names[r] for r in rows.tolist()],
+        [kinds[r] for r in rows.tolist()],
+        arrays.mass_kg[rows].tolist(),
+        arrays.radius_m[rows].tolist(),
+        arrays.distance_m[rows].tolist(),
+        arrays.phase_rad[rows].tolist(),
+        arrays.period_s[rows].tolist(),
+        arrays.orbital_speed_mps[rows].tolist(),
+    )
+    for name, kind, m, r, d, ph, T, v in columns:
+        yield {
+            "name": name,
+            "kind": kind,
+            "mass_kg": m,
+            "radius_m": r,
+            "distance_m": d,
+            "phase_rad": ph,
+            "period_s": T,
+            "orbital_speed_mps": v,
+        }
+
+
+@instrument.timed("solsysgen.io.to_json")
+def to_json(system: SolarSystem, *, indent: Optional[int] = 2) -> str:
+    """
+    Encode ``system`` as JSON; ``indent=None`` gives compact output.
+
+    Indented output always comes from the standard library. Compact output
+    uses ``orjson`` when it is installed, which may spell some floats
+    differently (e.g. ``1e16`` for ``1e+16``) but reads back identically.
+    """
+    return _dumps(system.to_dict(), indent).decode("utf-8")
 
-def to_json(system: SolarSystem, *, indent: int = 2) -> str:
-    return json.dumps(system.to_dict(), indent=indent)
 
+def write_json(fp: IO[bytes], system: SolarSystem) -> None:
+    """
+    Stream ``system`` to a binary file as compact JSON.
 
-def save_json(path: str | Path, system: SolarSystem, *, indent: int = 2) -> None:
+    Planets are encoded in chunks as they are read, so the nested dict of
+    the whole system is never built. The output equals
+    ``to_json(system, indent=None)``.
+    """
+    fp.write(b'{"sun":')
+    fp.write(_dumps(system.sun.to_dict()))
+    fp.write(b',"planets":[')
+    chunk: List[Dict[str, Any]] = []
+    first = True
+    for d in _planet_dicts(system):
+        chunk.append(d)
+        if len(chunk) == _CHUNK_PLANETS:
+            fp.write((b"" if first else b",") + _dumps(chunk)[1:-1])
+            chunk.clear()
+            first = False
+    if chunk:
+        fp.write((b"" if first else b",") + _dumps(chunk)[1:-1])
+    fp.write(b"]}")
+
+
+@instrument.timed("solsysgen.io.save_json")
+def save_json(
+    path: str | Path, system: SolarSystem, *, indent: Optional[int] = 2
+) -> None:
+    """Write ``system`` to ``path``; ``indent=None`` streams compact JSON."""
     path = Path(path)
-    path.write_text(to_json(system, indent=indent), encoding="utf-8")
+    with path.open("wb") as fp:
+        if indent is None:
+            write_json(fp, system)
+        else:
+            fp.write(_dumps(system.to_dict(), indent))
+        instrument.count("solsysgen.io.bytes_written", fp.tell())
 
 
+@instrument.timed("solsysgen.io.load_json")
 def load_json(path: str | Path) -> SolarSystem:
     path = Path(path)
-    data: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    raw = path.read_bytes()
+    instrument.count("solsysgen.io.bytes_read", len(raw))
+    data: Dict[str, Any] = _loads(raw)
     return SolarSystem.from_dict(data)
+
+
+@instrument.timed("solsysgen.io.save_ndjson")
+def save_ndjson(path: str | Path, systems: Iterable[SolarSystem]) -> int:
+    """
+    Write one compact JSON system per line (NDJSON); return the line count.
+
+    ``systems`` is consumed lazily, e.g. ``catalog.systems()``, so only one
+    system is held at a time.
+    """
+    path = Path(path)
+    n = 0
+    with path.open("wb") as fp:
+        for system in systems:
+            write_json(fp, system)
+            fp.write(b"\n")
+            n += 1
+        instrument.count("solsysgen.io.bytes_written", fp.tell())
+    return n
+
+
+def iter_ndjson(path: str | Path) -> Iterator[SolarSystem]:
+    """Yield the systems of an NDJSON file one line at a time."""
+    path = Path(path)
+    with path.open("rb") as fp:
+        for line in fp:
+            if line.strip():
+                instrument.count("solsysgen.io.bytes_read", len(line))
+                yield SolarSystem.from_dict(_loads(line))
+
+
+__all__ = [
+    "JSON_BACKEND",
+    "to_json",
+    "write_json",
+    "save_json",
+    "load_json",
+    "save_ndjson",
+    "iter_ndjson",
+]
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import math
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, Tuple
 
 from .constants import TAU, G
 
@@ -14,15 +17,30 @@ were reviewed and approved by the project author.
 """
 
 
+def _check(distance_m: float, central_mass_kg: float) -> None:
+    if distance_m <= 0:
+        raise ValueError("distance_m must be > 0")
+    if central_mass_kg <= 0:
+        raise ValueError("central_mass_kg must be > 0")
+
+
+def _orbit(distance_m: float, central_mass_kg: float) -> Tuple[float, float]:
+    _check(distance_m, central_mass_kg)
+    gm = G * central_mass_kg
+    return (
+        TAU * math.sqrt((distance_m**3) / gm),
+        math.sqrt(gm / distance_m),
+    )
+
+
 def period_s(distance_m: float, central_mass_kg: float) -> float:
     """
     Kepler's 3rd law (two-body approx, circular orbit):
         T = 2π * sqrt(r^3 / (G*M))
     """
-    if distance_m <= 0:
-        raise ValueError("distance_m must be > 0")
-    if central_mass_kg <= 0:
-        raise ValueError("central_mass_kg must be > 0")
+    if _cache is not None:
+        return _cache.orbit(distance_m, central_mass_kg)[0]
+    _check(distance_m, central_mass_kg)
     return TAU * math.sqrt((distance_m**3) / (G * central_mass_kg))
 
 
@@ -31,8 +49,155 @@ def circular_speed_mps(distance_m: float, central_mass_kg: float) -> float:
     Circular orbit speed:
         v = sqrt(G*M / r)
     """
-    if distance_m <= 0:
+    if _cache is not None:
+        return _cache.orbit(distance_m, central_mass_kg)[1]
+    _check(distance_m, central_mass_kg)
+    return math.sqrt((G * central_mass_kg) / distance_m)
+
+
+def orbit(distance_m: float, central_mass_kg: float) -> Tuple[float, float]:
+    """
+    Return ``(period_s, orbital_speed_mps)`` with one validation (and one
+    cache lookup when the cache is enabled).
+    """
+    if _cache is not None:
+        return _cache.orbit(distance_m, central_mass_kg)
+    return _orbit(distance_m, central_mass_kg)
+
+
+# --- array versions ---------------------------------------------------------
+
+
+def _check_arrays(distance_m: Any, central_mass_kg: Any) -> Tuple[Any, Any]:
+    # NumPy is imported here so the scalar functions stay import-light
+    import numpy as np
+
+    d = np.asarray(distance_m, dtype=np.float64)
+    m = np.asarray(central_mass_kg, dtype=np.float64)
+    if not np.all(d > 0):
         raise ValueError("distance_m must be > 0")
-    if central_mass_kg <= 0:
+    if not np.all(m > 0):
         raise ValueError("central_mass_kg must be > 0")
-    return math.sqrt((G * central_mass_kg) / distance_m)
+    return d, m
+
+
+def periods_s(distance_m: Any, central_mass_kg: Any) -> Any:
+    """Vectorized :func:`period_s`; the arguments broadcast together."""
+    import numpy as np
+
+    d, m = _check_arrays(distance_m, central_mass_kg)
+    return TAU * np.sqrt(d**3 / (G * m))
+
+
+def circular_speeds_mps(distance_m: Any, central_mass_kg: Any) -> Any:
+    """Vectorized :func:`circular_speed_mps`; the arguments broadcast together."""
+    import numpy as np
+
+    d, m = _check_arrays(distance_m, central_mass_kg)
+    return np.sqrt((G * m) / d)
+
+
+# --- memoization ------------------------------------------------------------
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class KeplerCache:
+    """
+    Bounded LRU cache of ``(period_s, orbital_speed_mps)`` keyed by
+    ``(distance_m, central_mass_kg)``.
+
+    Pays off when the same orbits are derived again and again, e.g. systems
+    regenerated from the same seeds around a few standard stars. When full,
+    the least recently used entry is evicted. Invalid inputs raise and are
+    not cached.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[float, float], Tuple[float, float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def orbit(self, distance_m: float, central_mass_kg: float) -> Tuple[float, float]:
+        key = (distance_m, central_mass_kg)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        value = _orbit(distance_m, central_mass_kg)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, len(self._entries), self.maxsize
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+_cache: Optional[KeplerCache] = None
+
+
+def enable_cache(maxsize: int = 4096) -> KeplerCache:
+    """
+    Memoize the scalar functions in a new :class:`KeplerCache` and return it.
+
+    Off by default: a lookup costs about as much as the computation for
+    one-off inputs.
+    """
+    global _cache
+    _cache = KeplerCache(maxsize)
+    return _cache
+
+
+def disable_cache() -> None:
+    global _cache
+    _cache = None
+
+
+def cache_info() -> Optional[CacheInfo]:
+    """Statistics of the active cache, or None while caching is off."""
+    return _cache.info() if _cache is not None else None
+
+
+__all__ = [
+    "period_s",
+    "circular_speed_mps",
+    "orbit",
+    "periods_s",
+    "circular_speeds_mps",
+    "CacheInfo",
+    "KeplerCache",
+    "enable_cache",
+    "disable_cache",
+    "cache_info",
+]
@@ -0,0 +1,179 @@
+# solsysgen/kernels.py
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from .constants import TAU
+
+try:
+    import solsysgen_native as _native
+except ImportError:  # extension not built; use the NumPy kernels
+    _native = None
+
+HAVE_NATIVE = _native is not None
+
+# Arrays at least this long are split across threads when ``threads`` is
+# left at its default; below it the pool hand-off costs more than it saves.
+PARALLEL_MIN_BODIES = 1_000_000
+
+_threads = os.cpu_count() or 1
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_size = 0
+_pool_lock = threading.Lock()
+
+
+def set_threads(n: Optional[int]) -> None:
+    """Set the default thread count for sharded kernels (None = all CPUs)."""
+    global _threads
+    if n is None:
+        n = os.cpu_count() or 1
+    if n < 1:
+        raise ValueError("threads must be >= 1")
+    _threads = int(n)
+
+
+def get_threads() -> int:
+    """Return the default thread count for sharded kernels."""
+    return _threads
+
+
+def _executor(workers: int) -> ThreadPoolExecutor:
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is None or _pool_size < workers:
+            # Never shut the old pool down: another thread may still be
+            # submitting to it. It is dropped here, and its idle workers exit
+            # once the last caller holding it lets go.
+            _pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="solsysgen-shard"
+            )
+            _pool_size = workers
+        return _pool
+
+
+def shards(n: int, threads: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split ``range(n)`` into contiguous ``(start, stop)`` shards.
+
+    With ``threads=None`` the array is split into :func:`get_threads` shards
+    once it has at least ``PARALLEL_MIN_BODIES`` elements and left whole
+    otherwise; an explicit ``threads`` always gives that many shards (fewer
+    if ``n`` is smaller).
+    """
+    if threads is None:
+        threads = _threads if n >= PARALLEL_MIN_BODIES else 1
+    elif threads < 1:
+        raise ValueError("threads must be >= 1")
+    k = max(1, min(threads, n))
+    edges = [n * i // k for i in range(k + 1)]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def run_sharded(
+    fn: Callable[[int, int], None], n: int, threads: Optional[int] = None
+) -> None:
+    """
+    Call ``fn(start, stop)`` for every shard of ``range(n)``, in parallel.
+
+    ``fn`` must only touch its own slice. NumPy ufuncs release the GIL, so
+    shards run concurrently, and since every element is computed by the same
+    loop whatever the shard size, results do not depend on the thread count.
+    The calling thread runs the first shard itself.
+    """
+    parts = shards(n, threads)
+    if len(parts) == 1:
+        fn(*parts[0])
+        return
+    pool = _executor(len(parts) - 1)
+    futures = [pool.submit(fn, lo, hi) for lo, hi in parts[1:]]
+    try:
+        fn(*parts[0])
+    finally:
+        for f in futures:
+            f.result()
+
+
+def _propagate_numpy(
+    distance_m: np.ndarray,
+    phase_rad: np.ndarray,
+    omega_rad_s: np.ndarray,
+    dt_s: float,
+    steps: int,
+    out: np.ndarray,
+) -> None:
+    scratch = np.empty_like(phase_rad)
+    for k in range(steps):
+        np.cos(phase_rad, out=scratch)
+        np.multiply(distance_m, scratch, out=out[k, :, 0])
+        np.sin(phase_rad, out=scratch)
+        np.multiply(distance_m, scratch, out=out[k, :, 1])
+        np.multiply(omega_rad_s, dt_s, out=scratch)
+        np.add(phase_rad, scratch, out=phase_rad)
+        np.remainder(phase_rad, TAU, out=phase_rad)
+
+
+def propagate(
+    distance_m: np.ndarray,
+    phase_rad: np.ndarray,
+    omega_rad_s: np.ndarray,
+    dt_s: float,
+    steps: int,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Record ``steps`` frames of positions while advancing ``phase_rad`` in place.
+
+    ``out[k]`` holds the ``(N, 2)`` positions at the start of step ``k``;
+    afterwards ``phase_rad`` has advanced by ``steps * dt_s``. ``phase_rad``
+    must be a writeable, contiguous float64 array.
+
+    Uses the ``solsysgen_native`` extension (one call, GIL released) when it
+    is built, and an equivalent NumPy loop over steps otherwise. Phases are
+    identical on both paths when the extension is built with the shipped
+    CMakeLists.txt, which disables floating-point contraction so
+    ``p + w * dt`` is not fused into an FMA; positions may differ in the
+    last bit because the sine/cosine implementations differ.
+    """
+    if dt_s < 0:
+        raise ValueError("dt_s must be >= 0")
+    if steps < 0:
+        raise ValueError("steps must be >= 0")
+    if not (
+        isinstance(phase_rad, np.ndarray)
+        and phase_rad.dtype == np.float64
+        and phase_rad.ndim == 1
+        and phase_rad.flags.c_contiguous
+        and phase_rad.flags.writeable
+    ):
+        raise TypeError("phase_rad must be a writeable, contiguous 1-D float64 array")
+    n = phase_rad.shape[0]
+    distance_m = np.ascontiguousarray(distance_m, dtype=np.float64)
+    omega_rad_s = np.ascontiguousarray(omega_rad_s, dtype=np.float64)
+    if distance_m.shape != (n,) or omega_rad_s.shape != (n,):
+        raise ValueError("distance_m, phase_rad and omega_rad_s must have equal length")
+    if out is None:
+        out = np.empty((steps, n, 2), dtype=np.float64)
+    elif out.shape != (steps, n, 2) or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {(steps, n, 2)}")
+
+    if _native is not None and out.flags.c_contiguous:
+        _native.propagate(distance_m, phase_rad, omega_rad_s, float(dt_s), steps, out)
+    else:
+        _propagate_numpy(distance_m, phase_rad, omega_rad_s, dt_s, steps, out)
+    return out
+
+
+__all__ = [
+    "HAVE_NATIVE",
+    "PARALLEL_MIN_BODIES",
+    "propagate",
+    "run_sharded",
+    "set_threads",
+    "get_threads",
+    "shards",
+]
@@ -0,0 +1,251 @@
+# solsysgen/live.py
+"""
+Serve live system positions to many clients over asyncio.
+
+A :class:`StatePublisher` steps a :class:`~solsysgen.system.SolarSystem` on a
+fixed schedule and hands every frame to its subscribers. Each subscriber has
+its own bounded queue; when a slow consumer falls behind, its oldest frame is
+dropped so the producer never waits and the consumer always sees the most
+recent state. When the producer itself falls behind, it skips the missed
+ticks instead of sending them in a burst.
+
+Frames are compact binary snapshots: a fixed header (magic, sequence number,
+simulation time, body count) followed by the ``(N, 2)`` float64 positions in
+little-endian order. :func:`serve` exposes a publisher on a TCP socket, one
+frame after another on the stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from typing import Optional, Set, Tuple
+
+import numpy as np
+
+from .system import SolarSystem
+
+FRAME_MAGIC = b"SSGF"
+FRAME_HEADER = struct.Struct("<4sQdI")
+
+Frame = Tuple[int, float, np.ndarray]
+
+
+def encode_frame(seq: int, t_s: float, positions_m: np.ndarray) -> bytes:
+    """Pack ``(N, 2)`` positions into one binary frame."""
+    positions_m = np.ascontiguousarray(positions_m, dtype="<f8")
+    if positions_m.ndim != 2 or positions_m.shape[1] != 2:
+        raise ValueError("positions_m must have shape (N, 2)")
+    header = FRAME_HEADER.pack(FRAME_MAGIC, seq, t_s, positions_m.shape[0])
+    return header + positions_m.tobytes()
+
+
+def decode_frame(buf: bytes) -> Frame:
+    """Unpack a frame from :func:`encode_frame` into ``(seq, t_s, positions_m)``."""
+    magic, seq, t_s, n = FRAME_HEADER.unpack_from(buf)
+    if magic != FRAME_MAGIC:
+        raise ValueError("Not a solsysgen frame")
+    if len(buf) != FRAME_HEADER.size + 16 * n:
+        raise ValueError("Frame is truncated or has trailing bytes")
+    positions = np.frombuffer(buf, dtype="<f8", offset=FRAME_HEADER.size)
+    return seq, t_s, positions.reshape(n, 2)
+
+
+class Subscription:
+    """
+    One consumer's view of a :class:`StatePublisher`.
+
+    Iterate with ``async for frame in sub`` or call :meth:`get`; each item is
+    an encoded frame (``bytes``). ``dropped`` counts frames discarded because
+    the queue was full.
+    """
+
+    def __init__(self, publisher: "StatePublisher", maxsize: int) -> None:
+        self._publisher = publisher
+        # Unbounded so the closing marker never displaces a frame; _offer
+        # keeps the frames themselves to ``maxsize``
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._maxsize = maxsize
+        self.dropped = 0
+        self.closed = False
+
+    def _offer(self, frame: bytes) -> None:
+        if self._queue.qsize() >= self._maxsize:
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(frame)
+
+    def _end(self) -> None:
+        self._queue.put_nowait(None)
+
+    async def get(self) -> bytes:
+        """Wait for the next frame; raises ``StopAsyncIteration`` once closed."""
+        if self.closed:
+            raise StopAsyncIteration
+        frame = await self._queue.get()
+        if frame is None:
+            self.closed = True
+            raise StopAsyncIteration
+        return frame
+
+    def close(self) -> None:
+        """Stop receiving frames."""
+        subscribers = self._publisher._subscribers
+        if self in subscribers:
+            subscribers.discard(self)
+            self._end()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> bytes:
+        return await self.get()
+
+
+class StatePublisher:
+    """
+    Step ``system`` by ``dt_s`` every ``interval_s`` seconds and publish frames.
+
+    Frame ``seq`` holds the positions at simulation time ``seq * dt_s``
+    (relative to the state when the publisher was created). Each frame is
+    encoded once and the same ``bytes`` object is shared by all subscribers.
+
+    :meth:`run` steps the system in a worker thread, so other coroutines keep
+    running during a long step; leave ``system`` alone while it runs.
+    ``skipped`` counts ticks dropped because the publisher fell behind.
+    """
+
+    def __init__(
+        self,
+        system: SolarSystem,
+        dt_s: float,
+        *,
+        interval_s: float = 0.1,
+        max_queue: int = 4,
+    ) -> None:
+        if dt_s < 0:
+            raise ValueError("dt_s must be >= 0")
+        if interval_s < 0:
+            raise ValueError("interval_s must be >= 0")
+        if max_queue <= 0:
+            raise ValueError("max_queue must be > 0")
+        self.system = system
+        self.dt_s = float(dt_s)
+        self.interval_s = float(interval_s)
+        self.max_queue = max_queue
+        self.seq = 0
+        self.skipped = 0
+        self._subscribers: Set[Subscription] = set()
+
+    @property
+    def n_subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, maxsize: Optional[int] = None) -> Subscription:
+        """Register a consumer with a queue of ``maxsize`` frames."""
+        sub = Subscription(self, maxsize or self.max_queue)
+        self._subscribers.add(sub)
+        return sub
+
+    def publish(self) -> bytes:
+        """Encode the current state, send it to every subscriber, then step."""
+        frame = self._advance(0)
+        self._broadcast(frame)
+        return frame
+
+    def _advance(self, skip: int) -> bytes:
+        # Blocking half of a tick; run() calls it in a worker thread
+        if skip:
+            self.system.step(self.dt_s * skip)
+            self.seq += skip
+            self.skipped += skip
+        frame = encode_frame(self.seq, self.seq * self.dt_s, self.system.positions_m())
+        self.system.step(self.dt_s)
+        self.seq += 1
+        return frame
+
+    def _broadcast(self, frame: bytes) -> None:
+        for sub in list(self._subscribers):
+            sub._offer(frame)
+
+    async def run(self, n_frames: Optional[int] = None) -> None:
+        """
+        Publish ``n_frames`` frames (forever if None), one per ``interval_s``.
+
+        The schedule is kept against the loop clock, so a slow step shortens
+        the next wait instead of delaying every later frame. If whole ticks
+        have passed, the system jumps ahead by one step of ``k * dt_s`` and
+        publishes the current tick; frame ``seq`` values then have gaps.
+        Subscribers are closed when the run ends or is cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tick = 0
+        try:
+            count = 0
+            while n_frames is None or count < n_frames:
+                late = 0
+                if self.interval_s > 0:
+                    late = max(0, int((loop.time() - start) / self.interval_s) - tick)
+                frame = await asyncio.to_thread(self._advance, late)
+                self._broadcast(frame)
+                count += 1
+                tick += late + 1
+                await asyncio.sleep(
+                    max(0.0, start + tick * self.interval_s - loop.time())
+                )
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """End every subscription after the frames already queued."""
+        for sub in list(self._subscribers):
+            sub._end()
+        self._subscribers.clear()
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Frame:
+    """Read one frame from a stream written by :func:`serve`."""
+    header = await reader.readexactly(FRAME_HEADER.size)
+    n = FRAME_HEADER.unpack(header)[3]
+    payload = await reader.readexactly(16 * n)
+    return decode_frame(header + payload)
+
+
+async def serve(
+    publisher: StatePublisher, host: str = "127.0.0.1", port: int = 0
+) -> asyncio.Server:
+    """
+    Stream ``publisher``'s frames to every client that connects.
+
+    Each connection gets its own subscription, so a client that reads slowly
+    only loses its own frames. Use ``port=0`` to pick a free port; the bound
+    address is in ``server.sockets[0].getsockname()``.
+    """
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        sub = publisher.subscribe()
+        try:
+            async for frame in sub:
+                writer.write(frame)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            sub.close()
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+__all__ = [
+    "FRAME_HEADER",
+    "StatePublisher",
+    "Subscription",
+    "encode_frame",
+    "decode_frame",
+    "read_frame",
+    "serve",
+]
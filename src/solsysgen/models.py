@@ -15,6 +15,9 @@ were reviewed and approved by the project author.
 
 PlanetType = Literal["rocky", "gas_giant", "ice_giant", "dwarf"]
 
+# Stable integer codes for array/columnar storage: code i <-> PLANET_KINDS[i]
+PLANET_KINDS: Tuple[PlanetType, ...] = ("rocky", "gas_giant", "ice_giant", "dwarf")
+
 
 @dataclass(frozen=True, slots=True)
 class Sun:
@@ -116,4 +119,4 @@ class Planet:
         )
 
 
-__all__ = ["Sun", "Planet", "PlanetType"]
+__all__ = ["Sun", "Planet", "PlanetType", "PLANET_KINDS"]
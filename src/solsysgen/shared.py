@@ -0,0 +1,352 @@
+# solsysgen/shared.py
+"""
+Share one system's planet arrays between processes on the same host.
+
+:meth:`SharedSystem.create` copies a system into a named
+``multiprocessing.shared_memory`` block once. Other processes
+:meth:`~SharedSystem.attach` by name and get a
+:class:`~solsysgen.soa.PlanetArrays` whose columns are views straight onto
+the block: no JSON parse and no private copy per process.
+
+Block layout (little-endian, sections 64-byte aligned)::
+
+    header   magic "SSGS", version, seq, n, meta_len
+    meta     JSON: sun, kind categories, kind code dtype, name bytes
+    columns  mass_kg, radius_m, distance_m, phase_rad, period_s,
+             orbital_speed_mps, omega_rad_s   (float64 x n each)
+    kinds    kind codes
+    names    row offsets (int64 x n + 1), then the UTF-8 name bytes
+
+The meta stays a fixed size whatever ``n`` is, so attaching parses no
+per-planet JSON; names are decoded from the block as they are read.
+
+One process writes. ``seq`` is a seqlock: it is odd while a write is in
+progress and even otherwise, and ``seq // 2`` is the generation readers
+poll to see updates. The seqlock uses plain loads and stores, not atomics
+or fences: it relies on the CPU keeping stores (and loads) in program
+order, as x86-64 does. On weakly ordered CPUs such as ARM a reader can
+miss a concurrent write and return a torn snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import time
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+import numpy as np
+
+from .models import Sun
+from .soa import _FLOAT_FIELDS, Categorical, PackedStrings, PlanetArrays, _narrow
+from .system import SolarSystem
+
+SHARED_MAGIC = b"SSGS"
+SHARED_VERSION = 2
+_HEADER = struct.Struct("<4sIQQQ")
+_SEQ_OFFSET = 8
+_ALIGN = 64
+_COLUMNS = _FLOAT_FIELDS + ("omega_rad_s",)
+
+# Blocks created by this process (its resource tracker already owns them)
+_CREATED: Set[str] = set()
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _layout(
+    n: int, meta_len: int, kind_dtype: np.dtype, name_bytes: int
+) -> Tuple[Dict[str, int], int]:
+    offsets: Dict[str, int] = {}
+    off = _align(_HEADER.size + meta_len)
+    for col in _COLUMNS:
+        offsets[col] = off
+        off = _align(off + 8 * n)
+    offsets["kinds"] = off
+    off = _align(off + kind_dtype.itemsize * n)
+    offsets["name_offsets"] = off
+    off += 8 * (n + 1)
+    offsets["name_data"] = off
+    off += name_bytes
+    return offsets, off
+
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(name=name)
+    tracked = shm._name  # type: ignore[attr-defined]
+    if os.name == "posix" and tracked not in _CREATED:
+        # Attaching registers the block with this process's resource
+        # tracker, which would unlink it when this process exits
+        resource_tracker.unregister(tracked, "shared_memory")
+    return shm
+
+
+class SharedSystem:
+    """
+    A system's planet arrays in a named shared-memory block.
+
+    The creator gets writable arrays; :meth:`attach` gives read-only views
+    unless ``writable=True`` (for the one writer process). Wrap every write
+    in :meth:`writing` (or use :meth:`step`) so readers can tell a finished
+    state from a torn one; :meth:`snapshot` and
+    :meth:`snapshot_positions_m` return consistent copies.
+
+    Planet count and names are fixed when the block is created: renaming a
+    planet raises ``TypeError``, and a kind outside the block's kind
+    categories raises ``ValueError``.
+    Close the handle with :meth:`close` (after dropping any arrays or views
+    taken from it); the creator also calls :meth:`unlink` to free the block.
+    """
+
+    __slots__ = ("shm", "sun", "arrays", "writable", "_seq", "_owner")
+
+    def __init__(
+        self, shm: shared_memory.SharedMemory, *, writable: bool, owner: bool
+    ) -> None:
+        magic, version, _, _, _ = _HEADER.unpack_from(shm.buf)
+        if magic != SHARED_MAGIC:
+            raise ValueError("Not a solsysgen shared system")
+        if version != SHARED_VERSION:
+            raise ValueError(f"Unsupported shared system version {version}")
+        self.shm = shm
+        self.writable = writable
+        self._owner = owner
+        self.arrays: Optional[PlanetArrays] = None
+        self._seq: Optional[np.ndarray] = None
+        self._map()
+
+    def _map(self) -> None:
+        # Build this handle's arrays and seq word as views onto the block.
+        # np.frombuffer holds a buffer export, so the block cannot be
+        # unmapped under a live array (np.ndarray(buffer=...) does not).
+        buf = self.shm.buf
+        _, _, _, n, meta_len = _HEADER.unpack_from(buf)
+        meta = json.loads(bytes(buf[_HEADER.size : _HEADER.size + meta_len]))
+        kind_dtype = np.dtype(meta["kind_dtype"])
+        name_bytes = meta["name_bytes"]
+        offsets, _ = _layout(n, meta_len, kind_dtype, name_bytes)
+
+        def view(
+            key: str, dtype: Any, count: int = n, writable: bool = False
+        ) -> np.ndarray:
+            arr = np.frombuffer(buf, dtype=dtype, count=count, offset=offsets[key])
+            arr.flags.writeable = writable
+            return arr
+
+        columns = {col: view(col, "<f8", writable=self.writable) for col in _COLUMNS}
+        # Names and kinds are fixed in size: a rename that needed more bytes
+        # or a new kind category would have to move off the block
+        self.arrays = PlanetArrays(
+            PackedStrings(
+                view("name_offsets", "<i8", n + 1), view("name_data", "u1", name_bytes)
+            ),
+            Categorical(
+                view("kinds", kind_dtype, writable=self.writable),
+                meta["kinds"],
+                fixed=True,
+            ),
+            **columns,
+        )
+        self.sun = Sun.from_dict(meta["sun"])
+        self._seq = np.frombuffer(buf, dtype="<u8", count=1, offset=_SEQ_OFFSET)
+
+    @staticmethod
+    def create(system: SolarSystem, name: Optional[str] = None) -> "SharedSystem":
+        """Copy ``system`` into a new shared-memory block and return its writer."""
+        arrays = system.arrays
+        if arrays is None:
+            arrays = PlanetArrays.from_planets(system.planets)
+        n = len(arrays)
+        names = PackedStrings.from_values(arrays.names)
+        kinds = _narrow(arrays.kinds.codes, len(arrays.kinds.categories))
+        meta = json.dumps(
+            {
+                "sun": system.sun.to_dict(),
+                "kinds": arrays.kinds.categories,
+                "kind_dtype": kinds.dtype.str,
+                "name_bytes": len(names.data),
+            }
+        ).encode("utf-8")
+        offsets, size = _layout(n, len(meta), kinds.dtype, len(names.data))
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _CREATED.add(shm._name)  # type: ignore[attr-defined]
+        _HEADER.pack_into(shm.buf, 0, SHARED_MAGIC, SHARED_VERSION, 0, n, len(meta))
+        shm.buf[_HEADER.size : _HEADER.size + len(meta)] = meta
+        for col in _COLUMNS:
+            dst = np.ndarray((n,), dtype="<f8", buffer=shm.buf, offset=offsets[col])
+            dst[:] = getattr(arrays, col)
+        for key, src in (
+            ("kinds", kinds),
+            ("name_offsets", names.offsets.astype("<i8")),
+            ("name_data", names.data),
+        ):
+            dst = np.ndarray(
+                src.shape, dtype=src.dtype, buffer=shm.buf, offset=offsets[key]
+            )
+            dst[:] = src
+        return SharedSystem(shm, writable=True, owner=True)
+
+    @staticmethod
+    def attach(name: str, *, writable: bool = False) -> "SharedSystem":
+        """Map the block ``name`` created by another process (or this one)."""
+        return SharedSystem(_open(name), writable=writable, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def _seq_value(self) -> int:
+        if self._seq is None:
+            raise ValueError("SharedSystem is closed")
+        return int(self._seq[0])
+
+    @property
+    def generation(self) -> int:
+        """Number of completed writes since the block was created."""
+        return self._seq_value() // 2
+
+    def system(self) -> SolarSystem:
+        """
+        A ``SolarSystem`` working directly on the shared arrays.
+
+        Adding or removing planets gives the system private copies of the
+        columns; the block and this handle keep their planet count.
+        """
+        a = self.arrays
+        if a is None:
+            raise ValueError("SharedSystem is closed")
+        # Own PlanetArrays over the same buffers, so in-place row edits on
+        # the system cannot swap out this handle's columns
+        arrays = PlanetArrays(
+            a.names,
+            Categorical(a.kinds.codes, a.kinds.categories, fixed=True),
+            omega_rad_s=a.omega_rad_s,
+            **{col: getattr(a, col) for col in _FLOAT_FIELDS},
+        )
+        return SolarSystem.from_arrays(self.sun, arrays)
+
+    @contextmanager
+    def writing(self) -> Iterator[PlanetArrays]:
+        """
+        Mark a write: readers retry snapshots taken while it runs.
+
+        The ``seq`` bumps are plain stores; see the module docstring for
+        the memory-ordering assumption this makes.
+        """
+        if not self.writable or self._seq is None or self.arrays is None:
+            raise ValueError("SharedSystem is not writable")
+        seq = self._seq
+        seq[0] += 1
+        try:
+            yield self.arrays
+        finally:
+            seq[0] += 1
+
+    def step(self, dt_s: float) -> int:
+        """Advance every planet by ``dt_s`` as one write; return the generation."""
+        with self.writing() as arrays:
+            arrays.step(dt_s)
+        return self.generation
+
+    def snapshot(
+        self, *fields: str, timeout_s: float = 1.0
+    ) -> Tuple[int, Dict[str, np.ndarray]]:
+        """
+        Copy ``fields`` (default ``phase_rad``) from one generation.
+
+        Returns ``(generation, {field: array})``. Raises ``TimeoutError`` if
+        no copy free of concurrent writes is taken within ``timeout_s``.
+        """
+        if self.arrays is None:
+            raise ValueError("SharedSystem is closed")
+        fields = fields or ("phase_rad",)
+        for f in fields:
+            if f not in _COLUMNS:
+                raise ValueError(f"field must be one of {_COLUMNS}, got {f!r}")
+        deadline = time.monotonic() + timeout_s
+        while True:
+            before = self._seq_value()
+            if not before & 1:
+                out = {f: getattr(self.arrays, f).copy() for f in fields}
+                if self._seq_value() == before:
+                    return before // 2, out
+            if time.monotonic() > deadline:
+                raise TimeoutError("shared system is being written continuously")
+            time.sleep(0)
+
+    def snapshot_positions_m(self, *, timeout_s: float = 1.0) -> Tuple[int, np.ndarray]:
+        """
+        Return ``(generation, (N, 2) positions)`` from one consistent state.
+
+        Unlike ``positions_m`` elsewhere this also returns the generation,
+        like :meth:`snapshot`.
+        """
+        generation, cols = self.snapshot("distance_m", "phase_rad", timeout_s=timeout_s)
+        d, phase = cols["distance_m"], cols["phase_rad"]
+        return generation, np.stack([d * np.cos(phase), d * np.sin(phase)], axis=1)
+
+    def wait(
+        self,
+        generation: int,
+        *,
+        timeout_s: Optional[float] = None,
+        poll_s: float = 0.001,
+    ) -> int:
+        """Block until a write newer than ``generation`` completes; return it."""
+        deadline = None if timeout_s is None else time.monotonic() + timeout_s
+        while True:
+            current = self.generation
+            if current > generation:
+                return current
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError("no new generation before the timeout")
+            time.sleep(poll_s)
+
+    def close(self) -> None:
+        """
+        Unmap the block from this process.
+
+        Raises ``BufferError`` while arrays, views or systems taken from
+        this handle are still referenced elsewhere; the handle then stays
+        open and usable.
+        """
+        # The handle's own views also pin the mapping, so drop them first
+        self.arrays = None
+        self._seq = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # SharedMemory.close releases its memoryview before failing to
+            # close the mmap; restore it so the handle stays usable
+            shm = self.shm
+            if shm._buf is None:  # type: ignore[attr-defined]
+                shm._buf = memoryview(shm._mmap)  # type: ignore[attr-defined]
+            self._map()
+            raise
+
+    def unlink(self) -> None:
+        """Free the block (creator only); attached handles keep their mapping."""
+        if not self._owner:
+            raise ValueError("only the creating SharedSystem can unlink the block")
+        self.shm.unlink()
+        _CREATED.discard(self.shm._name)  # type: ignore[attr-defined]
+
+    def __enter__(self) -> "SharedSystem":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        try:
+            self.close()
+        finally:
+            # Free the block even if it could not be unmapped here
+            if self._owner:
+                self.unlink()
+
+
+__all__ = ["SharedSystem"]
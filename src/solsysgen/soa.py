@@ -0,0 +1,583 @@
+# solsysgen/soa.py
+from __future__ import annotations
+
+import math
+import sys
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from .constants import TAU
+from .kernels import propagate, run_sharded
+from .models import PLANET_KINDS, Planet, PlanetType
+
+_FLOAT_FIELDS = (
+    "mass_kg",
+    "radius_m",
+    "distance_m",
+    "phase_rad",
+    "period_s",
+    "orbital_speed_mps",
+)
+
+
+def _narrow(codes: np.ndarray, n_categories: int) -> np.ndarray:
+    for dtype in (np.int8, np.int16):
+        if n_categories <= np.iinfo(dtype).max + 1:
+            return codes.astype(dtype, copy=False)
+    return codes.astype(np.int32, copy=False)
+
+
+class Categorical:
+    """
+    A column of repeated strings stored as integer codes into ``categories``.
+
+    Planet kinds take one of a few values, and names repeat across the
+    systems of a batch (``"Planet 1"``, ``"Planet 2"``, ...), so each row
+    costs a one- or two-byte code instead of a pointer to its own ``str``.
+    Each distinct value is stored once and shared by all rows holding it.
+    Indexing, assignment and iteration behave like a list of strings.
+
+    Every category also costs a lookup entry, so for mostly unique values
+    (the names of one system) a plain list is smaller.
+
+    With ``fixed=True`` the categories cannot grow: assigning a value that
+    is not already a category raises ``ValueError`` rather than widening
+    ``codes`` into a new array (which would detach it from shared memory).
+    """
+
+    __slots__ = ("codes", "categories", "fixed", "_lookup")
+
+    def __init__(
+        self, codes: Any, categories: Sequence[str], *, fixed: bool = False
+    ) -> None:
+        codes = np.asarray(codes)
+        if codes.ndim != 1 or codes.dtype.kind not in "iu":
+            raise ValueError("codes must be a 1-D integer array")
+        self.categories = [str(c) for c in categories]
+        self._lookup = {c: i for i, c in enumerate(self.categories)}
+        if len(self._lookup) != len(self.categories):
+            raise ValueError("categories must be unique")
+        if len(codes) and (codes.min() < 0 or codes.max() >= len(self.categories)):
+            raise ValueError("codes must index into categories")
+        self.codes = _narrow(codes, len(self.categories))
+        self.fixed = fixed
+
+    @staticmethod
+    def from_values(
+        values: Iterable[str], categories: Sequence[str] = ()
+    ) -> "Categorical":
+        """Encode ``values``; ``categories`` fixes the codes of known values."""
+        lookup = {str(c): i for i, c in enumerate(categories)}
+        # setdefault hands a new value the next free code
+        codes = np.fromiter(
+            (lookup.setdefault(v, len(lookup)) for v in values), np.int64
+        )
+        return Categorical(codes, list(lookup))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self.categories[c] for c in self.codes[index].tolist()]
+        return self.categories[self.codes[index]]
+
+    def __setitem__(self, index: int, value: str) -> None:
+        code = self._lookup.get(value)
+        if code is None:
+            if self.fixed:
+                raise ValueError(f"{value!r} is not one of the fixed categories")
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+            self.codes = _narrow(self.codes, len(self.categories))
+        self.codes[index] = code
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self.categories.__getitem__, self.codes.tolist())
+
+    def tolist(self) -> List[str]:
+        return list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Categorical, list, tuple)):
+            return len(self) == len(other) and self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the codes, the categories and their lookup table."""
+        return (
+            self.codes.nbytes
+            + sys.getsizeof(self.categories)
+            + sys.getsizeof(self._lookup)
+            + sum(sys.getsizeof(c) for c in self.categories)
+        )
+
+    def __repr__(self) -> str:
+        return f"Categorical(n={len(self)}, categories={len(self.categories)})"
+
+
+def _categorical(values: Any, categories: Sequence[str] = ()) -> Categorical:
+    if isinstance(values, Categorical):
+        return values
+    return Categorical.from_values(values, categories)
+
+
+class PackedStrings:
+    """
+    A read-only column of strings stored as UTF-8 bytes plus row offsets.
+
+    Row ``i`` is ``data[offsets[i]:offsets[i + 1]]``. Both parts are flat
+    arrays, so the column can live in a buffer another process maps
+    (see :mod:`solsysgen.shared`) and is decoded row by row on access.
+    """
+
+    __slots__ = ("offsets", "data")
+
+    def __init__(self, offsets: Any, data: Any) -> None:
+        offsets = np.asarray(offsets)
+        data = np.asarray(data)
+        if offsets.ndim != 1 or offsets.dtype.kind not in "iu" or not len(offsets):
+            raise ValueError("offsets must be a non-empty 1-D integer array")
+        if data.ndim != 1 or data.dtype != np.uint8:
+            raise ValueError("data must be a 1-D uint8 array")
+        if offsets[0] != 0 or offsets[-1] != len(data) or np.any(np.diff(offsets) < 0):
+            raise ValueError("offsets must rise from 0 to len(data)")
+        self.offsets = offsets
+        self.data = data
+
+    @staticmethod
+    def from_values(values: Iterable[str]) -> "PackedStrings":
+        encoded = [str(v).encode("utf-8") for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return PackedStrings(offsets, data)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        i = range(len(self))[index]
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return self.data[lo:hi].tobytes().decode("utf-8")
+
+    def __setitem__(self, index: int, value: str) -> None:
+        raise TypeError("PackedStrings is read-only")
+
+    def __iter__(self) -> Iterator[str]:
+        data = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        return (data[a:b].decode("utf-8") for a, b in zip(offsets, offsets[1:]))
+
+    def tolist(self) -> List[str]:
+        return list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (PackedStrings, Categorical, list, tuple)):
+            return len(self) == len(other) and self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.nbytes + self.data.nbytes
+
+    def __repr__(self) -> str:
+        return f"PackedStrings(n={len(self)}, nbytes={self.data.nbytes})"
+
+
+class PlanetArrays:
+    """
+    Structure-of-arrays storage for the planets of one system.
+
+    Every numeric ``Planet`` field is held in a contiguous float64 array, and
+    the angular speed ``2π / period_s`` is cached in ``omega_rad_s`` so that
+    stepping is one vectorized multiply, add and modulo over all bodies.
+    ``kinds`` is a :class:`Categorical` column whose codes follow
+    ``PLANET_KINDS`` as in catalogs and batches. ``names`` is a plain list
+    for one system, where names are unique, or the :class:`Categorical`
+    (batches, where names repeat across systems) or read-only
+    :class:`PackedStrings` (shared memory) it is passed.
+
+    ``step``, ``positions_m`` and ``positions_at`` take a ``threads``
+    argument. By default arrays of ``kernels.PARALLEL_MIN_BODIES`` bodies or
+    more are split into contiguous shards processed on a thread pool (see
+    :func:`solsysgen.kernels.set_threads`); the output is bit-identical to a
+    single-threaded run.
+    """
+
+    __slots__ = (
+        "names",
+        "kinds",
+        "mass_kg",
+        "radius_m",
+        "distance_m",
+        "phase_rad",
+        "period_s",
+        "orbital_speed_mps",
+        "omega_rad_s",
+        "_scratch",
+    )
+
+    def __init__(
+        self,
+        names: Union[Iterable[str], Categorical, PackedStrings],
+        kinds: Iterable[PlanetType],
+        *,
+        mass_kg: np.ndarray,
+        radius_m: np.ndarray,
+        distance_m: np.ndarray,
+        phase_rad: np.ndarray,
+        period_s: np.ndarray,
+        orbital_speed_mps: np.ndarray,
+        omega_rad_s: Optional[np.ndarray] = None,
+    ) -> None:
+        self.names: Union[List[str], Categorical, PackedStrings] = (
+            names if isinstance(names, (Categorical, PackedStrings)) else list(names)
+        )
+        self.kinds = _categorical(kinds, PLANET_KINDS)
+        n = len(self.names)
+        if len(self.kinds) != n:
+            raise ValueError("names and kinds must have the same length")
+        self.mass_kg = _column(mass_kg, n, "mass_kg")
+        self.radius_m = _column(radius_m, n, "radius_m")
+        self.distance_m = _column(distance_m, n, "distance_m")
+        self.phase_rad = _column(phase_rad, n, "phase_rad")
+        self.period_s = _column(period_s, n, "period_s")
+        self.orbital_speed_mps = _column(orbital_speed_mps, n, "orbital_speed_mps")
+        if np.any(self.period_s <= 0):
+            raise ValueError("period_s must be > 0")
+        if omega_rad_s is None:
+            self.omega_rad_s = TAU / self.period_s
+        else:
+            # Trusted to equal 2π / period_s, e.g. arrays restored from a buffer
+            self.omega_rad_s = _column(omega_rad_s, n, "omega_rad_s")
+        self._scratch = np.empty(n, dtype=np.float64)
+
+    @staticmethod
+    def from_planets(
+        planets: Iterable[Any], *, categorical_names: bool = False
+    ) -> "PlanetArrays":
+        """
+        Pack planets (or planet views) into contiguous arrays.
+
+        Names stay a plain list unless ``categorical_names`` is set, for
+        batches where the same names recur across systems.
+        """
+        planets = list(planets)
+        n = len(planets)
+        columns = {
+            f: np.fromiter((getattr(p, f) for p in planets), np.float64, count=n)
+            for f in _FLOAT_FIELDS
+        }
+        names: Union[List[str], Categorical] = [p.name for p in planets]
+        if categorical_names:
+            names = Categorical.from_values(names)
+        return PlanetArrays(
+            names,
+            (p.kind for p in planets),
+            **columns,
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> "PlanetView":
+        return self.view(index)
+
+    def __iter__(self) -> Iterator["PlanetView"]:
+        """Yield a view per row on demand, without keeping them alive."""
+        return map(self._new_view, range(len(self)))
+
+    def _new_view(self, index: int) -> "PlanetView":
+        return PlanetView(self, index)
+
+    def step(self, dt_s: float, *, threads: Optional[int] = None) -> None:
+        """Advance every phase by ``dt_s`` seconds, wrapped into [0, 2π)."""
+        if dt_s < 0:
+            raise ValueError("dt_s must be >= 0")
+
+        def kernel(lo: int, hi: int) -> None:
+            phase = self.phase_rad[lo:hi]
+            scratch = self._scratch[lo:hi]
+            np.multiply(self.omega_rad_s[lo:hi], dt_s, out=scratch)
+            np.add(phase, scratch, out=phase)
+            np.remainder(phase, TAU, out=phase)
+
+        run_sharded(kernel, len(self), threads)
+
+    def positions_m(
+        self, out: Optional[np.ndarray] = None, *, threads: Optional[int] = None
+    ) -> np.ndarray:
+        """Return heliocentric positions as an ``(N, 2)`` array."""
+        n = len(self)
+        if out is None:
+            out = np.empty((n, 2), dtype=np.float64)
+        elif out.shape != (n, 2):
+            raise ValueError(f"out must have shape {(n, 2)}, got {out.shape}")
+
+        def kernel(lo: int, hi: int) -> None:
+            phase = self.phase_rad[lo:hi]
+            distance = self.distance_m[lo:hi]
+            scratch = self._scratch[lo:hi]
+            np.cos(phase, out=scratch)
+            np.multiply(distance, scratch, out=out[lo:hi, 0])
+            np.sin(phase, out=scratch)
+            np.multiply(distance, scratch, out=out[lo:hi, 1])
+
+        run_sharded(kernel, n, threads)
+        return out
+
+    def propagate(self, dt_s: float, steps: int) -> np.ndarray:
+        """
+        Step ``steps`` times by ``dt_s``, returning every frame's positions.
+
+        The result has shape ``(steps, N, 2)``; frame ``k`` is the state
+        before step ``k``. Runs in a single native call when the
+        ``solsysgen_native`` extension is built.
+        """
+        return propagate(self.distance_m, self.phase_rad, self.omega_rad_s, dt_s, steps)
+
+    def phases_at(self, times_s: Any, *, threads: Optional[int] = None) -> np.ndarray:
+        """
+        Return phases at time offsets ``times_s`` from now, shape ``(T, N)``.
+
+        Uses the closed form ``phase + 2π t / period_s``. The time is first
+        reduced with ``fmod(t, period_s)``, which is exact in floating point,
+        so only the sub-orbit remainder is multiplied by the angular speed
+        and multi-gigayear offsets keep full phase precision.
+        """
+        t = _times(times_s)
+        phases = np.empty((t.shape[0], len(self)), dtype=np.float64)
+        run_sharded(
+            lambda lo, hi: self._phases_into(t, phases, lo, hi), len(self), threads
+        )
+        return phases
+
+    def _phases_into(self, t: np.ndarray, out: np.ndarray, lo: int, hi: int) -> None:
+        phases = out[:, lo:hi]
+        np.fmod(t[:, None], self.period_s[lo:hi], out=phases)
+        np.multiply(phases, self.omega_rad_s[lo:hi], out=phases)
+        np.add(phases, self.phase_rad[lo:hi], out=phases)
+        np.remainder(phases, TAU, out=phases)
+
+    def positions_at(
+        self, times_s: Any, *, threads: Optional[int] = None
+    ) -> np.ndarray:
+        """Return positions at time offsets ``times_s``, shape ``(T, N, 2)``."""
+        t = _times(times_s)
+        phases = np.empty((t.shape[0], len(self)), dtype=np.float64)
+        out = np.empty(phases.shape + (2,), dtype=np.float64)
+
+        def kernel(lo: int, hi: int) -> None:
+            self._phases_into(t, phases, lo, hi)
+            shard = phases[:, lo:hi]
+            distance = self.distance_m[lo:hi]
+            np.multiply(distance, np.cos(shard), out=out[:, lo:hi, 0])
+            np.multiply(distance, np.sin(shard, out=shard), out=out[:, lo:hi, 1])
+
+        run_sharded(kernel, len(self), threads)
+        return out
+
+    def repack(self, planets: Sequence[Any]) -> None:
+        """
+        Re-pack this object in place to hold ``planets``, in that order.
+
+        Rows of views onto this object are gathered with one take per
+        column; any other planet is packed from its fields. Existing views
+        keep pointing at this object, but their row numbers are stale until
+        the caller renumbers them.
+        """
+        n = len(planets)
+        rows = _view_rows(planets, self)
+        new = np.flatnonzero(rows < 0)
+        fresh = PlanetArrays.from_planets([planets[i] for i in new.tolist()])
+        for f in _FLOAT_FIELDS + ("omega_rad_s",):
+            col = getattr(self, f)[np.maximum(rows, 0)] if len(self) else np.empty(n)
+            col[new] = getattr(fresh, f)
+            setattr(self, f, col)
+        if isinstance(self.names, Categorical):
+            self.names = Categorical.from_values(
+                (p.name for p in planets), self.names.categories
+            )
+        else:
+            self.names = [p.name for p in planets]
+        self.kinds = Categorical.from_values(
+            (p.kind for p in planets), self.kinds.categories
+        )
+        self._scratch = np.empty(n, dtype=np.float64)
+
+    def view(self, index: int) -> "PlanetView":
+        n = len(self)
+        if not -n <= index < n:
+            raise IndexError("planet index out of range")
+        return PlanetView(self, index % n)
+
+    def views(self) -> List["PlanetView"]:
+        return [PlanetView(self, i) for i in range(len(self))]
+
+
+def _times(times_s: Any) -> np.ndarray:
+    t = np.asarray(times_s, dtype=np.float64)
+    if t.ndim != 1:
+        raise ValueError("times_s must be a 1-D sequence of times")
+    return t
+
+
+class PlanetView:
+    """
+    A ``Planet``-compatible view of one row of a :class:`PlanetArrays`.
+
+    Reads and writes go straight to the backing arrays, so a system stepped
+    through its arrays is immediately visible through its views. A view
+    holds only its arrays and row index; ``name`` and ``kind`` resolve
+    through the shared categorical columns.
+    """
+
+    __slots__ = ("_arrays", "_index")
+
+    def __init__(self, arrays: PlanetArrays, index: int) -> None:
+        self._arrays = arrays
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._arrays.names[self._index]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._arrays.names[self._index] = value
+
+    @property
+    def kind(self) -> PlanetType:
+        kinds = self._arrays.kinds
+        return kinds.categories[kinds.codes[self._index]]  # type: ignore[return-value]
+
+    @kind.setter
+    def kind(self, value: PlanetType) -> None:
+        self._arrays.kinds[self._index] = value
+
+    @property
+    def mass_kg(self) -> float:
+        return float(self._arrays.mass_kg[self._index])
+
+    @mass_kg.setter
+    def mass_kg(self, value: float) -> None:
+        self._arrays.mass_kg[self._index] = value
+
+    @property
+    def radius_m(self) -> float:
+        return float(self._arrays.radius_m[self._index])
+
+    @radius_m.setter
+    def radius_m(self, value: float) -> None:
+        self._arrays.radius_m[self._index] = value
+
+    @property
+    def distance_m(self) -> float:
+        return float(self._arrays.distance_m[self._index])
+
+    @distance_m.setter
+    def distance_m(self, value: float) -> None:
+        self._arrays.distance_m[self._index] = value
+
+    @property
+    def phase_rad(self) -> float:
+        return float(self._arrays.phase_rad[self._index])
+
+    @phase_rad.setter
+    def phase_rad(self, value: float) -> None:
+        self._arrays.phase_rad[self._index] = value
+
+    @property
+    def period_s(self) -> float:
+        return float(self._arrays.period_s[self._index])
+
+    @period_s.setter
+    def period_s(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError("period_s must be > 0")
+        self._arrays.period_s[self._index] = value
+        self._arrays.omega_rad_s[self._index] = TAU / value
+
+    @property
+    def orbital_speed_mps(self) -> float:
+        return float(self._arrays.orbital_speed_mps[self._index])
+
+    @orbital_speed_mps.setter
+    def orbital_speed_mps(self, value: float) -> None:
+        self._arrays.orbital_speed_mps[self._index] = value
+
+    def position_m(self) -> Tuple[float, float]:
+        d = self.distance_m
+        phase = self.phase_rad
+        return (d * math.cos(phase), d * math.sin(phase))
+
+    def angular_speed_rad_s(self) -> float:
+        return float(self._arrays.omega_rad_s[self._index])
+
+    def step(self, dt_s: float) -> None:
+        if dt_s < 0:
+            raise ValueError("dt_s must be >= 0")
+        self.phase_rad = (self.phase_rad + self.angular_speed_rad_s() * dt_s) % TAU
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "mass_kg": self.mass_kg,
+            "radius_m": self.radius_m,
+            "distance_m": self.distance_m,
+            "phase_rad": self.phase_rad,
+            "period_s": self.period_s,
+            "orbital_speed_mps": self.orbital_speed_mps,
+        }
+
+    def to_planet(self) -> Planet:
+        """Copy this row out into a standalone ``Planet``."""
+        return Planet.from_dict(self.to_dict())
+
+    def __repr__(self) -> str:
+        return (
+            f"PlanetView(name={self.name!r}, kind={self.kind!r}, "
+            f"distance_m={self.distance_m!r}, phase_rad={self.phase_rad!r})"
+        )
+
+
+def _view_rows(planets: Sequence[Any], arrays: PlanetArrays) -> np.ndarray:
+    """Row of each planet in ``arrays``, or -1 where it is not a view of them."""
+    return np.fromiter(
+        (
+            p._index if isinstance(p, PlanetView) and p._arrays is arrays else -1
+            for p in planets
+        ),
+        np.int64,
+        count=len(planets),
+    )
+
+
+def _column(values: Any, n: int, field: str) -> np.ndarray:
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    if arr.shape != (n,):
+        raise ValueError(f"{field} must have shape {(n,)}, got {arr.shape}")
+    return arr
+
+
+__all__ = ["Categorical", "PackedStrings", "PlanetArrays", "PlanetView"]
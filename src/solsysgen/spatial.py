@@ -0,0 +1,187 @@
+# solsysgen/spatial.py
+"""
+Uniform-grid spatial index over ``(N, 2)`` planet positions.
+
+Bodies are bucketed into square cells and kept sorted by cell key, so the
+bodies in one row of cells are a contiguous run found with a binary search.
+A radius query only looks at the cells overlapping its disc, and a
+k-nearest query grows a disc until it holds ``k`` bodies.
+
+:meth:`GridIndex.update` is incremental: only bodies whose cell changed
+are taken out of the sorted run and re-inserted by binary search, so a
+small step costs a few vectorized passes instead of a full re-sort.
+Nothing happens automatically on ``SolarSystem.step``; call it after
+moving the bodies.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+_ROW_SHIFT = np.int64(1 << 32)
+_COL_OFFSET = np.int64(1 << 31)
+
+
+class GridIndex:
+    """
+    Answer radius and k-nearest queries on a set of 2D positions.
+
+    ``cell_size_m`` defaults to the extent of the positions divided by
+    ``sqrt(N)``, about one body per occupied cell for a uniform spread.
+    Query results are planet indices into the positions array.
+    """
+
+    __slots__ = (
+        "cell_size_m",
+        "positions_m",
+        "order",
+        "keys",
+        "_body_keys",
+        "_cell_lo",
+        "_cell_hi",
+    )
+
+    def __init__(self, positions_m: Any, cell_size_m: Optional[float] = None) -> None:
+        positions_m = np.ascontiguousarray(positions_m, dtype=np.float64)
+        if positions_m.ndim != 2 or positions_m.shape[1] != 2:
+            raise ValueError("positions_m must have shape (N, 2)")
+        if cell_size_m is None:
+            n = max(len(positions_m), 1)
+            extent = float(np.ptp(positions_m, axis=0).max()) if n > 1 else 1.0
+            cell_size_m = max(extent, 1.0) / math.sqrt(n)
+        if not cell_size_m > 0:
+            raise ValueError("cell_size_m must be > 0")
+        self.cell_size_m = float(cell_size_m)
+        self.positions_m = positions_m
+        cells = self._cells(positions_m)
+        # Cell range of the bodies; queries are clamped to it
+        if len(cells):
+            self._cell_lo, self._cell_hi = cells.min(axis=0), cells.max(axis=0)
+        else:
+            self._cell_lo, self._cell_hi = np.ones(2), np.zeros(2)
+        self._body_keys = _key(cells)
+        self.order = np.argsort(self._body_keys, kind="stable")
+        self.keys = self._body_keys[self.order]
+
+    @staticmethod
+    def for_system(system: Any, cell_size_m: Optional[float] = None) -> "GridIndex":
+        """Index the current positions of a ``SolarSystem``."""
+        return GridIndex(system.positions_m(), cell_size_m)
+
+    def __len__(self) -> int:
+        return len(self.positions_m)
+
+    def _cells(self, positions_m: np.ndarray) -> np.ndarray:
+        cells = np.floor(positions_m / self.cell_size_m)
+        if cells.size and np.abs(cells).max() >= _COL_OFFSET:
+            raise ValueError("cell_size_m is too small for these positions")
+        return cells.astype(np.int64)
+
+    def update(self, positions_m: Any, moved: Optional[Any] = None) -> None:
+        """
+        Move the index to new positions of the same bodies (same order).
+
+        Only bodies whose cell changed are re-filed: they are cut out of the
+        sorted keys and re-inserted at positions found by binary search.
+        ``moved`` limits the key computation to those body indices; every
+        other body must keep its position.
+        """
+        positions_m = np.ascontiguousarray(positions_m, dtype=np.float64)
+        if positions_m.shape != self.positions_m.shape:
+            raise ValueError(f"positions_m must have shape {self.positions_m.shape}")
+        if moved is None:
+            moved = np.arange(len(positions_m))
+        else:
+            moved = np.unique(np.arange(len(self))[moved])
+        self.positions_m = positions_m
+        cells = self._cells(positions_m[moved])
+        new_keys = _key(cells)
+        changed = new_keys != self._body_keys[moved]
+        if not changed.any():
+            return
+        movers, new_keys = moved[changed], new_keys[changed]
+        # The envelope only grows, which keeps query clamping correct
+        self._cell_lo = np.minimum(self._cell_lo, cells[changed].min(axis=0))
+        self._cell_hi = np.maximum(self._cell_hi, cells[changed].max(axis=0))
+        self._body_keys[movers] = new_keys
+
+        out = np.zeros(len(self), dtype=bool)
+        out[movers] = True
+        keep = ~out[self.order]
+        order, keys = self.order[keep], self.keys[keep]
+        by_key = np.argsort(new_keys, kind="stable")
+        movers, new_keys = movers[by_key], new_keys[by_key]
+        at = np.searchsorted(keys, new_keys, side="right")
+        self.order = np.insert(order, at, movers)
+        self.keys = np.insert(keys, at, new_keys)
+
+    def _candidates(self, point: np.ndarray, radius_m: float) -> np.ndarray:
+        # Clamp to the occupied cells, so far-away or huge queries never
+        # produce out-of-range keys
+        first = np.floor((point - radius_m) / self.cell_size_m)
+        last = np.floor((point + radius_m) / self.cell_size_m)
+        first = np.maximum(first, self._cell_lo)
+        last = np.minimum(last, self._cell_hi)
+        if np.any(first > last):
+            return np.empty(0, dtype=np.int64)
+        (x0, y0), (x1, y1) = first.astype(np.int64), last.astype(np.int64)
+        rows = np.arange(x0, x1 + 1, dtype=np.int64) * _ROW_SHIFT
+        lo = np.searchsorted(self.keys, rows + (y0 + _COL_OFFSET), side="left")
+        hi = np.searchsorted(self.keys, rows + (y1 + _COL_OFFSET), side="right")
+        if len(lo) == 1:
+            return self.order[lo[0] : hi[0]]
+        return np.concatenate([self.order[a:b] for a, b in zip(lo, hi)])
+
+    def query_radius(self, point_m: Any, radius_m: float) -> np.ndarray:
+        """Indices of bodies within ``radius_m`` of ``point_m``, nearest first."""
+        if radius_m < 0:
+            raise ValueError("radius_m must be >= 0")
+        point = np.asarray(point_m, dtype=np.float64).reshape(2)
+        idx = self._candidates(point, radius_m)
+        d2 = np.square(self.positions_m[idx] - point).sum(axis=1)
+        keep = d2 <= radius_m * radius_m
+        idx, d2 = idx[keep], d2[keep]
+        return idx[np.argsort(d2, kind="stable")]
+
+    def query_knn(self, point_m: Any, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``(indices, distances_m)`` of the ``k`` bodies nearest ``point_m``.
+
+        The search disc starts at one cell and doubles until it contains
+        ``k`` bodies, then is widened once to the k-th distance found so no
+        closer body in a neighbouring cell is missed.
+        """
+        if k < 0:
+            raise ValueError("k must be >= 0")
+        point = np.asarray(point_m, dtype=np.float64).reshape(2)
+        k = min(k, len(self))
+        if k == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        radius = self.cell_size_m
+        while True:
+            idx = self._candidates(point, radius)
+            if len(idx) >= k or len(idx) == len(self):
+                break
+            radius *= 2.0
+        d2 = np.square(self.positions_m[idx] - point).sum(axis=1)
+        kth = math.sqrt(np.partition(d2, k - 1)[k - 1])
+        if kth > radius:
+            idx = self._candidates(point, kth)
+            d2 = np.square(self.positions_m[idx] - point).sum(axis=1)
+        best = np.argsort(d2, kind="stable")[:k]
+        return idx[best], np.sqrt(d2[best])
+
+    def neighbors(self, i: int, radius_m: float) -> np.ndarray:
+        """Indices of other bodies within ``radius_m`` of body ``i``."""
+        found = self.query_radius(self.positions_m[i], radius_m)
+        return found[found != i % len(self)]
+
+
+def _key(cells: np.ndarray) -> np.ndarray:
+    return cells[:, 0] * _ROW_SHIFT + (cells[:, 1] + _COL_OFFSET)
+
+
+__all__ = ["GridIndex"]
@@ -1,10 +1,15 @@
 # solsysgen/system.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
+
+from . import instrument
 from .models import Planet, Sun
+from .soa import PlanetArrays, PlanetView
 
 """
 AI Assistance Notice
@@ -15,20 +20,326 @@ were reviewed and approved by the project author.
 """
 
 
+def _same_planet(entry: Any, planet: Any) -> bool:
+    if entry is planet:
+        return True
+    return (
+        isinstance(entry, PlanetView)
+        and isinstance(planet, PlanetView)
+        and entry._arrays is planet._arrays
+        and entry._index == planet._index
+    )
+
+
 @dataclass(slots=True)
 class SolarSystem:
-    """One Sun + many planets (2D circular orbit model)."""
+    """
+    One Sun + many planets (2D circular orbit model).
+
+    By default every planet is a standalone ``Planet`` and ``step`` loops over
+    them in Python. Calling :meth:`use_arrays` switches the system to the
+    structure-of-arrays engine: planet fields are packed into contiguous NumPy
+    arrays, ``planets`` is replaced by views onto those arrays, and stepping
+    and position evaluation become vectorized.
+
+    The radius methods (:meth:`add_planet`, :meth:`add_planets`,
+    :meth:`remove_planet`, :meth:`planets_between`, :meth:`orbit_taken`)
+    keep ``planets`` sorted by ``distance_m`` alongside a sorted list of
+    radii, so every lookup is a binary search. The index is rebuilt (and
+    ``planets`` sorted) when the list length changes behind its back; call
+    :meth:`reindex` after editing distances in place.
+
+    On the array engine the radius methods touch only ``planets`` and the
+    index, as on the plain engine. The arrays are re-packed in place, once,
+    before the next call that reads them (``step``, ``positions_m``,
+    ``arrays``, ...), so a run of edits costs one ``O(N)`` pass. Views in
+    ``planets`` stay valid throughout; an added ``Planet`` stays in the list
+    until that re-pack replaces it with a view.
+    """
 
     sun: Sun
     planets: List[Planet]
+    _arrays: Optional[PlanetArrays] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _radii: List[float] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _stale: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def use_arrays(self) -> "SolarSystem":
+        """
+        Switch to (or re-pack) the array-backed engine and return ``self``.
+
+        The planet list is re-packed automatically after the radius methods
+        or when its length changes; call this again after reordering
+        ``planets`` in place. Re-packing keeps the same arrays object, so
+        views already handed out stay valid.
+        """
+        if self._arrays is None:
+            self._arrays = PlanetArrays.from_planets(self.planets)
+            self.planets = self._arrays.views()
+        else:
+            self._repack()
+        return self
+
+    @staticmethod
+    def from_arrays(sun: Sun, arrays: PlanetArrays) -> "SolarSystem":
+        """
+        Wrap existing arrays (e.g. shared-memory views) without copying them.
+
+        The arrays must already be sorted by ``distance_m``.
+        """
+        system = SolarSystem(sun=sun, planets=arrays.views())
+        system._arrays = arrays
+        return system
+
+    @property
+    def arrays(self) -> Optional[PlanetArrays]:
+        """The backing arrays, or None when using plain ``Planet`` objects."""
+        return self._synced_arrays()
+
+    def _synced_arrays(self) -> Optional[PlanetArrays]:
+        arrays = self._arrays
+        if arrays is not None and (self._stale or len(arrays) != len(self.planets)):
+            self._repack()
+        return arrays
+
+    def _repack(self) -> None:
+        # Bring the arrays in line with ``planets``, then point each entry at
+        # its new row; planets that are not views of the arrays become views
+        arrays = self._arrays
+        planets = self.planets
+        arrays.repack(planets)
+        for i, p in enumerate(planets):
+            if isinstance(p, PlanetView) and p._arrays is arrays:
+                p._index = i
+            else:
+                planets[i] = PlanetView(arrays, i)
+        self._stale = False
+
+    def reindex(self) -> List[float]:
+        """Sort ``planets`` by orbital radius and rebuild the radius index."""
+        self.planets.sort(key=lambda p: p.distance_m)
+        self._radii = [p.distance_m for p in self.planets]
+        if self._arrays is not None and not self._in_row_order():
+            # Re-pack lazily so the arrays follow the sorted ``planets``
+            self._stale = True
+        return self._radii
+
+    def _in_row_order(self) -> bool:
+        arrays = self._arrays
+        return len(arrays) == len(self.planets) and all(
+            isinstance(p, PlanetView) and p._arrays is arrays and p._index == i
+            for i, p in enumerate(self.planets)
+        )
+
+    def _radius_index(self) -> List[float]:
+        if len(self._radii) != len(self.planets):
+            return self.reindex()
+        return self._radii
+
+    def orbit_taken(self, distance_m: float, tol_m: float = 1e-3) -> bool:
+        """True if a planet orbits within ``tol_m`` of ``distance_m``."""
+        radii = self._radius_index()
+        k = bisect_right(radii, distance_m - tol_m)
+        return k < len(radii) and radii[k] < distance_m + tol_m
+
+    def add_planet(
+        self, planet: Planet, *, allow_overlap: bool = False, tol_m: float = 1e-3
+    ) -> int:
+        """
+        Insert ``planet`` in radius order and return its index.
 
-    def step(self, dt_s: float) -> None:
+        Raises ``ValueError`` if another planet orbits within ``tol_m`` unless
+        ``allow_overlap`` is set; equal radii keep insertion order.
+        """
+        if not allow_overlap and self.orbit_taken(planet.distance_m, tol_m):
+            raise ValueError("A planet with the same orbital distance already exists.")
+        radii = self._radius_index()
+        k = bisect_right(radii, planet.distance_m)
+        radii.insert(k, planet.distance_m)
+        self.planets.insert(k, planet)
+        self._stale = self._arrays is not None
+        return k
+
+    def add_planets(
+        self,
+        planets: Iterable[Planet],
+        *,
+        allow_overlap: bool = False,
+        tol_m: float = 1e-3,
+    ) -> None:
+        """
+        Validate a batch of planets, then merge it in one pass.
+
+        Nothing is added if any planet overlaps an existing orbit or another
+        planet of the batch. The sorted batch is merged with the current list
+        in ``O(N + M)`` instead of ``M`` separate inserts.
+        """
+        batch = sorted(planets, key=lambda p: p.distance_m)
+        radii = self._radius_index()
+        if not allow_overlap:
+            for a, b in zip(batch, batch[1:]):
+                if b.distance_m - a.distance_m < tol_m:
+                    raise ValueError("Planets in the batch share an orbital distance.")
+            for p in batch:
+                if self.orbit_taken(p.distance_m, tol_m):
+                    raise ValueError(
+                        "A planet with the same orbital distance already exists."
+                    )
+        merged: List[Planet] = []
+        old = self.planets
+        i = 0
+        for p in batch:
+            k = bisect_right(radii, p.distance_m, lo=i)
+            merged.extend(old[i:k])
+            merged.append(p)
+            i = k
+        merged.extend(old[i:])
+        old[:] = merged
+        self._radii = [p.distance_m for p in merged]
+        self._stale = self._arrays is not None
+
+    def remove_planet(self, planet: Planet) -> int:
+        """
+        Remove ``planet`` (found by radius, then identity); return its index.
+
+        On the array engine a view also matches the entry viewing the same
+        row. After a re-pack ``planets`` holds a view in place of an added
+        ``Planet``, so remove it through the object now in the list. A
+        removed view is detached onto a copy of its row and keeps its values.
+        """
+        radii = self._radius_index()
+        lo = bisect_left(radii, planet.distance_m)
+        hi = bisect_right(radii, planet.distance_m, lo=lo)
+        for k in range(lo, hi):
+            if _same_planet(self.planets[k], planet):
+                break
+        else:
+            raise ValueError(f"{planet.name!r} is not in this system")
+        del radii[k]
+        removed = self.planets.pop(k)
+        if self._arrays is not None:
+            if isinstance(removed, PlanetView) and removed._arrays is self._arrays:
+                # Its row is dropped by the next re-pack
+                removed._arrays = PlanetArrays.from_planets([removed])
+                removed._index = 0
+            self._stale = True
+        return k
+
+    def planets_between(self, lo_m: float, hi_m: float) -> List[Planet]:
+        """Planets with ``lo_m <= distance_m <= hi_m``, innermost first."""
+        radii = self._radius_index()
+        return self.planets[bisect_left(radii, lo_m) : bisect_right(radii, hi_m)]
+
+    def step(self, dt_s: float, *, threads: Optional[int] = None) -> None:
+        """
+        Advance every planet by ``dt_s`` seconds.
+
+        On the array engine, systems of ``kernels.PARALLEL_MIN_BODIES`` or
+        more bodies are stepped in shards on a thread pool; ``threads``
+        overrides the thread count for this call.
+        """
         if dt_s < 0:
             raise ValueError("dt_s must be >= 0")
+        if instrument.is_enabled():
+            # step is called in tight loops, so keep the disabled path bare
+            instrument.count("solsysgen.planets_stepped", len(self.planets))
+            with instrument.span("solsysgen.SolarSystem.step"):
+                self._step(dt_s, threads)
+            return
+        self._step(dt_s, threads)
+
+    def _step(self, dt_s: float, threads: Optional[int]) -> None:
+        arrays = self._synced_arrays()
+        if arrays is not None:
+            arrays.step(dt_s, threads=threads)
+            return
         for p in self.planets:
             p.step(dt_s)
 
+    @instrument.timed("solsysgen.SolarSystem.propagate")
+    def propagate(self, dt_s: float, steps: int) -> np.ndarray:
+        """
+        Advance the system ``steps`` times by ``dt_s`` and record positions.
+
+        Returns an ``(steps, N, 2)`` array whose frame ``k`` is the state
+        before step ``k``, i.e. the same frames as calling ``positions_m()``
+        then ``step(dt_s)`` in a loop. Plain ``Planet`` lists are packed into
+        arrays for the call and their phases written back afterwards.
+        """
+        instrument.count("solsysgen.planets_stepped", len(self.planets) * steps)
+        arrays = self._synced_arrays()
+        if arrays is not None:
+            return arrays.propagate(dt_s, steps)
+        packed = PlanetArrays.from_planets(self.planets)
+        out = packed.propagate(dt_s, steps)
+        for p, phase in zip(self.planets, packed.phase_rad.tolist()):
+            p.phase_rad = phase
+        return out
+
+    def positions_m(self, *, threads: Optional[int] = None) -> np.ndarray:
+        """
+        Return planet positions as an ``(N, 2)`` array in ``planets`` order.
+
+        On the array engine rows follow the packed arrays, which match
+        ``planets`` unless the list was reordered in place; call
+        :meth:`use_arrays` (or :meth:`reindex`) after reordering it.
+        """
+        arrays = self._synced_arrays()
+        if arrays is not None:
+            return arrays.positions_m(threads=threads)
+        out = np.empty((len(self.planets), 2), dtype=np.float64)
+        for i, p in enumerate(self.planets):
+            out[i] = p.position_m()
+        return out
+
+    def positions_at(
+        self, times_s: Any, *, threads: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Return positions at arbitrary time offsets, shape ``(T, N, 2)``.
+
+        ``times_s`` is a 1-D sequence of offsets in seconds from the current
+        state, in any order and possibly negative. Positions are evaluated in
+        closed form, so the system is not stepped and no drift accumulates.
+        """
+        arrays = self._synced_arrays()
+        if arrays is None:
+            arrays = PlanetArrays.from_planets(self.planets)
+        return arrays.positions_at(times_s, threads=threads)
+
+    def iter_positions(
+        self, dt_s: float, n_steps: int, *, chunk_steps: int = 1024
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield positions for ``n_steps`` frames ``dt_s`` apart, in chunks.
+
+        Each yielded array has shape ``(chunk, N, 2)`` with at most
+        ``chunk_steps`` frames; frame ``k`` is the state after ``k * dt_s``
+        seconds. Frames are evaluated in closed form and the system itself is
+        not advanced, so peak memory depends on ``chunk_steps`` only.
+        """
+        if dt_s < 0:
+            raise ValueError("dt_s must be >= 0")
+        if n_steps < 0:
+            raise ValueError("n_steps must be >= 0")
+        if chunk_steps <= 0:
+            raise ValueError("chunk_steps must be > 0")
+        arrays = self._synced_arrays()
+        if arrays is None:
+            arrays = PlanetArrays.from_planets(self.planets)
+        for start in range(0, n_steps, chunk_steps):
+            stop = min(start + chunk_steps, n_steps)
+            yield arrays.positions_at(np.arange(start, stop) * float(dt_s))
+
     def state_m(self) -> Dict[str, Tuple[float, float]]:
+        """Map each planet name to its position, in the order of ``positions_m``."""
+        arrays = self._synced_arrays()
+        if arrays is not None:
+            positions = arrays.positions_m().tolist()
+            return dict(zip(arrays.names, map(tuple, positions)))
         return {p.name: p.position_m() for p in self.planets}
 
     def __len__(self) -> int:
@@ -0,0 +1,178 @@
+# solsysgen/system_batch.py
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .constants import TAU
+from .kepler import circular_speeds_mps, periods_s
+from .kernels import run_sharded
+from .models import PLANET_KINDS, Sun
+from .soa import Categorical, PlanetArrays
+from .system import SolarSystem
+
+
+class SystemBatch:
+    """
+    Many independent solar systems stepped together.
+
+    The planets of every system are concatenated into one
+    :class:`~solsysgen.soa.PlanetArrays`; the planets of system ``i`` are rows
+    ``offsets[i]:offsets[i + 1]`` and ``system_index`` maps each row back to
+    its system. One :meth:`step` advances all systems with a single
+    vectorized pass, each by its own ``dt``.
+
+    Each system keeps its own ``Sun``. Replacing it with :meth:`set_sun`
+    recomputes that system's periods and orbital speeds from Kepler's laws.
+    """
+
+    __slots__ = ("suns", "offsets", "system_index", "arrays")
+
+    def __init__(
+        self, suns: List[Sun], offsets: np.ndarray, arrays: PlanetArrays
+    ) -> None:
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if offsets.shape != (len(suns) + 1,) or offsets[0] != 0:
+            raise ValueError("offsets must start at 0 and have one entry per sun + 1")
+        counts = np.diff(offsets)
+        if np.any(counts < 0) or offsets[-1] != len(arrays):
+            raise ValueError("offsets must be non-decreasing and end at len(arrays)")
+        self.suns = suns
+        self.offsets = offsets
+        self.system_index = np.repeat(np.arange(len(suns), dtype=np.int64), counts)
+        self.arrays = arrays
+
+    @staticmethod
+    def from_systems(systems: Iterable[SolarSystem]) -> "SystemBatch":
+        """Pack ``SolarSystem`` objects (plain or array-backed) into a batch."""
+        suns: List[Sun] = []
+        planets: List[Any] = []
+        counts: List[int] = []
+        for s in systems:
+            suns.append(s.sun)
+            planets.extend(s.planets)
+            counts.append(len(s.planets))
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return SystemBatch(
+            suns, offsets, PlanetArrays.from_planets(planets, categorical_names=True)
+        )
+
+    @staticmethod
+    def from_catalog(catalog: Any) -> "SystemBatch":
+        """Build a batch from a :class:`~solsysgen.catalog.Catalog` without objects."""
+        names, name_codes = np.unique(catalog.name, return_inverse=True)
+        arrays = PlanetArrays(
+            Categorical(name_codes, names.tolist()),
+            Categorical(catalog.kind.copy(), PLANET_KINDS),
+            mass_kg=catalog.mass_kg.copy(),
+            radius_m=catalog.radius_m.copy(),
+            distance_m=catalog.distance_m.copy(),
+            phase_rad=catalog.phase_rad.copy(),
+            period_s=catalog.period_s.copy(),
+            orbital_speed_mps=catalog.orbital_speed_mps.copy(),
+        )
+        suns = [catalog.sun(i) for i in range(len(catalog))]
+        return SystemBatch(suns, catalog.offsets.copy(), arrays)
+
+    def __len__(self) -> int:
+        return len(self.suns)
+
+    @property
+    def n_planets(self) -> int:
+        return len(self.arrays)
+
+    @property
+    def sun_mass_kg(self) -> np.ndarray:
+        """Per-system central mass, shape ``(M,)``."""
+        return np.array([s.mass_kg for s in self.suns], dtype=np.float64)
+
+    def _rows(self, i: int) -> slice:
+        if not -len(self) <= i < len(self):
+            raise IndexError("system index out of range")
+        i %= len(self)
+        return slice(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def set_sun(self, i: int, sun: Sun) -> None:
+        """
+        Replace the sun of system ``i`` and re-derive its planets' orbits.
+
+        Distances and phases are kept; ``period_s``, ``orbital_speed_mps`` and
+        the cached angular speed follow the new mass.
+        """
+        if sun.mass_kg <= 0:
+            raise ValueError("sun mass_kg must be > 0")
+        rows = self._rows(i)
+        a = self.arrays
+        d = a.distance_m[rows]
+        a.period_s[rows] = periods_s(d, sun.mass_kg)
+        a.orbital_speed_mps[rows] = circular_speeds_mps(d, sun.mass_kg)
+        a.omega_rad_s[rows] = TAU / a.period_s[rows]
+        self.suns[i % len(self)] = sun
+
+    def _planet_dt(self, dt_s: Any) -> Any:
+        dt = np.asarray(dt_s, dtype=np.float64)
+        if dt.ndim == 0:
+            if dt < 0:
+                raise ValueError("dt_s must be >= 0")
+            return float(dt)
+        if dt.shape != (len(self),):
+            raise ValueError(f"dt_s must be a scalar or have shape {(len(self),)}")
+        if np.any(dt < 0):
+            raise ValueError("dt_s must be >= 0")
+        return dt[self.system_index]
+
+    def step(self, dt_s: Any, *, threads: Optional[int] = None) -> None:
+        """
+        Advance every system; ``dt_s`` is a scalar or one value per system.
+
+        Each planet gets exactly the arithmetic of ``SolarSystem.step`` with
+        its own system's ``dt``, so results match stepping the systems one
+        by one.
+        """
+        dt = self._planet_dt(dt_s)
+        if isinstance(dt, float):
+            self.arrays.step(dt, threads=threads)
+            return
+        a = self.arrays
+
+        def kernel(lo: int, hi: int) -> None:
+            phase = a.phase_rad[lo:hi]
+            scratch = a._scratch[lo:hi]
+            np.multiply(a.omega_rad_s[lo:hi], dt[lo:hi], out=scratch)
+            np.add(phase, scratch, out=phase)
+            np.remainder(phase, TAU, out=phase)
+
+        run_sharded(kernel, len(a), threads)
+
+    def positions_m(self, *, threads: Optional[int] = None) -> np.ndarray:
+        """Return the positions of all planets as one ``(N, 2)`` array."""
+        return self.arrays.positions_m(threads=threads)
+
+    def split(self, values: np.ndarray) -> List[np.ndarray]:
+        """Split a per-planet array (e.g. positions) into per-system views."""
+        values = np.asarray(values)
+        if values.shape[:1] != (self.n_planets,):
+            raise ValueError(f"values must have {self.n_planets} rows")
+        return [values[lo:hi] for lo, hi in zip(self.offsets[:-1], self.offsets[1:])]
+
+    def system_positions_m(self) -> List[np.ndarray]:
+        """Return ``(N_i, 2)`` position views, one per system, over one buffer."""
+        return self.split(self.positions_m())
+
+    def system(self, i: int) -> SolarSystem:
+        """Copy system ``i`` out as a standalone ``SolarSystem``."""
+        rows = self._rows(i)
+        planets = [
+            self.arrays.view(k).to_planet() for k in range(rows.start, rows.stop)
+        ]
+        return SolarSystem(sun=self.suns[i % len(self)], planets=planets)
+
+    def systems(self, indices: Optional[Sequence[int]] = None) -> List[SolarSystem]:
+        if indices is None:
+            indices = range(len(self))
+        return [self.system(i) for i in indices]
+
+
+__all__ = ["SystemBatch"]
@@ -4,9 +4,48 @@ waterio: simple checkpoint I/O helpers for NumPy arrays.
 Public API:
     save_checkpoint(path, **arrays)
     load_checkpoint(path) -> dict[str, np.ndarray]
+    open_checkpoint(path) -> Checkpoint (lazy, memory-mapped when uncompressed)
+    FrameWriter(path), save_frames(path, chunks)
+    append_frames(path, frames), load_frames(path, start, stop)
+    CheckpointWriter() -> background, atomic save_checkpoint
+
+Names are imported on first access, so ``import waterio`` does not load
+NumPy until one of them is used.
 """
 
-from ._core import Counter
-from .iodata import load_checkpoint, save_checkpoint
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+_EXPORTS: Dict[str, str] = {
+    "save_checkpoint": "iodata",
+    "load_checkpoint": "iodata",
+    "open_checkpoint": "iodata",
+    "Checkpoint": "iodata",
+    "FrameWriter": "stream",
+    "save_frames": "stream",
+    "append_frames": "stream",
+    "load_frames": "stream",
+    "CheckpointWriter": "writer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .iodata import Checkpoint, load_checkpoint, open_checkpoint, save_checkpoint
+    from .stream import FrameWriter, append_frames, load_frames, save_frames
+    from .writer import CheckpointWriter
 
-__all__ = ["save_checkpoint", "load_checkpoint", "Counter"]
+__all__ = list(_EXPORTS)
@@ -1,3 +1,14 @@
+# cython: boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Compiled hot loops for :mod:`waterio.codec`.
+
+Every function here has a pure-NumPy twin in :mod:`waterio.codec` that
+produces identical output. The loops release the GIL.
+"""
+
+from libc.stdint cimport uint8_t, uint64_t
+
+
 def checksum(int[:] arr) -> int:
     """
     Compute the checksum (sum of elements) of a 1D integer array.
@@ -20,3 +31,141 @@ def checksum(int[:] arr) -> int:
 
     return s
 
+
+def pack_columns(const double[:, ::1] columns, double[:, ::1] out) -> None:
+    """
+    Interleave ``(K, N)`` column arrays into a row-major ``(N, K)`` table.
+
+    Parameters
+    ----------
+    columns : const double[:, ::1]
+        One row per field, one column per planet.
+    out : double[:, ::1]
+        Destination buffer with one row per planet.
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t k = columns.shape[0]
+    cdef Py_ssize_t n = columns.shape[1]
+    if out.shape[0] != n or out.shape[1] != k:
+        raise ValueError("out must have shape (N, K)")
+    with nogil:
+        for i in range(n):
+            for j in range(k):
+                out[i, j] = columns[j, i]
+
+
+def unpack_columns(const double[:, ::1] table, double[:, ::1] out) -> None:
+    """
+    Split a row-major ``(N, K)`` table back into ``(K, N)`` columns.
+
+    Parameters
+    ----------
+    table : const double[:, ::1]
+        One row per planet.
+    out : double[:, ::1]
+        Destination buffer with one row per field.
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n = table.shape[0]
+    cdef Py_ssize_t k = table.shape[1]
+    if out.shape[0] != k or out.shape[1] != n:
+        raise ValueError("out must have shape (K, N)")
+    with nogil:
+        for j in range(k):
+            for i in range(n):
+                out[j, i] = table[i, j]
+
+
+def delta_encode(const uint64_t[:, ::1] frames, uint64_t[:, ::1] out) -> None:
+    """
+    XOR each frame with the previous one, bit pattern by bit pattern.
+
+    Parameters
+    ----------
+    frames : const uint64_t[:, ::1]
+        ``(T, M)`` float64 frames viewed as unsigned 64-bit integers.
+    out : uint64_t[:, ::1]
+        Destination of the same shape; ``out[0]`` is ``frames[0]``.
+    """
+    cdef Py_ssize_t t, i
+    cdef Py_ssize_t n_t = frames.shape[0]
+    cdef Py_ssize_t m = frames.shape[1]
+    if out.shape[0] != n_t or out.shape[1] != m:
+        raise ValueError("out must have the same shape as frames")
+    with nogil:
+        if n_t > 0:
+            for i in range(m):
+                out[0, i] = frames[0, i]
+        for t in range(1, n_t):
+            for i in range(m):
+                out[t, i] = frames[t, i] ^ frames[t - 1, i]
+
+
+def delta_decode(uint64_t[:, ::1] data) -> None:
+    """
+    Undo :func:`delta_encode` in place.
+
+    Parameters
+    ----------
+    data : uint64_t[:, ::1]
+        ``(T, M)`` delta-encoded frames; overwritten with the originals.
+    """
+    cdef Py_ssize_t t, i
+    cdef Py_ssize_t n_t = data.shape[0]
+    cdef Py_ssize_t m = data.shape[1]
+    with nogil:
+        for t in range(1, n_t):
+            for i in range(m):
+                data[t, i] = data[t, i] ^ data[t - 1, i]
+
+
+def shuffle(const uint8_t[::1] src, uint8_t[::1] dst, Py_ssize_t itemsize) -> None:
+    """
+    Group byte ``b`` of every item together (byte-plane transpose).
+
+    Parameters
+    ----------
+    src : const uint8_t[::1]
+        Raw bytes of ``n`` items of ``itemsize`` bytes each.
+    dst : uint8_t[::1]
+        Destination; ``dst[b * n + i] = src[i * itemsize + b]``.
+    itemsize : Py_ssize_t
+        Size of one item in bytes.
+    """
+    cdef Py_ssize_t i, b
+    cdef Py_ssize_t n
+    if itemsize <= 0 or src.shape[0] % itemsize:
+        raise ValueError("buffer length must be a multiple of itemsize")
+    if dst.shape[0] != src.shape[0]:
+        raise ValueError("src and dst must have the same length")
+    n = src.shape[0] // itemsize
+    with nogil:
+        for b in range(itemsize):
+            for i in range(n):
+                dst[b * n + i] = src[i * itemsize + b]
+
+
+def unshuffle(const uint8_t[::1] src, uint8_t[::1] dst, Py_ssize_t itemsize) -> None:
+    """
+    Undo :func:`shuffle`.
+
+    Parameters
+    ----------
+    src : const uint8_t[::1]
+        Byte-plane ordered buffer.
+    dst : uint8_t[::1]
+        Destination; ``dst[i * itemsize + b] = src[b * n + i]``.
+    itemsize : Py_ssize_t
+        Size of one item in bytes.
+    """
+    cdef Py_ssize_t i, b
+    cdef Py_ssize_t n
+    if itemsize <= 0 or src.shape[0] % itemsize:
+        raise ValueError("buffer length must be a multiple of itemsize")
+    if dst.shape[0] != src.shape[0]:
+        raise ValueError("src and dst must have the same length")
+    n = src.shape[0] // itemsize
+    with nogil:
+        for i in range(n):
+            for b in range(itemsize):
+                dst[i * itemsize + b] = src[b * n + i]
@@ -0,0 +1,33 @@
+"""
+Instrumentation hooks used by waterio.
+
+When solsysgen is installed, checkpoint timings and byte counts are
+recorded in :mod:`solsysgen.instrument`, next to the metrics of the run
+that wrote them. waterio does not depend on solsysgen: without it every
+hook below is a no-op.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+try:
+    from solsysgen.instrument import count, gauge, is_enabled, timed
+except ImportError:
+
+    def is_enabled() -> bool:
+        return False
+
+    def timed(name: str) -> Callable[[F], F]:
+        return lambda fn: fn
+
+    def count(name: str, value: float = 1) -> None:
+        pass
+
+    def gauge(name: str, value: float) -> None:
+        pass
+
+
+__all__ = ["count", "gauge", "is_enabled", "timed"]
@@ -0,0 +1,191 @@
+"""
+NPZ writers used by :func:`waterio.save_checkpoint`.
+
+``write_npz`` covers the single-threaded modes through :mod:`zipfile`.
+``write_npz_parallel`` splits each ``.npy`` member into fixed-size blocks and
+deflates them on a thread pool (zlib releases the GIL). Every block except
+the last ends with a full flush, so the concatenated blocks form one
+ordinary deflate stream and the archive reads back with ``np.load``.
+"""
+
+from __future__ import annotations
+
+import io
+import struct
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_ZIP64_LIMIT = 0xFFFFFFFF
+_VERSION_ZIP64 = 45
+
+_LOCAL = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL = struct.Struct("<IHHHHHHIIIHHHHHII")
+_ZIP64_END = struct.Struct("<IQHHIIQQQQ")
+_ZIP64_LOCATOR = struct.Struct("<IIQI")
+_END = struct.Struct("<IHHHHIIH")
+
+
+def write_npz(
+    fp: BinaryIO,
+    arrays: Dict[str, np.ndarray],
+    compress_type: int,
+    compresslevel: Optional[int] = None,
+) -> None:
+    """Write ``arrays`` as ``.npy`` members the same way ``np.savez`` does."""
+    with zipfile.ZipFile(
+        fp, mode="w", compression=compress_type, compresslevel=compresslevel
+    ) as zf:
+        for key, arr in arrays.items():
+            with zf.open(key + ".npy", "w", force_zip64=True) as member:
+                np.lib.format.write_array(member, arr, allow_pickle=False)
+
+
+def _npy_parts(arr: np.ndarray) -> Tuple[bytes, memoryview]:
+    header = io.BytesIO()
+    d = np.lib.format.header_data_from_array_1_0(arr)
+    try:
+        np.lib.format.write_array_header_1_0(header, d)
+    except ValueError:
+        header = io.BytesIO()
+        np.lib.format.write_array_header_2_0(header, d)
+    if d["fortran_order"]:
+        arr = arr.T
+    data = memoryview(np.ascontiguousarray(arr).reshape(-1).view(np.uint8))
+    return header.getvalue(), data
+
+
+def _deflate_block(args: Tuple[memoryview, int, bool]) -> bytes:
+    block, level, last = args
+    c = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return c.compress(block) + c.flush(zlib.Z_FINISH if last else zlib.Z_FULL_FLUSH)
+
+
+def _dos_datetime() -> Tuple[int, int]:
+    t = time.localtime()
+    dos_date = (t.tm_year - 1980) << 9 | t.tm_mon << 5 | t.tm_mday
+    dos_time = t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2
+    return dos_time, dos_date
+
+
+def write_npz_parallel(
+    fp: BinaryIO,
+    arrays: Dict[str, np.ndarray],
+    *,
+    level: int,
+    chunk_bytes: int,
+    workers: Optional[int] = None,
+) -> None:
+    """Write ``arrays`` to ``fp`` with block-parallel deflate compression."""
+    dos_time, dos_date = _dos_datetime()
+    entries: List[Tuple[bytes, int, int, int, int]] = []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for key, arr in arrays.items():
+            name = (key + ".npy").encode("utf-8")
+            header, data = _npy_parts(arr)
+            blocks = [memoryview(header)] + [
+                data[i : i + chunk_bytes] for i in range(0, len(data), chunk_bytes)
+            ]
+            jobs = [(b, level, i == len(blocks) - 1) for i, b in enumerate(blocks)]
+
+            offset = fp.tell()
+            extra = struct.pack("<HHQQ", 1, 16, 0, 0)
+            fp.write(
+                _LOCAL.pack(
+                    0x04034B50,
+                    _VERSION_ZIP64,
+                    0,
+                    zipfile.ZIP_DEFLATED,
+                    dos_time,
+                    dos_date,
+                    0,
+                    _ZIP64_LIMIT,
+                    _ZIP64_LIMIT,
+                    len(name),
+                    len(extra),
+                )
+            )
+            fp.write(name)
+            fp.write(extra)
+
+            crc = 0
+            size = 0
+            csize = 0
+            compressed = pool.map(_deflate_block, jobs)
+            for block in blocks:
+                crc = zlib.crc32(block, crc)
+                size += len(block)
+            for out in compressed:
+                fp.write(out)
+                csize += len(out)
+
+            end = fp.tell()
+            fp.seek(offset + 14)
+            fp.write(struct.pack("<I", crc))
+            fp.seek(offset + _LOCAL.size + len(name) + 4)
+            fp.write(struct.pack("<QQ", size, csize))
+            fp.seek(end)
+            entries.append((name, crc, size, csize, offset))
+
+    cd_offset = fp.tell()
+    for name, crc, size, csize, offset in entries:
+        extra = struct.pack("<HHQQQ", 1, 24, size, csize, offset)
+        fp.write(
+            _CENTRAL.pack(
+                0x02014B50,
+                _VERSION_ZIP64,
+                _VERSION_ZIP64,
+                0,
+                zipfile.ZIP_DEFLATED,
+                dos_time,
+                dos_date,
+                crc,
+                _ZIP64_LIMIT,
+                _ZIP64_LIMIT,
+                len(name),
+                len(extra),
+                0,
+                0,
+                0,
+                0,
+                _ZIP64_LIMIT,
+            )
+        )
+        fp.write(name)
+        fp.write(extra)
+    cd_size = fp.tell() - cd_offset
+
+    zip64_end = fp.tell()
+    n = len(entries)
+    fp.write(
+        _ZIP64_END.pack(
+            0x06064B50,
+            _ZIP64_END.size - 12,
+            _VERSION_ZIP64,
+            _VERSION_ZIP64,
+            0,
+            0,
+            n,
+            n,
+            cd_size,
+            cd_offset,
+        )
+    )
+    fp.write(_ZIP64_LOCATOR.pack(0x07064B50, 0, zip64_end, 1))
+    fp.write(
+        _END.pack(
+            0x06054B50,
+            0,
+            0,
+            min(n, 0xFFFF),
+            min(n, 0xFFFF),
+            min(cd_size, _ZIP64_LIMIT),
+            min(cd_offset, _ZIP64_LIMIT),
+            0,
+        )
+    )
@@ -0,0 +1,169 @@
+"""
+Frame and table codecs for checkpoint data.
+
+Position frames change slowly from one step to the next, so XOR-ing each
+frame's float64 bit patterns with the previous frame leaves mostly zero
+high bytes, and grouping bytes by significance (shuffling) turns those
+into long runs that zlib compresses well. Both steps are exact bit
+operations, so decoding restores the input bit for bit.
+
+The loops run in the compiled :mod:`waterio._fast` extension when it is
+built and in the NumPy twins below otherwise; both give identical output.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Sequence, Union
+
+import numpy as np
+
+try:
+    from . import _fast
+except ImportError:  # extension not built; use the NumPy twins
+    _fast = None
+
+HAVE_FAST = _fast is not None
+
+_FRAMES_MAGIC = b"WIOF"
+_FRAMES_HEADER = struct.Struct("<4sBB2x")
+
+
+# Pure NumPy twins of the waterio._fast kernels (same signatures)
+
+
+def _pack_columns_py(columns: np.ndarray, out: np.ndarray) -> None:
+    if out.shape != columns.shape[::-1]:
+        raise ValueError("out must have shape (N, K)")
+    out[...] = columns.T
+
+
+def _unpack_columns_py(table: np.ndarray, out: np.ndarray) -> None:
+    if out.shape != table.shape[::-1]:
+        raise ValueError("out must have shape (K, N)")
+    out[...] = table.T
+
+
+def _delta_encode_py(frames: np.ndarray, out: np.ndarray) -> None:
+    if out.shape != frames.shape:
+        raise ValueError("out must have the same shape as frames")
+    out[:1] = frames[:1]
+    np.bitwise_xor(frames[1:], frames[:-1], out=out[1:])
+
+
+def _delta_decode_py(data: np.ndarray) -> None:
+    np.bitwise_xor.accumulate(data, axis=0, out=data)
+
+
+def _shuffle_py(src: np.ndarray, dst: np.ndarray, itemsize: int) -> None:
+    if itemsize <= 0 or src.shape[0] % itemsize:
+        raise ValueError("buffer length must be a multiple of itemsize")
+    if dst.shape[0] != src.shape[0]:
+        raise ValueError("src and dst must have the same length")
+    dst[:] = src.reshape(-1, itemsize).T.ravel()
+
+
+def _unshuffle_py(src: np.ndarray, dst: np.ndarray, itemsize: int) -> None:
+    if itemsize <= 0 or src.shape[0] % itemsize:
+        raise ValueError("buffer length must be a multiple of itemsize")
+    if dst.shape[0] != src.shape[0]:
+        raise ValueError("src and dst must have the same length")
+    dst[:] = src.reshape(itemsize, -1).T.ravel()
+
+
+if _fast is not None:
+    _pack_columns = _fast.pack_columns
+    _unpack_columns = _fast.unpack_columns
+    _delta_encode = _fast.delta_encode
+    _delta_decode = _fast.delta_decode
+    _shuffle = _fast.shuffle
+    _unshuffle = _fast.unshuffle
+else:
+    _pack_columns = _pack_columns_py
+    _unpack_columns = _unpack_columns_py
+    _delta_encode = _delta_encode_py
+    _delta_decode = _delta_decode_py
+    _shuffle = _shuffle_py
+    _unshuffle = _unshuffle_py
+
+
+def pack_columns(columns: Union[np.ndarray, Sequence[np.ndarray]]) -> np.ndarray:
+    """
+    Pack ``K`` equal-length float64 columns into one row-major ``(N, K)`` table.
+
+    Useful for writing a planet table (mass, radius, distance, ...) as a
+    single contiguous buffer with one record per planet.
+    """
+    cols = np.ascontiguousarray(np.asarray(columns, dtype=np.float64))
+    if cols.ndim != 2:
+        raise ValueError("columns must be K equal-length 1-D arrays")
+    out = np.empty(cols.shape[::-1], dtype=np.float64)
+    _pack_columns(cols, out)
+    return out
+
+
+def unpack_columns(table: np.ndarray) -> np.ndarray:
+    """Split an ``(N, K)`` table from :func:`pack_columns` into ``(K, N)`` columns."""
+    table = np.ascontiguousarray(table, dtype=np.float64)
+    if table.ndim != 2:
+        raise ValueError("table must be 2-D")
+    out = np.empty(table.shape[::-1], dtype=np.float64)
+    _unpack_columns(table, out)
+    return out
+
+
+def encode_frames(frames: np.ndarray) -> np.ndarray:
+    """
+    Delta- and shuffle-encode float64 frames ``(T, ...)`` into a uint8 buffer.
+
+    The buffer carries the frame shape, so :func:`decode_frames` needs no
+    other input. It is the same size as the input plus a small header and
+    is meant to be compressed afterwards, e.g. by ``save_checkpoint``.
+    """
+    frames = np.ascontiguousarray(frames)
+    if frames.dtype != np.float64:
+        raise TypeError(f"frames must be float64, got {frames.dtype}")
+    if frames.ndim < 1 or frames.ndim > 255:
+        raise ValueError("frames must have a leading time axis")
+    bits = frames.view(np.uint64).reshape(frames.shape[0], -1 if frames.size else 0)
+    delta = np.empty_like(bits)
+    _delta_encode(bits, delta)
+
+    header = _FRAMES_HEADER.pack(_FRAMES_MAGIC, 1, frames.ndim)
+    header += struct.pack(f"<{frames.ndim}q", *frames.shape)
+    out = np.empty(len(header) + delta.nbytes, dtype=np.uint8)
+    out[: len(header)] = np.frombuffer(header, dtype=np.uint8)
+    _shuffle(delta.reshape(-1).view(np.uint8), out[len(header) :], 8)
+    return out
+
+
+def decode_frames(encoded: np.ndarray) -> np.ndarray:
+    """Invert :func:`encode_frames`, returning the original float64 frames."""
+    buf = np.ascontiguousarray(encoded, dtype=np.uint8).reshape(-1)
+    if buf.shape[0] < _FRAMES_HEADER.size:
+        raise ValueError("Frame buffer is shorter than its header")
+    magic, version, ndim = _FRAMES_HEADER.unpack_from(buf)
+    if magic != _FRAMES_MAGIC or version != 1:
+        raise ValueError("Not a waterio frame buffer")
+    start = _FRAMES_HEADER.size + 8 * ndim
+    if buf.shape[0] < start:
+        raise ValueError("Frame buffer is shorter than its header")
+    shape = struct.unpack_from(f"<{ndim}q", buf, _FRAMES_HEADER.size)
+    n = int(np.prod(shape))
+    if buf.shape[0] - start != 8 * n:
+        raise ValueError("Frame buffer is truncated or corrupt")
+
+    out = np.empty(n, dtype=np.float64)
+    _unshuffle(buf[start:], out.view(np.uint8), 8)
+    bits = out.view(np.uint64).reshape(shape[0], -1 if n else 0)
+    _delta_decode(bits)
+    return out.reshape(shape)
+
+
+__all__ = [
+    "HAVE_FAST",
+    "pack_columns",
+    "unpack_columns",
+    "encode_frames",
+    "decode_frames",
+]
@@ -1,24 +1,103 @@
 from __future__ import annotations
 
+import os
+import secrets
+import struct
+import zipfile
+import zlib
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, Optional, Tuple
 
 import numpy as np
 
+from . import _instrument as instrument
+from ._zip import write_npz, write_npz_parallel
 
-def save_checkpoint(path: str | Path, **arrays: np.ndarray) -> None:
-    """Save one or more NumPy arrays to a compressed NPZ checkpoint."""
+COMPRESSION_MODES = ("default", "fast", "none", "chunked")
+
+# Block size for compression="chunked"
+CHUNK_BYTES = 4 * 1024 * 1024
+
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Local file header: signature ... file name length, extra field length
+_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+
+
+@instrument.timed("waterio.save_checkpoint")
+def save_checkpoint(
+    path: str | Path, *, compression: str = "default", **arrays: np.ndarray
+) -> None:
+    """
+    Save one or more NumPy arrays to an NPZ checkpoint.
+
+    ``compression`` selects how members are stored:
+
+    - ``"default"``: zlib at its default level, like ``np.savez_compressed``.
+    - ``"fast"``: zlib level 1; much faster, usually a slightly larger file.
+    - ``"none"``: stored uncompressed, so :func:`open_checkpoint` can
+      memory-map the arrays.
+    - ``"chunked"``: zlib at its default level, compressing fixed-size
+      blocks of each array in parallel threads.
+
+    All modes produce standard NPZ files that :func:`load_checkpoint` reads.
+    The file is written under a temporary name and renamed into place, so a
+    crash mid-write leaves any previous checkpoint at ``path`` intact.
+    As with ``np.savez``, ``.npz`` is appended to ``path`` if missing.
+    Because ``compression`` is a keyword, it cannot be used as an array name.
+    """
     path = Path(path)
     if not arrays:
         raise ValueError("Provide at least one array as a keyword argument.")
+    if compression not in COMPRESSION_MODES:
+        raise ValueError(
+            f"compression must be one of {COMPRESSION_MODES}, got {compression!r}"
+        )
     for k, v in arrays.items():
         if not isinstance(v, np.ndarray):
             raise TypeError(
                 f"Value for key '{k}' must be a NumPy ndarray, got {type(v)}"
             )
-    np.savez_compressed(path, **arrays)
+        if v.dtype.hasobject:
+            raise TypeError(f"Value for key '{k}' has an object dtype")
+    if not path.name.endswith(".npz"):
+        path = path.with_name(path.name + ".npz")
 
+    # Write to a temporary file next to the target and rename it into place,
+    # so an interrupted save never replaces the previous checkpoint.
+    tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            if compression == "chunked":
+                write_npz_parallel(
+                    fp,
+                    arrays,
+                    level=zlib.Z_DEFAULT_COMPRESSION,
+                    chunk_bytes=CHUNK_BYTES,
+                )
+            elif compression == "none":
+                write_npz(fp, arrays, zipfile.ZIP_STORED)
+            elif compression == "fast":
+                write_npz(fp, arrays, zipfile.ZIP_DEFLATED, compresslevel=1)
+            else:
+                write_npz(fp, arrays, zipfile.ZIP_DEFLATED)
+            fp.flush()
+            os.fsync(fp.fileno())
+            written = fp.tell()
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if instrument.is_enabled():
+        raw = sum(v.nbytes for v in arrays.values())
+        instrument.count("waterio.bytes_raw", raw)
+        instrument.count("waterio.bytes_written", written)
+        instrument.gauge("waterio.compression_ratio", raw / written)
 
+
+@instrument.timed("waterio.load_checkpoint")
 def load_checkpoint(path: str | Path) -> Dict[str, np.ndarray]:
     """
     Load arrays from a compressed NPZ
@@ -28,4 +107,131 @@ def load_checkpoint(path: str | Path) -> Dict[str, np.ndarray]:
     if not path.exists():
         raise FileNotFoundError(path)
     with np.load(path, allow_pickle=False) as data:
-        return {key: data[key] for key in data.files}
+        out = {key: data[key] for key in data.files}
+    instrument.count("waterio.bytes_read", path.stat().st_size)
+    return out
+
+
+def _read_npy_header(fp) -> Tuple[Tuple[int, ...], bool, np.dtype]:
+    version = np.lib.format.read_magic(fp)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(fp)
+    return np.lib.format.read_array_header_2_0(fp)
+
+
+class Checkpoint(Mapping):
+    """
+    Lazy, read-only view of an NPZ checkpoint.
+
+    Nothing is read until a key is accessed. Arrays stored uncompressed are
+    returned as read-only ``np.memmap`` objects mapped straight from the
+    file; compressed arrays are decompressed one key at a time. Use
+    :meth:`read` to fetch a range along the first axis: for compressed
+    arrays this stops decompressing at the end of the range instead of
+    inflating the whole member.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(self.path)
+        self._zip = zipfile.ZipFile(self.path)
+        self._members = {
+            info.filename[: -len(".npy")]: info
+            for info in self._zip.infolist()
+            if info.filename.endswith(".npy")
+        }
+        self._headers: Dict[str, Tuple[Tuple[int, ...], bool, np.dtype, int]] = {}
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        info = self._info(key)
+        shape, fortran, dtype, offset = self._header(key)
+        if info.compress_type == zipfile.ZIP_STORED:
+            if not np.prod(shape):
+                return np.empty(shape, dtype=dtype, order="F" if fortran else "C")
+            return np.memmap(
+                self.path,
+                dtype=dtype,
+                mode="r",
+                offset=offset,
+                shape=shape,
+                order="F" if fortran else "C",
+            )
+        with self._zip.open(info) as fp:
+            return np.lib.format.read_array(fp, allow_pickle=False)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def shape(self, key: str) -> Tuple[int, ...]:
+        """Shape of ``key`` without reading its data."""
+        return self._header(key)[0]
+
+    def dtype(self, key: str) -> np.dtype:
+        """Dtype of ``key`` without reading its data."""
+        return self._header(key)[2]
+
+    def read(
+        self, key: str, start: Optional[int] = None, stop: Optional[int] = None
+    ) -> np.ndarray:
+        """Return ``self[key][start:stop]``, reading only that range if possible."""
+        info = self._info(key)
+        shape, fortran, dtype, _ = self._header(key)
+        if info.compress_type == zipfile.ZIP_STORED or fortran or not shape:
+            return self[key][start:stop]
+
+        lo, hi, _ = slice(start, stop).indices(shape[0])
+        hi = max(lo, hi)
+        row_bytes = dtype.itemsize * int(np.prod(shape[1:]))
+        with self._zip.open(info) as fp:
+            _read_npy_header(fp)
+            fp.seek(lo * row_bytes, 1)
+            buf = fp.read((hi - lo) * row_bytes)
+        return np.frombuffer(buf, dtype=dtype).reshape((hi - lo,) + shape[1:])
+
+    def _info(self, key: str) -> zipfile.ZipInfo:
+        try:
+            return self._members[key]
+        except KeyError:
+            raise KeyError(f"{key} is not a key in {self.path}") from None
+
+    def _header(self, key: str) -> Tuple[Tuple[int, ...], bool, np.dtype, int]:
+        if key not in self._headers:
+            info = self._info(key)
+            if info.compress_type == zipfile.ZIP_STORED:
+                with self.path.open("rb") as fp:
+                    fp.seek(info.header_offset)
+                    local = _LOCAL_HEADER.unpack(fp.read(_LOCAL_HEADER.size))
+                    fp.seek(local[-2] + local[-1], 1)
+                    shape, fortran, dtype = _read_npy_header(fp)
+                    offset = fp.tell()
+            else:
+                with self._zip.open(info) as fp:
+                    shape, fortran, dtype = _read_npy_header(fp)
+                    offset = -1
+            if dtype.hasobject:
+                raise ValueError(f"Object arrays are not supported (key {key!r})")
+            self._headers[key] = (shape, fortran, dtype, offset)
+        return self._headers[key]
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def open_checkpoint(path: str | Path) -> Checkpoint:
+    """
+    Open an NPZ checkpoint lazily for per-key and sliced access.
+
+    Memory-mapped arrays returned by the handle stay valid after it is
+    closed.
+    """
+    return Checkpoint(path)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+_MAGIC = b"\x93NUMPY\x01\x00"
+_MAX_FRAMES = 2**63 - 1
+
+
+def _header_dict(dtype: np.dtype, shape: Tuple[int, ...]) -> str:
+    descr = np.lib.format.dtype_to_descr(dtype)
+    return f"{{'descr': {descr!r}, 'fortran_order': False, 'shape': {shape!r}, }}"
+
+
+class FrameWriter:
+    """
+    Stream ``(T, *frame_shape)`` chunks into a growable ``.npy`` file.
+
+    The NPY header is written with room for any frame count and rewritten
+    after every chunk, so the file on disk is always a valid array holding
+    the frames written so far and can be opened with
+    ``np.load(path, mmap_mode="r")`` at any time. Only the chunk being
+    written is held in memory.
+
+    ``frame_shape`` and ``dtype`` are taken from the first chunk when not
+    given up front.
+
+    With ``append=True`` an existing file is extended in place: new frames
+    are written after the last committed frame and only the header is
+    rewritten, so each append costs O(chunk) regardless of file size. The
+    header's frame count is the commit point; bytes left past it by an
+    interrupted append are discarded on the next open. Files written by
+    ``np.save`` (NumPy >= 1.23 reserves header space for this) can be
+    appended to as well.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        frame_shape: Optional[Tuple[int, ...]] = None,
+        dtype: Optional[np.dtype] = None,
+        append: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.frame_shape = None if frame_shape is None else tuple(frame_shape)
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.n_frames = 0
+        self._header_len = 0
+        if append and self.path.exists():
+            self._fp = self.path.open("r+b")
+            try:
+                self._open_existing()
+            except BaseException:
+                self._fp.close()
+                raise
+            return
+        self._fp = self.path.open("wb")
+        if self.frame_shape is not None and self.dtype is not None:
+            self._write_header()
+
+    def _open_existing(self) -> None:
+        version = np.lib.format.read_magic(self._fp)
+        if version != (1, 0):
+            raise ValueError(f"Cannot append to NPY format version {version}")
+        shape, fortran, dtype = np.lib.format.read_array_header_1_0(self._fp)
+        if fortran or not shape:
+            raise ValueError("Can only append to C-ordered arrays with a time axis")
+        if self.frame_shape is not None and self.frame_shape != shape[1:]:
+            raise ValueError(
+                f"Expected frames of shape {self.frame_shape}, file has {shape[1:]}"
+            )
+        if self.dtype is not None and self.dtype != dtype:
+            raise ValueError(f"Expected dtype {self.dtype}, file has {dtype}")
+        self.frame_shape = shape[1:]
+        self.dtype = dtype
+        self.n_frames = shape[0]
+        self._header_len = self._fp.tell()
+
+        longest = _header_dict(dtype, (_MAX_FRAMES,) + self.frame_shape)
+        if len(_MAGIC) + 2 + len(longest) + 1 > self._header_len:
+            raise ValueError(f"{self.path} has no room in its header to grow")
+
+        frame_bytes = dtype.itemsize * int(np.prod(self.frame_shape))
+        self._fp.seek(self._header_len + self.n_frames * frame_bytes)
+        self._fp.truncate()
+
+    def _write_header(self) -> None:
+        if not self._header_len:
+            longest = _header_dict(self.dtype, (_MAX_FRAMES,) + self.frame_shape)
+            self._header_len = -(-(len(_MAGIC) + 2 + len(longest) + 1) // 64) * 64
+        text = _header_dict(self.dtype, (self.n_frames,) + self.frame_shape)
+        text = text.ljust(self._header_len - len(_MAGIC) - 2 - 1) + "\n"
+        pos = self._fp.tell()
+        self._fp.seek(0)
+        self._fp.write(_MAGIC)
+        self._fp.write(len(text).to_bytes(2, "little"))
+        self._fp.write(text.encode("latin1"))
+        self._fp.seek(max(pos, self._header_len))
+
+    def write(self, frames: np.ndarray) -> None:
+        """Append a ``(T, *frame_shape)`` chunk of frames."""
+        if self._fp.closed:
+            raise ValueError("FrameWriter is closed")
+        frames = np.asarray(frames)
+        if frames.ndim < 1:
+            raise ValueError("frames must have a leading time axis")
+        if self.frame_shape is None:
+            self.frame_shape = frames.shape[1:]
+        if self.dtype is None:
+            self.dtype = frames.dtype
+        if frames.shape[1:] != self.frame_shape:
+            raise ValueError(
+                f"Expected frames of shape {self.frame_shape}, got {frames.shape[1:]}"
+            )
+        frames = np.ascontiguousarray(frames, dtype=self.dtype)
+        if not self._header_len:
+            self._write_header()
+        self._fp.write(memoryview(frames).cast("B"))
+        self.n_frames += frames.shape[0]
+        self._write_header()
+
+    def close(self) -> None:
+        if self._fp.closed:
+            return
+        if not self._header_len:
+            self.frame_shape = self.frame_shape or ()
+            self.dtype = self.dtype or np.dtype(np.float64)
+            self._write_header()
+        self._fp.close()
+
+    def __enter__(self) -> "FrameWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def save_frames(path: str | Path, chunks: Iterable[np.ndarray]) -> int:
+    """
+    Write every chunk from ``chunks`` to a ``.npy`` file as it arrives.
+
+    Returns the total number of frames written. Pair with
+    ``SolarSystem.iter_positions`` to record long runs in bounded memory.
+    """
+    with FrameWriter(path) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return writer.n_frames
+
+
+def append_frames(path: str | Path, frames: np.ndarray) -> int:
+    """
+    Append a ``(T, *frame_shape)`` block to ``path``, creating it if needed.
+
+    Returns the total number of frames in the file afterwards.
+    """
+    with FrameWriter(path, append=True) as writer:
+        writer.write(frames)
+    return writer.n_frames
+
+
+def load_frames(
+    path: str | Path, start: Optional[int] = None, stop: Optional[int] = None
+) -> np.ndarray:
+    """
+    Return frames ``start:stop`` of a frame file as a read-only memmap.
+
+    Only the requested range is paged in from disk, so the cost is
+    proportional to the range, not to the file.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(path)
+    return np.load(path, mmap_mode="r")[start:stop]
+
+
+__all__ = ["FrameWriter", "save_frames", "append_frames", "load_frames"]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from . import _instrument as instrument
+from .iodata import COMPRESSION_MODES, save_checkpoint
+
+_STOP = object()
+
+
+def _is_frozen(arr: np.ndarray) -> bool:
+    """True if neither ``arr`` nor the memory under it can change."""
+    root = arr
+    while isinstance(root, np.ndarray):
+        if root.flags.writeable:
+            return False
+        root = root.base
+    if isinstance(root, memoryview):
+        root = root.obj
+    # Any other owner (mmap, bytearray, shared memory) may still be written
+    # through another handle or process
+    return root is None or isinstance(root, bytes)
+
+
+def snapshot(arr: np.ndarray) -> np.ndarray:
+    """
+    Return ``arr`` if it can no longer change, otherwise a copy of it.
+
+    Only read-only arrays over memory nothing else can write are shared
+    without copying: arrays that own their data and were frozen with
+    ``arr.flags.writeable = False`` (and read-only views of them), and
+    arrays over ``bytes``. Read-only views of a memmap, bytearray or shared
+    memory are copied, since the memory itself may still change.
+    """
+    return arr if _is_frozen(arr) else arr.copy()
+
+
+class CheckpointWriter:
+    """
+    Write checkpoints on a background thread.
+
+    :meth:`submit` snapshots the arrays and returns as soon as the job is
+    queued; compression and disk I/O run on a worker thread through
+    :func:`save_checkpoint`, which writes to a temporary file and renames it
+    into place. At most ``max_pending`` jobs wait in the queue: once it is
+    full, ``submit`` blocks (or raises ``queue.Full`` with ``block=False``),
+    so a slow disk throttles the producer instead of piling up snapshots.
+
+    An exception raised while writing is re-raised by the next call to
+    ``submit``, ``flush`` or ``close``; every failure so far is also listed
+    in :attr:`errors`.
+    """
+
+    def __init__(self, *, max_pending: int = 2, compression: str = "default") -> None:
+        if max_pending <= 0:
+            raise ValueError("max_pending must be > 0")
+        if compression not in COMPRESSION_MODES:
+            raise ValueError(
+                f"compression must be one of {COMPRESSION_MODES}, got {compression!r}"
+            )
+        self.compression = compression
+        self.errors: List[Tuple[Path, BaseException]] = []
+        self._unreported: List[BaseException] = []
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="waterio-checkpoint-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is _STOP:
+                    return
+                path, arrays = job
+                try:
+                    save_checkpoint(path, compression=self.compression, **arrays)
+                except BaseException as exc:
+                    with self._lock:
+                        self.errors.append((path, exc))
+                        self._unreported.append(exc)
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending(self) -> None:
+        with self._lock:
+            if not self._unreported:
+                return
+            exc = self._unreported[0]
+            self._unreported.clear()
+        raise exc
+
+    def submit(
+        self,
+        path: str | Path,
+        *,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        **arrays: np.ndarray,
+    ) -> None:
+        """Snapshot ``arrays`` and queue them to be saved at ``path``."""
+        if self._closed:
+            raise ValueError("CheckpointWriter is closed")
+        self._raise_pending()
+        if not arrays:
+            raise ValueError("Provide at least one array as a keyword argument.")
+        for k, v in arrays.items():
+            if not isinstance(v, np.ndarray):
+                raise TypeError(
+                    f"Value for key '{k}' must be a NumPy ndarray, got {type(v)}"
+                )
+        frozen: Dict[str, np.ndarray] = {k: snapshot(v) for k, v in arrays.items()}
+        self._queue.put((Path(path), frozen), block=block, timeout=timeout)
+        instrument.count("waterio.writer.jobs")
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or being written."""
+        return self._queue.unfinished_tasks
+
+    def flush(self) -> None:
+        """Wait until every submitted checkpoint has been written."""
+        self._queue.join()
+        self._raise_pending()
+
+    def close(self) -> None:
+        """Flush, then stop the worker thread."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_pending()
+
+    def __enter__(self) -> "CheckpointWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+__all__ = ["CheckpointWriter", "snapshot"]
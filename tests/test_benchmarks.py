@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[1] / "benchmarks" / "run_benchmarks.py"
+
+
+def _load():
+    spec = importlib.util.spec_from_file_location("run_benchmarks", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_suite_reports_and_detects_regressions(tmp_path):
+    bench = _load()
+    out = tmp_path / "bench.json"
+    assert (
+        bench.main(["--quick", "--repeat", "1", "--select", "[100]", "--out", str(out)])
+        == 0
+    )
+
+    current = bench.run_suite(quick=True, repeat=1, select="generate_planets[100]")
+    result = current["results"]["generate_planets[100]"]
+    assert result["wall_s"] > 0 and result["peak_bytes"] > 0
+    assert result["unit"] == "planets/s"
+
+    slower = {"results": {"generate_planets[100]": dict(result)}}
+    slower["results"]["generate_planets[100]"]["throughput"] *= 2
+    assert bench.compare(current, slower, 0.2) == ["generate_planets[100]"]
+    assert bench.compare(current, current, 0.2) == []
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from solsysgen import (
+    Catalog,
+    SolarSystem,
+    Sun,
+    generate_catalog,
+    generate_planets,
+    system_seed,
+)
+
+
+def _assert_catalogs_equal(a: Catalog, b: Catalog) -> None:
+    for field in Catalog.__dataclass_fields__:
+        assert np.array_equal(getattr(a, field), getattr(b, field)), field
+
+
+def test_generate_catalog_independent_of_worker_count():
+    sun = Sun()
+    serial = generate_catalog(sun, 9, 4, root_seed=11, workers=1, block_systems=2)
+    pooled = generate_catalog(sun, 9, 4, root_seed=11, workers=3, block_systems=4)
+    windowed = generate_catalog(sun, 9, 4, root_seed=11, workers=2, block_systems=1)
+
+    assert len(serial) == 9
+    assert serial.n_planets == 36
+    _assert_catalogs_equal(serial, pooled)
+    # 9 blocks through a window of 4 in-flight blocks
+    _assert_catalogs_equal(serial, windowed)
+
+
+def test_catalog_system_matches_generate_planets():
+    sun = Sun()
+    catalog = generate_catalog(sun, 5, 6, root_seed=2, workers=1)
+    planets = generate_planets(sun, 6, seed=system_seed(2, 3))
+
+    system = catalog.system(3)
+    assert system.sun == sun
+    assert [p.to_dict() for p in system.planets] == [p.to_dict() for p in planets]
+
+
+def test_catalog_from_systems_roundtrip():
+    sun = Sun(name="Star", mass_kg=2.0e30, radius_m=7.0e8, luminosity_w=1.0e26)
+    systems = [
+        SolarSystem(sun=sun, planets=generate_planets(sun, n, seed=n))
+        for n in (3, 0, 5)
+    ]
+    catalog = Catalog.from_systems(systems)
+
+    assert list(catalog.offsets) == [0, 3, 3, 8]
+    for original, loaded in zip(systems, catalog.systems()):
+        assert loaded.to_dict() == original.to_dict()
+
+
+def test_generate_catalog_rejects_bad_args():
+    with pytest.raises(ValueError):
+        generate_catalog(Sun(), -1, 3, root_seed=0)
+    with pytest.raises(ValueError):
+        generate_catalog(Sun(), 3, 3, root_seed=0, block_systems=0)
+    with pytest.raises(ValueError):
+        generate_catalog(Sun(), 3, 3, root_seed=0, workers=0)
+
+
+def test_save_and_load_catalog_roundtrip(tmp_path):
+    from solsysgen import load_catalog, save_catalog
+    from solsysgen.io import save_json
+
+    sun = Sun()
+    catalog = generate_catalog(sun, 20, 8, root_seed=5, workers=1)
+    path = tmp_path / "catalog.npz"
+    save_catalog(path, catalog)
+
+    _assert_catalogs_equal(load_catalog(path), catalog)
+
+    json_bytes = 0
+    for i, system in enumerate(catalog.systems()):
+        save_json(tmp_path / f"{i}.json", system)
+        json_bytes += (tmp_path / f"{i}.json").stat().st_size
+    assert path.stat().st_size < json_bytes
+
+
+def test_load_catalog_remaps_kind_vocabulary(tmp_path):
+    from solsysgen import load_catalog, save_catalog
+
+    catalog = generate_catalog(Sun(), 3, 6, root_seed=1, workers=1)
+    path = tmp_path / "catalog.npz"
+    save_catalog(path, catalog)
+
+    with np.load(path) as data:
+        arrays = dict(data)
+    arrays["kinds"] = arrays["kinds"][::-1]
+    arrays["kind"] = (3 - arrays["kind"]).astype(np.int8)
+    np.savez(path, **arrays)
+
+    assert np.array_equal(load_catalog(path).kind, catalog.kind)
+
+
+def test_save_and_load_catalog_without_suffix(tmp_path):
+    from solsysgen import load_catalog, save_catalog
+
+    catalog = generate_catalog(Sun(), 4, 3, root_seed=9, workers=1)
+    save_catalog(tmp_path / "cat", catalog)
+
+    assert (tmp_path / "cat.npz").exists()
+    _assert_catalogs_equal(load_catalog(tmp_path / "cat"), catalog)
+    _assert_catalogs_equal(load_catalog(str(tmp_path / "cat.npz")), catalog)
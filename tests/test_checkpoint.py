@@ -71,3 +71,55 @@ def test_roundtrip_multiple_types_integration(tmp_path: Path) -> None:
     assert out["x"].dtype == np.float32
     assert np.allclose(out["x"], x)
     assert np.array_equal(out["y"], y)
+
+
+@pytest.mark.parametrize("compression", ["default", "fast", "none", "chunked"])
+def test_compression_modes_roundtrip(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, compression: str
+) -> None:
+    """
+    Test that every compression mode is readable by load_checkpoint.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    monkeypatch : pytest.MonkeyPatch
+        Used to shrink the chunk size so several blocks are written.
+    compression : str
+        Compression mode under test.
+    """
+    import zipfile
+
+    import waterio.iodata
+
+    monkeypatch.setattr(waterio.iodata, "CHUNK_BYTES", 1000)
+    p: Path = tmp_path / "ckpt.npz"
+    rng: np.random.Generator = np.random.default_rng(2)
+    x: NDArray[np.float64] = np.cumsum(rng.normal(size=(300, 7)), axis=0)
+    y: NDArray[np.int32] = np.asfortranarray(
+        np.arange(12, dtype=np.int32).reshape(3, 4)
+    )
+    z: NDArray[np.float64] = np.empty((0, 2))
+
+    save_checkpoint(p, compression=compression, x=x, y=y, z=z)
+    out: Dict[str, NDArray] = load_checkpoint(p)
+
+    with zipfile.ZipFile(p) as zf:
+        assert zf.testzip() is None
+    assert np.array_equal(out["x"], x)
+    assert np.array_equal(out["y"], y)
+    assert out["z"].shape == (0, 2)
+
+
+def test_save_rejects_unknown_compression(tmp_path: Path) -> None:
+    """
+    Test that an unknown compression mode raises ValueError.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    with pytest.raises(ValueError):
+        save_checkpoint(tmp_path / "ckpt.npz", compression="lzma", a=np.arange(3))
@@ -0,0 +1,106 @@
+"""
+Tests for the waterio frame and table codecs.
+
+These tests verify that encoded frames and packed tables round-trip
+exactly, and that the compiled ``waterio._fast`` kernels (when built)
+match their pure-NumPy twins bit for bit.
+"""
+
+import zlib
+
+import numpy as np
+import pytest
+
+from solsysgen import SolarSystem, Sun, generate_planets
+from solsysgen.constants import DAY_S
+from waterio import codec
+
+
+def _frames() -> np.ndarray:
+    sun = Sun()
+    system = SolarSystem(sun=sun, planets=generate_planets(sun, 30, seed=6))
+    return system.positions_at(np.arange(200) * DAY_S)
+
+
+def test_encode_frames_roundtrip_and_compresses_better() -> None:
+    """
+    Test that frames decode bit for bit and compress smaller once encoded.
+    """
+    frames = _frames()
+    encoded = codec.encode_frames(frames)
+    decoded = codec.decode_frames(encoded)
+
+    assert decoded.shape == frames.shape
+    assert np.array_equal(decoded.view(np.uint64), frames.view(np.uint64))
+    assert len(zlib.compress(encoded.tobytes())) < len(zlib.compress(frames.tobytes()))
+
+    empty = np.empty((0, 4, 2))
+    assert codec.decode_frames(codec.encode_frames(empty)).shape == (0, 4, 2)
+    with pytest.raises(ValueError):
+        codec.decode_frames(encoded[:-8])
+
+
+def test_pack_columns_roundtrip() -> None:
+    """
+    Test that packing columns gives one row per planet and unpacks exactly.
+    """
+    rng = np.random.default_rng(0)
+    columns = [rng.normal(size=9) for _ in range(6)]
+    table = codec.pack_columns(columns)
+
+    assert table.shape == (9, 6)
+    assert np.array_equal(table[:, 2], columns[2])
+    assert np.array_equal(codec.unpack_columns(table), np.stack(columns))
+
+
+def test_fast_kernels_match_python_twins() -> None:
+    """
+    Test each compiled kernel against its NumPy twin.
+    """
+    fast = pytest.importorskip("waterio._fast")
+    rng = np.random.default_rng(1)
+
+    cols = rng.normal(size=(5, 17))
+    a, b = np.empty((17, 5)), np.empty((17, 5))
+    fast.pack_columns(cols, a)
+    codec._pack_columns_py(cols, b)
+    assert np.array_equal(a, b)
+
+    c, d = np.empty((5, 17)), np.empty((5, 17))
+    fast.unpack_columns(a, c)
+    codec._unpack_columns_py(a, d)
+    assert np.array_equal(c, d)
+
+    bits = rng.normal(size=(12, 8)).view(np.uint64)
+    e, f = np.empty_like(bits), np.empty_like(bits)
+    fast.delta_encode(bits, e)
+    codec._delta_encode_py(bits, f)
+    assert np.array_equal(e, f)
+    fast.delta_decode(e)
+    codec._delta_decode_py(f)
+    assert np.array_equal(e, bits) and np.array_equal(f, bits)
+
+    raw = rng.integers(0, 256, size=96, dtype=np.uint8)
+    g, h = np.empty_like(raw), np.empty_like(raw)
+    fast.shuffle(raw, g, 8)
+    codec._shuffle_py(raw, h, 8)
+    assert np.array_equal(g, h)
+    fast.unshuffle(g, h, 8)
+    assert np.array_equal(h, raw)
+
+
+@pytest.mark.parametrize("kernels", ["numpy", "fast"])
+def test_decode_frames_rejects_short_buffers(kernels, monkeypatch) -> None:
+    """
+    Test that buffers cut inside the header raise ValueError with either
+    set of kernels.
+    """
+    if kernels == "fast":
+        pytest.importorskip("waterio._fast")
+    else:
+        monkeypatch.setattr(codec, "_unshuffle", codec._unshuffle_py)
+        monkeypatch.setattr(codec, "_delta_decode", codec._delta_decode_py)
+    encoded = codec.encode_frames(_frames()[:3])
+    for cut in (0, 3, 8, 12):
+        with pytest.raises(ValueError):
+            codec.decode_frames(encoded[:cut])
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from solsysgen import Planet, SolarSystem, Sun, generate_planets
+from solsysgen.constants import AU_M, DAY_S, YEAR_S
+from solsysgen.events import (
+    count_events,
+    find_events,
+    find_transits,
+    separation_intervals,
+)
+from solsysgen.kepler import orbit
+
+
+def _system() -> SolarSystem:
+    sun = Sun()
+    return SolarSystem(sun=sun, planets=generate_planets(sun, 5, seed=21))
+
+
+def _separation(system: SolarSystem, t: np.ndarray, i, j) -> np.ndarray:
+    phases = system.use_arrays().arrays.phases_at(np.atleast_1d(t))
+    diff = phases[np.arange(len(phases)), i] - phases[np.arange(len(phases)), j]
+    return np.abs(np.remainder(diff + math.pi, 2 * math.pi) - math.pi)
+
+
+def test_conjunctions_match_brute_force_scan():
+    system = _system()
+    events = find_events(system, 0.0, 30 * YEAR_S)
+
+    assert len(events) > 0
+    assert np.all(np.diff(events.time_s) >= 0)
+    assert np.all(_separation(system, events.time_s, events.i, events.j) < 1e-9)
+
+    # Count wraps of the phase difference through 0 on a fine grid
+    times = np.linspace(0.0, 30 * YEAR_S, int(30 * YEAR_S / (DAY_S / 4)))
+    phases = system.arrays.phases_at(times)
+    expected = 0
+    for i, j in zip(*np.triu_indices(5, k=1)):
+        diff = np.remainder(phases[:, i] - phases[:, j], 2 * math.pi)
+        expected += np.count_nonzero(np.abs(np.diff(diff)) > math.pi)
+    assert len(events) == expected
+
+
+def test_oppositions_and_syzygies():
+    system = _system()
+    opp = find_events(system, 0.0, 10 * YEAR_S, kind="opposition")
+    con = find_events(system, 0.0, 10 * YEAR_S, kind="conjunction")
+    syz = find_events(system, 0.0, 10 * YEAR_S, kind="syzygy")
+
+    sep = _separation(system, opp.time_s, opp.i, opp.j)
+    assert np.allclose(sep, math.pi, atol=1e-9)
+    assert len(syz) == len(opp) + len(con)
+    with pytest.raises(ValueError):
+        find_events(system, 0.0, YEAR_S, kind="transit")
+
+
+def test_long_span_event_count_is_analytic():
+    system = _system()
+    arrays = system.use_arrays().arrays
+    span = 1e6 * float(arrays.period_s[4])
+    events = find_events(system, 0.0, span, pairs=[(3, 4)])
+    synodic = 2 * math.pi / abs(arrays.omega_rad_s[3] - arrays.omega_rad_s[4])
+    assert abs(len(events) - span / synodic) <= 1
+    assert count_events(system, 0.0, span, pairs=[(3, 4)]).tolist() == [len(events)]
+    assert np.all(_separation(system, events.time_s[-3:], 3, 4) < 1e-6)
+
+
+def test_separation_intervals():
+    system = _system()
+    theta = 0.2
+    found = separation_intervals(system, theta, 0.0, 20 * YEAR_S)
+    con = find_events(system, 0.0, 20 * YEAR_S)
+
+    assert len(found) >= len(con)
+    assert np.all(found.stop_s > found.start_s)
+    mid = (found.start_s + found.stop_s) / 2
+    assert np.all(_separation(system, mid, found.i, found.j) <= theta + 1e-9)
+    inner = (found.start_s > 0) & (found.stop_s < 20 * YEAR_S)
+    edges = _separation(system, found.start_s[inner], found.i[inner], found.j[inner])
+    assert np.allclose(edges, theta, atol=1e-9)
+
+
+def test_indices_follow_planets_order_after_reordering_views():
+    packed = _system().use_arrays()
+    packed.planets.reverse()
+    plain = SolarSystem(sun=packed.sun, planets=[p.to_planet() for p in packed.planets])
+    for kind in ("conjunction", "opposition"):
+        got = find_events(packed, 0.0, 5 * YEAR_S, kind=kind)
+        want = find_events(plain, 0.0, 5 * YEAR_S, kind=kind)
+        assert np.array_equal(got.i, want.i) and np.array_equal(got.j, want.j)
+        assert np.array_equal(got.time_s, want.time_s)
+    found = separation_intervals(packed, 0.1, 0.0, 5 * YEAR_S, pairs=[(0, 4)])
+    assert np.all(_separation(plain, found.start_s + 1.0, 0, 4) < 0.1)
+
+
+def _planet(name: str, distance_au: float, radius_m: float, phase: float) -> Planet:
+    T, v = orbit(distance_au * AU_M, Sun().mass_kg)
+    return Planet(name, "rocky", 5.97e24, radius_m, distance_au * AU_M, phase, T, v)
+
+
+def test_transits_match_line_of_sight_geometry():
+    sun = Sun()
+    outer = _planet("Outer", 1.0, 6.4e6, 0.0)
+    inner = _planet("Inner", 0.4, 2.4e6, 1.0)
+    system = SolarSystem(sun=sun, planets=[outer, inner])
+    span = 10 * YEAR_S
+    transits = find_transits(system, 0.0, span)
+
+    # planet 1 (inner) crosses the Sun as seen from planet 0, once per synodic period
+    assert len(transits) == len(find_events(system, 0.0, span))
+    assert set(transits.i.tolist()) == {1} and set(transits.j.tolist()) == {0}
+
+    def offset(t: np.ndarray) -> np.ndarray:
+        # Distance of the inner planet from the observer-Sun line, in units of
+        # the allowed reach; < 1 means in transit
+        phases = system.use_arrays().arrays.phases_at(t)
+        theta = phases[:, 1] - phases[:, 0]
+        reach = sun.radius_m * 0.6 + inner.radius_m
+        near = np.cos(theta) > 0
+        return np.where(near, np.abs(np.sin(theta)) * 0.4 * AU_M / reach, np.inf)
+
+    mid = (transits.start_s + transits.stop_s) / 2
+    assert np.all(offset(mid) < 1)
+    inside = (transits.start_s > 0) & (transits.stop_s < span)
+    assert np.allclose(offset(transits.start_s[inside]), 1.0, atol=1e-6)
+    assert np.all(offset(transits.stop_s[inside] + 60.0) > 1)
@@ -44,3 +44,39 @@ def test_add_custom_planet_increases_count():
     n0 = len(system.planets)
     add_custom_planet(system, name="X", kind="rocky", distance_au=1.5, phase_deg=0.0)
     assert len(system.planets) == n0 + 1
+
+
+def test_generate_planet_batch_shapes_and_reproducible():
+    from solsysgen import generate_planet_batch
+    from solsysgen.generation import _pick_kind, _snowline_au
+    from solsysgen.kepler import period_s
+    from solsysgen.models import PLANET_KINDS
+
+    sun = Sun()
+    batch = generate_planet_batch(sun, 50, 12, seed=3, inner_au=0.5, outer_au=20.0)
+    again = generate_planet_batch(sun, 50, 12, seed=3, inner_au=0.5, outer_au=20.0)
+
+    assert batch.distance_m.shape == (50, 12)
+    assert (batch.distance_m == again.distance_m).all()
+    assert (batch.distance_m[:, 1:] >= batch.distance_m[:, :-1]).all()
+
+    snow = _snowline_au(sun.luminosity_w)
+    planets = batch.planets(7)
+    assert len(planets) == 12
+    assert sorted(p.name for p in planets) == sorted(
+        f"Planet {i}" for i in range(1, 13)
+    )
+    for p, code in zip(planets, batch.kind[7].tolist()):
+        assert p.kind == PLANET_KINDS[code]
+        assert p.kind == _pick_kind(p.distance_m / AU_M, snow)
+        assert p.period_s == pytest.approx(period_s(p.distance_m, sun.mass_kg))
+
+
+def test_generate_planet_batch_rejects_bad_args():
+    from solsysgen import generate_planet_batch
+
+    with pytest.raises(ValueError):
+        generate_planet_batch(Sun(), -1, 3)
+
+    with pytest.raises(ValueError):
+        generate_planet_batch(Sun(), 3, 3, inner_au=10.0, outer_au=1.0)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from solsysgen import SolarSystem, Sun, generate_planets, instrument
+from solsysgen.io import load_json, save_json
+from waterio import load_checkpoint, save_checkpoint
+
+
+@pytest.fixture
+def recording():
+    instrument.reset()
+    instrument.enable()
+    yield instrument
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled_records_nothing():
+    instrument.reset()
+    assert not instrument.is_enabled()
+    sun = Sun()
+    system = SolarSystem(sun=sun, planets=generate_planets(sun, 4, seed=1))
+    system.step(10.0)
+    with instrument.span("manual"):
+        pass
+    assert instrument.snapshot() == {"spans": {}, "counters": {}, "gauges": {}}
+
+
+def test_entry_points_are_instrumented(recording, tmp_path):
+    sun = Sun()
+    system = SolarSystem(sun=sun, planets=generate_planets(sun, 6, seed=1))
+    for _ in range(3):
+        system.step(10.0)
+    system.use_arrays().propagate(10.0, 4)
+    save_json(tmp_path / "s.json", system)
+    load_json(tmp_path / "s.json")
+    save_checkpoint(tmp_path / "c.npz", x=np.zeros(10000))
+    load_checkpoint(tmp_path / "c.npz")
+    with instrument.span("manual"):
+        pass
+
+    snap = instrument.snapshot()
+    spans = snap["spans"]
+    assert spans["solsysgen.SolarSystem.step"]["count"] == 3
+    for name in (
+        "solsysgen.generate_planets",
+        "solsysgen.SolarSystem.propagate",
+        "solsysgen.io.save_json",
+        "solsysgen.io.load_json",
+        "waterio.save_checkpoint",
+        "waterio.load_checkpoint",
+        "manual",
+    ):
+        assert spans[name]["count"] == 1, name
+        assert spans[name]["total_s"] >= 0
+
+    counters = snap["counters"]
+    assert counters["solsysgen.planets_generated"] == 6
+    assert counters["solsysgen.planets_stepped"] == 3 * 6 + 4 * 6
+    assert (
+        counters["solsysgen.io.bytes_written"] == (tmp_path / "s.json").stat().st_size
+    )
+    assert counters["waterio.bytes_raw"] == 80000
+    assert counters["waterio.bytes_written"] == (tmp_path / "c.npz").stat().st_size
+    assert snap["gauges"]["waterio.compression_ratio"] > 1
+
+    instrument.export_json(tmp_path / "metrics.json", extra={"run": "test"})
+    exported = json.loads((tmp_path / "metrics.json").read_text())
+    assert exported["counters"] == counters
+    assert exported["meta"] == {"run": "test"}
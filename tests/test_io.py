@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from solsysgen import SolarSystem, Sun, generate_catalog, generate_planets
+from solsysgen import io as sio
+
+
+def _system(n: int = 7) -> SolarSystem:
+    sun = Sun()
+    return SolarSystem(sun=sun, planets=generate_planets(sun, n, seed=5))
+
+
+@pytest.fixture(params=["default", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(sio, "orjson", None)
+    return request.param
+
+
+def test_compact_and_pretty_roundtrip(backend, tmp_path):
+    system = _system()
+    compact = sio.to_json(system, indent=None)
+    assert "\n" not in compact
+    assert json.loads(compact) == json.loads(sio.to_json(system))
+
+    for indent in (None, 2):
+        path = tmp_path / f"s{indent}.json"
+        sio.save_json(path, system, indent=indent)
+        assert sio.load_json(path) == system
+
+
+def test_streaming_writer_matches_compact(backend, tmp_path, monkeypatch):
+    monkeypatch.setattr(sio, "_CHUNK_PLANETS", 3)
+    for system in (_system(), _system(0), _system(9).use_arrays()):
+        path = tmp_path / "s.json"
+        with path.open("wb") as fp:
+            sio.write_json(fp, system)
+        assert path.read_text("utf-8") == sio.to_json(system, indent=None)
+
+
+def test_streaming_writer_follows_reordered_planets(backend, tmp_path):
+    system = _system(9).use_arrays()
+    system.planets.reverse()
+    path = tmp_path / "s.json"
+    with path.open("wb") as fp:
+        sio.write_json(fp, system)
+    assert path.read_text("utf-8") == sio.to_json(system, indent=None)
+    assert sio.load_json(path).planets[0].name == system.planets[0].name
+
+
+def test_ndjson_streams_catalog(backend, tmp_path):
+    catalog = generate_catalog(Sun(), 5, 4, root_seed=1, workers=1)
+    path = tmp_path / "catalog.ndjson"
+    assert sio.save_ndjson(path, catalog.systems()) == 5
+    assert len(path.read_bytes().splitlines()) == 5
+
+    loaded = sio.iter_ndjson(path)
+    assert next(loaded) == catalog.system(0)
+    assert list(loaded) == list(catalog.systems())[1:]
+
+
+def test_pretty_output_is_stdlib_json(backend):
+    system = _system()
+    system.planets[0].mass_kg = 1e16
+    assert sio.to_json(system) == json.dumps(system.to_dict(), indent=2)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from solsysgen import Sun, generate_planets, kepler
+from solsysgen.constants import AU_M
+
+
+@pytest.fixture
+def cache():
+    c = kepler.enable_cache(maxsize=3)
+    yield c
+    kepler.disable_cache()
+
+
+def test_array_versions_match_scalar():
+    d = np.array([0.4, 1.0, 5.2, 30.0]) * AU_M
+    m = Sun().mass_kg
+    T = kepler.periods_s(d, m)
+    v = kepler.circular_speeds_mps(d, m)
+    assert T.tolist() == [kepler.period_s(x, m) for x in d.tolist()]
+    assert v.tolist() == [kepler.circular_speed_mps(x, m) for x in d.tolist()]
+    assert kepler.orbit(AU_M, m) == (kepler.period_s(AU_M, m), v[1])
+
+    # masses broadcast against distances
+    both = kepler.periods_s(d[:, None], np.array([m, 2 * m]))
+    assert both.shape == (4, 2)
+    assert both[2, 1] == pytest.approx(kepler.period_s(d[2], 2 * m))
+
+
+def test_array_versions_validate():
+    with pytest.raises(ValueError):
+        kepler.periods_s([AU_M, 0.0], 1e30)
+    with pytest.raises(ValueError):
+        kepler.circular_speeds_mps([AU_M], [-1.0])
+
+
+def test_cache_hits_misses_and_lru_eviction(cache):
+    m = 2e30
+    assert kepler.cache_info() == (0, 0, 0, 0, 3)
+    first = kepler.orbit(1e11, m)
+    assert kepler.period_s(1e11, m) == first[0]
+    assert kepler.circular_speed_mps(1e11, m) == first[1]
+    assert cache.info()[:2] == (2, 1)
+
+    kepler.orbit(2e11, m)
+    kepler.orbit(3e11, m)
+    kepler.orbit(1e11, m)  # refresh: 2e11 is now least recently used
+    kepler.orbit(4e11, m)
+    info = cache.info()
+    assert info.evictions == 1 and info.size == 3
+    kepler.orbit(2e11, m)
+    assert cache.info().misses == info.misses + 1
+
+    with pytest.raises(ValueError):
+        kepler.orbit(-1.0, m)
+    assert cache.info().size == 3
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0, 3)
+
+
+def test_cached_generation_is_identical(cache):
+    plain = generate_planets(Sun(), 20, seed=5)
+    kepler.disable_cache()
+    cache = kepler.enable_cache()
+    assert generate_planets(Sun(), 20, seed=5) == plain
+    assert generate_planets(Sun(), 20, seed=5) == plain
+    assert cache.info().hits == 20
+    assert kepler.cache_info() is not None
+    kepler.disable_cache()
+    assert kepler.cache_info() is None
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from solsysgen import SolarSystem, Sun, generate_planets
+from solsysgen.constants import DAY_S, YEAR_S
+from solsysgen.kernels import (
+    PARALLEL_MIN_BODIES,
+    _executor,
+    _propagate_numpy,
+    get_threads,
+    propagate,
+    set_threads,
+    shards,
+)
+
+
+def _system() -> SolarSystem:
+    sun = Sun()
+    return SolarSystem(sun=sun, planets=generate_planets(sun, 7, seed=12))
+
+
+def test_propagate_matches_step_loop():
+    stepped = _system()
+    frames = []
+    for _ in range(15):
+        frames.append(stepped.positions_m())
+        stepped.step(2.5 * DAY_S)
+
+    for system in (_system(), _system().use_arrays()):
+        out = system.propagate(2.5 * DAY_S, 15)
+        assert out.shape == (15, 7, 2)
+        assert np.allclose(out, np.stack(frames), rtol=1e-13, atol=1e-3)
+        assert [p.phase_rad for p in system.planets] == [
+            p.phase_rad for p in stepped.planets
+        ]
+
+
+def test_native_and_numpy_kernels_agree():
+    arrays = _system().use_arrays().arrays
+    phase_a = arrays.phase_rad.copy()
+    phase_b = arrays.phase_rad.copy()
+    out_b = np.empty((20, 7, 2))
+
+    out_a = propagate(arrays.distance_m, phase_a, arrays.omega_rad_s, DAY_S, 20)
+    _propagate_numpy(arrays.distance_m, phase_b, arrays.omega_rad_s, DAY_S, 20, out_b)
+
+    assert np.array_equal(phase_a, phase_b)
+    assert np.allclose(out_a, out_b, rtol=1e-15, atol=1e-3)
+
+
+def test_propagate_validates_arguments():
+    arrays = _system().use_arrays().arrays
+    with pytest.raises(ValueError):
+        arrays.propagate(-1.0, 3)
+    with pytest.raises(TypeError):
+        propagate(arrays.distance_m, [0.0] * 7, arrays.omega_rad_s, 1.0, 3)
+
+
+@pytest.mark.parametrize("threads", [2, 3, 8])
+def test_sharded_stepping_is_bit_identical(threads):
+    sun = Sun()
+    planets = generate_planets(sun, 8, seed=3) * 125
+    single = SolarSystem(sun=sun, planets=list(planets)).use_arrays()
+    sharded = SolarSystem(sun=sun, planets=list(planets)).use_arrays()
+    times = np.linspace(-YEAR_S, 40 * YEAR_S, 9)
+
+    for _ in range(5):
+        single.step(0.7 * DAY_S, threads=1)
+        sharded.step(0.7 * DAY_S, threads=threads)
+        assert np.array_equal(sharded.arrays.phase_rad, single.arrays.phase_rad)
+        assert np.array_equal(
+            sharded.positions_m(threads=threads), single.positions_m(threads=1)
+        )
+    assert np.array_equal(
+        sharded.positions_at(times, threads=threads),
+        single.positions_at(times, threads=1),
+    )
+
+
+def test_shards_and_thread_setting():
+    assert shards(10, 3) == [(0, 3), (3, 6), (6, 10)]
+    assert shards(2, 8) == [(0, 1), (1, 2)]
+    assert shards(PARALLEL_MIN_BODIES - 1) == [(0, PARALLEL_MIN_BODIES - 1)]
+
+    before = get_threads()
+    try:
+        set_threads(4)
+        assert len(shards(PARALLEL_MIN_BODIES)) == 4
+        with pytest.raises(ValueError):
+            set_threads(0)
+    finally:
+        set_threads(before)
+
+
+def test_growing_the_pool_keeps_the_old_one_usable():
+    small = _executor(1)
+    held = small.submit(sum, [1, 2])
+    larger = _executor(small._max_workers + 3)
+    assert larger is not small and larger._max_workers > small._max_workers
+    # A thread still holding the old pool can keep submitting to it
+    assert small.submit(sum, [3, 4]).result() == 7
+    assert held.result() == 3
+    assert _executor(1) is larger
@@ -0,0 +1,78 @@
+"""
+Tests for lazy checkpoint access through ``open_checkpoint``.
+
+These tests verify that per-key and sliced reads return the same data
+as an eager ``load_checkpoint``, and that uncompressed members are
+memory-mapped instead of read into memory.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from waterio import open_checkpoint, save_checkpoint
+
+
+def _frames() -> np.ndarray:
+    rng = np.random.default_rng(1)
+    return rng.normal(size=(40, 6, 2))
+
+
+def test_uncompressed_members_are_memory_mapped(tmp_path: Path) -> None:
+    """
+    Test that uncompressed arrays come back as read-only memmaps.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    p: Path = tmp_path / "ckpt.npz"
+    pos = _frames()
+    np.savez(p, positions=pos, step=np.array(7))
+
+    with open_checkpoint(p) as ckpt:
+        assert set(ckpt) == {"positions", "step"}
+        assert ckpt.shape("positions") == (40, 6, 2)
+        out = ckpt["positions"]
+        assert isinstance(out, np.memmap)
+        assert not out.flags.writeable
+        assert np.array_equal(out, pos)
+        assert np.array_equal(ckpt.read("positions", 5, 9), pos[5:9])
+        assert int(ckpt["step"]) == 7
+
+
+def test_compressed_slices_match_full_array(tmp_path: Path) -> None:
+    """
+    Test that ranged reads from a compressed checkpoint match slicing.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    p: Path = tmp_path / "ckpt.npz"
+    pos = _frames()
+    save_checkpoint(p, positions=pos)
+
+    with open_checkpoint(p) as ckpt:
+        assert np.array_equal(ckpt.read("positions", 10, 25), pos[10:25])
+        assert np.array_equal(ckpt.read("positions", 38), pos[38:])
+        assert np.array_equal(ckpt.read("positions", -3, -1), pos[-3:-1])
+        assert np.array_equal(ckpt["positions"], pos)
+        with pytest.raises(KeyError):
+            ckpt["missing"]
+
+
+def test_open_checkpoint_missing_file(tmp_path: Path) -> None:
+    """
+    Test that opening a missing checkpoint raises FileNotFoundError.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    with pytest.raises(FileNotFoundError):
+        open_checkpoint(tmp_path / "missing.npz")
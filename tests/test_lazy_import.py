@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _loaded_after(code: str) -> set:
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sorted(sys.modules))"],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(out.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import solsysgen",
+        "from solsysgen.models import Planet, Sun",
+        "from solsysgen.constants import AU_M",
+        "from solsysgen import Sun, generate_planets",
+        "import waterio",
+    ],
+)
+def test_light_imports_do_not_load_numpy(code):
+    loaded = _loaded_after(code)
+    assert "numpy" not in loaded
+    assert "solsysgen.system" not in loaded
+
+
+def test_names_resolve_on_first_access():
+    import solsysgen
+    import waterio
+    from solsysgen.system import SolarSystem
+
+    assert solsysgen.SolarSystem is SolarSystem
+    assert "SolarSystem" in dir(solsysgen)
+    assert solsysgen.instrument.is_enabled() in (True, False)
+    assert callable(waterio.save_checkpoint)
+    for name in solsysgen.__all__:
+        assert getattr(solsysgen, name) is not None
+    for name in waterio.__all__:
+        assert getattr(waterio, name) is not None
+    with pytest.raises(AttributeError):
+        solsysgen.missing_name
+
+
+def test_waterio_runs_without_solsysgen(tmp_path):
+    code = f"""
+import sys
+sys.modules["solsysgen"] = None  # as if it were not installed
+import numpy as np
+from waterio import CheckpointWriter, load_checkpoint
+with CheckpointWriter() as writer:
+    writer.submit({str(tmp_path / "c.npz")!r}, x=np.arange(3.0))
+assert load_checkpoint({str(tmp_path / "c.npz")!r})["x"].tolist() == [0, 1, 2]
+"""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from solsysgen import SolarSystem, Sun, generate_planets
+from solsysgen.constants import DAY_S
+from solsysgen.live import (
+    StatePublisher,
+    decode_frame,
+    encode_frame,
+    read_frame,
+    serve,
+)
+
+
+def _system() -> SolarSystem:
+    sun = Sun()
+    return SolarSystem(sun=sun, planets=generate_planets(sun, 6, seed=8)).use_arrays()
+
+
+def test_frame_roundtrip():
+    positions = np.arange(12, dtype=np.float64).reshape(6, 2)
+    frame = encode_frame(3, 1.5, positions)
+    seq, t_s, decoded = decode_frame(frame)
+    assert (seq, t_s) == (3, 1.5)
+    assert np.array_equal(decoded, positions)
+    with pytest.raises(ValueError):
+        decode_frame(frame[:-1])
+
+
+def test_publisher_matches_stepping_and_drops_oldest():
+    reference = _system()
+    expected = []
+    for _ in range(6):
+        expected.append(reference.positions_m())
+        reference.step(DAY_S)
+
+    async def main():
+        publisher = StatePublisher(_system(), DAY_S, interval_s=0, max_queue=2)
+        fast = publisher.subscribe(maxsize=10)
+        slow = publisher.subscribe()
+        await publisher.run(6)
+        return [f async for f in fast], [f async for f in slow], slow.dropped
+
+    fast, slow, dropped = asyncio.run(main())
+    assert [decode_frame(f)[0] for f in fast] == list(range(6))
+    for frame, positions in zip(fast, expected):
+        assert np.array_equal(decode_frame(frame)[2], positions)
+    # the slow queue keeps the last two frames; closing it drops nothing
+    assert [decode_frame(f)[0] for f in slow] == [4, 5]
+    assert dropped == 4
+
+
+def test_late_publisher_skips_ticks_without_blocking_the_loop(monkeypatch):
+    system = _system()
+    step = SolarSystem.step
+
+    def slow_step(self, dt_s):
+        time.sleep(0.03)
+        step(self, dt_s)
+
+    monkeypatch.setattr(SolarSystem, "step", slow_step)
+
+    async def main():
+        publisher = StatePublisher(system, DAY_S, interval_s=0.01)
+        sub = publisher.subscribe(maxsize=10)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        other = asyncio.create_task(ticker())
+        await publisher.run(4)
+        other.cancel()
+        return [decode_frame(f) async for f in sub], publisher.skipped, ticks
+
+    frames, skipped, ticks = asyncio.run(main())
+    seqs = [seq for seq, _, _ in frames]
+    assert len(seqs) == 4 and seqs == sorted(seqs)
+    assert seqs[-1] - seqs[0] > 3 and skipped == seqs[-1] - 3
+    assert all(t == seq * DAY_S for seq, t, _ in frames)
+    assert ticks > 10
+
+
+def test_loopback_server_streams_frames():
+    async def main():
+        publisher = StatePublisher(_system(), DAY_S, interval_s=0.001)
+        server = await serve(publisher)
+        host, port = server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        while publisher.n_subscribers == 0:
+            await asyncio.sleep(0)
+
+        producer = asyncio.create_task(publisher.run(20))
+        frames = [await read_frame(reader) for _ in range(3)]
+        writer.close()
+        await producer
+        server.close()
+        await server.wait_closed()
+        return frames
+
+    frames = asyncio.run(main())
+    seqs = [seq for seq, _, _ in frames]
+    assert seqs == sorted(seqs)
+    assert all(p.shape == (6, 2) for _, _, p in frames)
+    assert frames[0][1] == frames[0][0] * DAY_S
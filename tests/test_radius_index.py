@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from solsysgen import Planet, SolarSystem, Sun, generate_planets
+from solsysgen.constants import AU_M
+from solsysgen.generation import add_custom_planet
+
+
+def _planet(name: str, distance_au: float) -> Planet:
+    return Planet(
+        name=name,
+        kind="rocky",
+        mass_kg=1e24,
+        radius_m=1e6,
+        distance_m=distance_au * AU_M,
+        phase_rad=0.0,
+        period_s=1e7,
+        orbital_speed_mps=1e4,
+    )
+
+
+def _distances(system: SolarSystem) -> list:
+    return [p.distance_m for p in system.planets]
+
+
+def test_add_remove_and_range_queries():
+    sun = Sun()
+    system = SolarSystem(sun=sun, planets=generate_planets(sun, 6, seed=2))
+    before = len(system)
+
+    idx = system.add_planet(_planet("A", 3.3))
+    assert system.planets[idx].name == "A"
+    assert _distances(system) == sorted(_distances(system))
+    assert system.orbit_taken(3.3 * AU_M)
+    with pytest.raises(ValueError):
+        system.add_planet(_planet("B", 3.3))
+
+    inner = system.planets_between(1 * AU_M, 5 * AU_M)
+    assert inner == [p for p in system.planets if AU_M <= p.distance_m <= 5 * AU_M]
+
+    a = system.planets[idx]
+    assert system.remove_planet(a) == idx
+    assert len(system) == before
+    assert not system.orbit_taken(3.3 * AU_M)
+    with pytest.raises(ValueError):
+        system.remove_planet(a)
+
+
+def test_add_planets_is_atomic_and_merges():
+    system = SolarSystem(sun=Sun(), planets=[_planet("a", 1.0), _planet("b", 4.0)])
+    system.add_planets([_planet("c", 9.0), _planet("d", 0.5), _planet("e", 2.0)])
+    assert [p.name for p in system.planets] == ["d", "a", "e", "b", "c"]
+
+    with pytest.raises(ValueError):
+        system.add_planets([_planet("f", 3.0), _planet("g", 4.0)])
+    with pytest.raises(ValueError):
+        system.add_planets([_planet("f", 3.0), _planet("g", 3.0)])
+    assert len(system) == 5
+
+    system.add_planets([_planet("h", 4.0)], allow_overlap=True)
+    assert [p.name for p in system.planets_between(4 * AU_M, 4 * AU_M)] == ["b", "h"]
+
+
+def test_index_keeps_array_engine_in_order():
+    sun = Sun()
+    system = SolarSystem(sun=sun, planets=generate_planets(sun, 5, seed=3))
+    system.use_arrays()
+    add_custom_planet(system, name="X", kind="rocky", distance_au=2.2)
+    system.remove_planet(system.planets[0])
+
+    assert np.array_equal(system.arrays.distance_m, _distances(system))
+    assert [p.name for p in system.planets] == system.arrays.names
+
+    # a list edited directly is re-sorted on the next radius query
+    system.planets.append(_planet("Y", 0.1))
+    assert system.planets_between(0, 0.2 * AU_M)[0].name == "Y"
+    assert system.planets[0].name == "Y"
+    assert np.array_equal(system.arrays.distance_m, _distances(system))
+
+
+def test_orbit_taken_looks_past_a_radius_on_the_tolerance_edge():
+    inner, near = _planet("a", 1.0), _planet("b", 1.0)
+    near.distance_m = AU_M + 1500.0
+    system = SolarSystem(sun=Sun(), planets=[inner, near])
+    # radii[k] == d - tol is not within tolerance, but the next radius is
+    assert system.orbit_taken(AU_M + 1000.0, tol_m=1000.0)
+    assert not system.orbit_taken(AU_M + 2500.0, tol_m=1000.0)
+
+
+def test_array_engine_edits_keep_views_valid():
+    sun = Sun()
+    system = SolarSystem(sun=sun, planets=generate_planets(sun, 5, seed=3))
+    system.use_arrays()
+    arrays = system.arrays
+    held = list(system.planets)
+    outer = held[-1]
+
+    added = _planet("X", 0.2)
+    system.add_planet(added)
+    system.add_planets([_planet("Y", 0.1), _planet("Z", 50.0)])
+    # edits touch only the list; the arrays are re-packed on first use
+    assert system.planets[1] is added
+    assert system.remove_planet(added) == 1
+    assert len(arrays) == 5
+
+    system.step(1e5)
+    assert system.arrays is arrays
+    assert [p.name for p in system.planets] == arrays.names
+    assert np.array_equal(arrays.distance_m, _distances(system))
+    assert system.planets[1:-1] == held
+    phase = outer.phase_rad
+    assert phase == arrays.phase_rad[system.planets.index(outer)]
+
+    # a fresh view of the same row matches; a same-named planet does not
+    with pytest.raises(ValueError):
+        system.remove_planet(_planet("Y", 0.1))
+    removed = system.planets[0]
+    assert system.remove_planet(arrays[0]) == 0
+    assert removed.name == "Y" and removed.distance_m == 0.1 * AU_M
+    system.step(0.0)
+    assert [p.name for p in system.planets] == arrays.names
+    assert outer.phase_rad == phase == arrays.phase_rad[-2]
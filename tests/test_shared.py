@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import os
+import struct
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from solsysgen import SharedSystem, SolarSystem, Sun, generate_planets
+from solsysgen.constants import DAY_S
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+@pytest.fixture
+def shared():
+    sun = Sun(name="Shared", mass_kg=2.5e30)
+    system = SolarSystem(sun=sun, planets=generate_planets(sun, 25, seed=8))
+    writer = SharedSystem.create(system)
+    yield system, writer
+    writer.close()
+    writer.unlink()
+
+
+def test_attach_sees_same_state_without_copies(shared):
+    system, writer = shared
+    reader = SharedSystem.attach(writer.name)
+    try:
+        arrays = reader.arrays
+        assert reader.sun == system.sun
+        assert list(arrays.names) == [p.name for p in system.planets]
+        assert arrays.kinds.tolist() == [p.kind for p in system.planets]
+        assert not arrays.phase_rad.flags.writeable
+        assert np.shares_memory(arrays.phase_rad, np.asarray(reader.shm.buf))
+
+        view = reader.system()
+        assert view.planets[3].to_dict() == system.planets[3].to_dict()
+        np.testing.assert_array_equal(view.positions_m(), system.positions_m())
+        with pytest.raises(ValueError):
+            arrays.step(DAY_S)
+        with pytest.raises(ValueError):
+            with reader.writing():
+                pass
+        del arrays, view
+    finally:
+        reader.close()
+
+
+def test_writes_bump_generation_and_match_local_stepping(shared):
+    system, writer = shared
+    reader = SharedSystem.attach(writer.name)
+    try:
+        assert reader.generation == 0
+        for _ in range(3):
+            writer.step(DAY_S)
+            system.step(DAY_S)
+        assert reader.wait(2, timeout_s=1.0) == 3
+
+        generation, cols = reader.snapshot()
+        assert generation == 3
+        phases = [p.phase_rad for p in system.planets]
+        np.testing.assert_array_equal(cols["phase_rad"], phases)
+        generation, positions = reader.snapshot_positions_m()
+        np.testing.assert_allclose(positions, system.positions_m(), rtol=1e-12)
+
+        with writer.writing():
+            # A reader never takes a snapshot of a half-finished write
+            with pytest.raises(TimeoutError):
+                reader.snapshot(timeout_s=0.01)
+        assert reader.generation == 4
+        with pytest.raises(TimeoutError):
+            reader.wait(4, timeout_s=0.01)
+        with pytest.raises(ValueError):
+            reader.snapshot("names")
+    finally:
+        reader.close()
+
+
+def test_other_process_attaches_by_name(shared):
+    system, writer = shared
+    writer.step(DAY_S)
+    code = (
+        "import sys\n"
+        "from solsysgen import SharedSystem\n"
+        "r = SharedSystem.attach(sys.argv[1])\n"
+        "g, cols = r.snapshot('phase_rad')\n"
+        "print(g, repr(float(cols['phase_rad'].sum())), r.arrays.names[0], sep=';')\n"
+        "r.close()\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code, writer.name],
+        env=dict(os.environ, PYTHONPATH=str(SRC)),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    generation, total, name = out.stdout.strip().split(";")
+    assert int(generation) == 1
+    assert float(total) == float(writer.arrays.phase_rad.sum())
+    assert name == "Planet 1"
+    assert "leaked" not in out.stderr
+    # The reader exiting must not free the block
+    again = SharedSystem.attach(writer.name)
+    assert again.generation == 1
+    again.close()
+
+
+def test_failed_close_keeps_handle_and_exit_still_unlinks():
+    sun = Sun()
+    system = SolarSystem(sun=sun, planets=generate_planets(sun, 5, seed=2))
+    writer = SharedSystem.create(system)
+    name = writer.name
+    with pytest.raises(BufferError):
+        with writer:
+            held = writer.system()
+            writer.step(DAY_S)
+            with pytest.raises(BufferError):
+                writer.close()
+            # still usable after the failed close
+            assert writer.step(DAY_S) == 2
+            assert writer.snapshot()[0] == 2
+    with pytest.raises(FileNotFoundError):
+        SharedSystem.attach(name)
+    del held
+    writer.close()
+
+
+def test_resizing_the_system_leaves_the_block_alone(shared):
+    system, writer = shared
+    view = writer.system()
+    view.add_planet(generate_planets(Sun(), 1, seed=1)[0], allow_overlap=True)
+    view.remove_planet(view.planets[-1])
+
+    assert len(view) == 25 and len(writer.arrays) == 25
+    block = np.asarray(writer.shm.buf)
+    assert np.shares_memory(writer.arrays.phase_rad, block)
+    assert not np.shares_memory(view.arrays.phase_rad, block)
+    writer.step(DAY_S)
+    del view, block
+
+
+def test_names_and_kinds_stay_on_the_block(shared):
+    system, writer = shared
+    reader = SharedSystem.attach(writer.name, writable=True)
+    try:
+        # attaching parses only fixed-size meta, whatever the planet count
+        meta_len = struct.unpack_from("<4sIQQQ", reader.shm.buf)[4]
+        assert meta_len < 512
+        view = reader.system()
+        with pytest.raises(TypeError):
+            view.planets[0].name = "Renamed"
+        with pytest.raises(ValueError):
+            reader.arrays.kinds[0] = "comet"
+        view.planets[0].kind = "dwarf"
+        assert writer.arrays.kinds[0] == "dwarf"
+        assert np.shares_memory(writer.arrays.kinds.codes, np.asarray(writer.shm.buf))
+        del view
+    finally:
+        reader.close()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pytest
+
+from solsysgen import SolarSystem, Sun, generate_planets
+from solsysgen.constants import DAY_S
+from solsysgen.generation import add_custom_planet
+from solsysgen.models import PLANET_KINDS
+from solsysgen.soa import Categorical, PackedStrings, PlanetArrays, PlanetView
+
+
+def _pair(n: int = 20, seed: int = 4):
+    sun = Sun()
+    plain = SolarSystem(sun=sun, planets=generate_planets(sun, n, seed=seed))
+    packed = SolarSystem(
+        sun=sun, planets=generate_planets(sun, n, seed=seed)
+    ).use_arrays()
+    return plain, packed
+
+
+def test_use_arrays_replaces_planets_with_views():
+    _, packed = _pair()
+    assert isinstance(packed.arrays, PlanetArrays)
+    assert all(isinstance(p, PlanetView) for p in packed.planets)
+    assert packed.planets[0].name == "Planet 1"
+
+
+def test_array_step_matches_scalar_path():
+    plain, packed = _pair()
+    for _ in range(50):
+        plain.step(3.7 * DAY_S)
+        packed.step(3.7 * DAY_S)
+
+    assert [p.phase_rad for p in packed.planets] == [p.phase_rad for p in plain.planets]
+    assert packed.state_m() == plain.state_m()
+    assert np.array_equal(packed.positions_m(), plain.positions_m())
+
+
+def test_positions_follow_arrays_until_repacked():
+    plain, packed = _pair(6)
+    plain.planets.reverse()
+    packed.planets.reverse()
+
+    # reordering the list in place does not move the packed rows
+    assert np.array_equal(packed.positions_m(), plain.positions_m()[::-1])
+    packed.use_arrays()
+    assert np.array_equal(packed.positions_m(), plain.positions_m())
+    assert list(packed.state_m()) == [p.name for p in plain.planets]
+
+
+def test_views_write_through_to_arrays():
+    _, packed = _pair(3)
+    view = packed.planets[1]
+    view.phase_rad = 1.25
+    assert packed.arrays.phase_rad[1] == 1.25
+
+    view.period_s = 100.0
+    assert view.angular_speed_rad_s() == pytest.approx(2.0 * np.pi / 100.0)
+    assert view.to_planet().period_s == 100.0
+
+
+def test_arrays_repack_after_insert():
+    _, packed = _pair(3)
+    add_custom_planet(packed, name="X", kind="rocky", distance_au=1.5)
+    packed.step(DAY_S)
+
+    assert len(packed.arrays) == 4
+    assert all(isinstance(p, PlanetView) for p in packed.planets)
+    assert "X" in packed.state_m()
+
+
+def test_array_step_rejects_negative_dt():
+    _, packed = _pair(3)
+    with pytest.raises(ValueError):
+        packed.step(-1.0)
+
+
+def test_positions_at_matches_stepping():
+    plain, packed = _pair(6)
+    times = np.array([30.0, 0.0, 10.0]) * DAY_S
+
+    expected = []
+    for t in times:
+        s, _ = _pair(6)
+        s.step(float(t))
+        expected.append(s.positions_m())
+
+    for system in (plain, packed):
+        out = system.positions_at(times)
+        assert out.shape == (3, 6, 2)
+        assert np.allclose(out, np.stack(expected), rtol=1e-12, atol=1.0)
+
+    assert np.array_equal(packed.positions_at([0.0])[0], packed.positions_m())
+
+
+def test_positions_at_keeps_precision_at_gigayear_epochs():
+    from fractions import Fraction
+    from math import pi
+
+    _, packed = _pair(4)
+    t = 3.0e9 * 365.25 * DAY_S
+    phases = packed.arrays.phases_at([t])[0]
+
+    for p, got in zip(packed.planets, phases):
+        turns = Fraction(t) / Fraction(p.period_s)
+        frac = float(turns - (turns.numerator // turns.denominator))
+        want = (p.phase_rad + 2.0 * pi * frac) % (2.0 * pi)
+        assert got == pytest.approx(want, abs=1e-12)
+
+
+def test_positions_at_requires_1d_times():
+    plain, _ = _pair(2)
+    with pytest.raises(ValueError):
+        plain.positions_at([[0.0, 1.0]])
+
+
+def test_categorical_behaves_like_a_list_of_strings():
+    col = Categorical.from_values(["b", "a", "b", "b"])
+    assert col == ["b", "a", "b", "b"] and len(col) == 4
+    assert col.categories == ["b", "a"] and col.codes.dtype == np.int8
+    assert col[-1] == "b" and col[1:3] == ["a", "b"]
+    col[0] = "c"
+    assert col.tolist() == ["c", "a", "b", "b"]
+    assert col[0] is col.categories[2]
+
+    # the code dtype widens once there are too many categories
+    for i in range(200):
+        col[1] = f"name {i}"
+    assert col.codes.dtype == np.int16 and col[1] == "name 199"
+
+    with pytest.raises(ValueError):
+        Categorical([0, 3], ["x", "y"])
+
+
+def test_fixed_categorical_and_packed_strings_refuse_growth():
+    col = Categorical([0, 1, 0], ["a", "b"], fixed=True)
+    col[0] = "b"
+    assert col.tolist() == ["b", "b", "a"]
+    with pytest.raises(ValueError):
+        col[0] = "c"
+
+    packed = PackedStrings.from_values(["Planet 1", "Ünïcode", ""])
+    assert packed == ["Planet 1", "Ünïcode", ""] and len(packed) == 3
+    assert (
+        packed[1] == "Ünïcode"
+        and packed[-1] == ""
+        and packed[:2] == packed.tolist()[:2]
+    )
+    with pytest.raises(TypeError):
+        packed[0] = "Renamed"
+    with pytest.raises(ValueError):
+        PackedStrings([0, 5], np.zeros(3, dtype=np.uint8))
+
+
+def test_categorical_nbytes_counts_lookup():
+    col = Categorical.from_values(f"name {i}" for i in range(100))
+    strings = sum(sys.getsizeof(c) for c in col.categories)
+    assert col.nbytes >= col.codes.nbytes + strings + sys.getsizeof(col._lookup)
+
+
+def test_arrays_store_kinds_as_codes_and_names_as_list():
+    _, packed = _pair()
+    arrays = packed.arrays
+    assert isinstance(arrays.names, list)
+    assert isinstance(arrays.kinds, Categorical)
+    assert arrays.kinds.categories[: len(PLANET_KINDS)] == list(PLANET_KINDS)
+    assert [p.kind for p in packed.planets] == arrays.kinds.tolist()
+
+    view = packed.planets[3]
+    view.name = "Renamed"
+    view.kind = "dwarf"
+    assert arrays.names[3] == "Renamed"
+    assert arrays.kinds.codes[3] == PLANET_KINDS.index("dwarf")
+    assert view.to_planet().name == "Renamed"
+
+    assert [v.name for v in arrays] == arrays.names
+    assert arrays[0].distance_m == packed.planets[0].distance_m
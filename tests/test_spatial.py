@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from solsysgen import SolarSystem, Sun, generate_planets
+from solsysgen.constants import AU_M, DAY_S
+from solsysgen.spatial import GridIndex
+
+
+def _brute_radius(positions, point, radius):
+    d = np.hypot(*(positions - point).T)
+    return set(np.nonzero(d <= radius)[0].tolist())
+
+
+def test_radius_and_knn_match_brute_force():
+    rng = np.random.default_rng(4)
+    positions = rng.normal(scale=AU_M, size=(5000, 2))
+    index = GridIndex(positions)
+
+    for point in rng.normal(scale=AU_M, size=(20, 2)):
+        for radius in (0.01 * AU_M, 0.3 * AU_M, 3 * AU_M):
+            found = index.query_radius(point, radius)
+            assert set(found.tolist()) == _brute_radius(positions, point, radius)
+            d = np.hypot(*(positions[found] - point).T)
+            assert np.all(np.diff(d) >= 0)
+
+        idx, dist = index.query_knn(point, 7)
+        expected = np.sort(np.hypot(*(positions - point).T))[:7]
+        assert np.allclose(dist, expected, rtol=0, atol=1e-3)
+        assert np.allclose(np.hypot(*(positions[idx] - point).T), dist)
+
+
+def test_update_tracks_stepping():
+    sun = Sun()
+    system = SolarSystem(sun=sun, planets=generate_planets(sun, 40, seed=9))
+    system.use_arrays()
+    index = GridIndex.for_system(system, cell_size_m=0.5 * AU_M)
+
+    for _ in range(5):
+        system.step(20 * DAY_S)
+        index.update(system.positions_m())
+        fresh = GridIndex(system.positions_m(), cell_size_m=0.5 * AU_M)
+        assert np.array_equal(index.keys, fresh.keys)
+        for i in range(0, 40, 7):
+            got = set(index.neighbors(i, 2 * AU_M).tolist())
+            want = _brute_radius(
+                system.positions_m(), system.positions_m()[i], 2 * AU_M
+            )
+            assert got == want - {i}
+
+
+def test_update_refiles_only_the_bodies_given():
+    rng = np.random.default_rng(8)
+    positions = rng.uniform(0, 100.0, size=(500, 2))
+    index = GridIndex(positions, cell_size_m=5.0)
+
+    moved = positions.copy()
+    movers = np.array([3, 250, 499, -1])
+    moved[movers] = rng.uniform(-50.0, 150.0, size=(4, 2))
+    index.update(moved, moved=movers)
+    fresh = GridIndex(moved, cell_size_m=5.0)
+    assert np.array_equal(index.keys, fresh.keys)
+    assert np.array_equal(np.sort(index.order), np.arange(500))
+    for point in ((-40.0, -40.0), (140.0, 140.0), (50.0, 50.0)):
+        assert set(index.query_radius(point, 30.0).tolist()) == _brute_radius(
+            moved, point, 30.0
+        )
+
+    with pytest.raises(IndexError):
+        index.update(moved, moved=[500])
+
+
+def test_grid_index_validation():
+    with pytest.raises(ValueError):
+        GridIndex(np.zeros((3, 3)))
+    index = GridIndex(np.zeros((3, 2)), cell_size_m=1.0)
+    with pytest.raises(ValueError):
+        index.update(np.zeros((4, 2)))
+    assert index.query_knn((0.0, 0.0), 10)[0].shape == (3,)
+
+
+def test_queries_outside_the_indexed_extent():
+    rng = np.random.default_rng(3)
+    points = rng.uniform(-1e3, 1e3, size=(200, 2))
+    index = GridIndex(points, cell_size_m=1e-3)
+
+    # Far beyond any cell key the index could hold: no error, just no bodies
+    assert len(index.query_radius((1e12, -1e12), 10.0)) == 0
+    assert len(index.query_radius((0.0, 0.0), 1e30)) == 200
+    idx, dist = index.query_knn((5e9, 5e9), 3)
+    d = np.hypot(*(points - 5e9).T)
+    assert np.allclose(dist, np.sort(d)[:3])
+    assert len(GridIndex(np.empty((0, 2))).query_radius((0.0, 0.0), 1.0)) == 0
@@ -0,0 +1,120 @@
+"""
+Tests for streaming frame output with waterio.
+
+These tests verify that position chunks produced by
+``SolarSystem.iter_positions`` can be written incrementally to disk
+and read back as a single array.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from solsysgen import SolarSystem, Sun, generate_planets
+from solsysgen.constants import DAY_S
+from waterio import FrameWriter, append_frames, load_frames, save_frames
+
+
+def _system() -> SolarSystem:
+    sun = Sun()
+    return SolarSystem(sun=sun, planets=generate_planets(sun, 5, seed=8))
+
+
+def test_iter_positions_chunks_match_positions_at() -> None:
+    """
+    Test that chunked positions concatenate to the closed-form result.
+    """
+    system = _system()
+    chunks = list(system.iter_positions(DAY_S, 10, chunk_steps=4))
+
+    assert [c.shape[0] for c in chunks] == [4, 4, 2]
+    expected = system.positions_at(np.arange(10) * DAY_S)
+    assert np.array_equal(np.concatenate(chunks), expected)
+
+
+def test_save_frames_roundtrip(tmp_path: Path) -> None:
+    """
+    Test that streamed chunks are readable as one memory-mapped array.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    system = _system()
+    p: Path = tmp_path / "frames.npy"
+
+    n = save_frames(p, system.iter_positions(DAY_S, 25, chunk_steps=7))
+    out = np.load(p, mmap_mode="r")
+
+    assert n == 25
+    assert out.shape == (25, 5, 2)
+    assert np.array_equal(out, system.positions_at(np.arange(25) * DAY_S))
+
+
+def test_frame_writer_file_is_valid_between_writes(tmp_path: Path) -> None:
+    """
+    Test that the header is kept current after every chunk.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    p: Path = tmp_path / "frames.npy"
+    with FrameWriter(p) as writer:
+        writer.write(np.zeros((3, 2)))
+        assert np.load(p).shape == (3, 2)
+        writer.write(np.ones((2, 2)))
+        assert np.load(p).shape == (5, 2)
+
+        with pytest.raises(ValueError):
+            writer.write(np.ones((2, 3)))
+
+
+def test_append_frames_extends_file_in_place(tmp_path: Path) -> None:
+    """
+    Test that appended blocks concatenate and ranges read back correctly.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    system = _system()
+    p: Path = tmp_path / "frames.npy"
+
+    blocks = list(system.iter_positions(DAY_S, 30, chunk_steps=8))
+    for block in blocks:
+        total = append_frames(p, block)
+    expected = np.concatenate(blocks)
+
+    assert total == 30
+    assert np.array_equal(load_frames(p), expected)
+    assert np.array_equal(load_frames(p, 9, 17), expected[9:17])
+
+    with pytest.raises(ValueError):
+        append_frames(p, np.zeros((1, 4, 2)))
+
+
+def test_append_discards_uncommitted_bytes(tmp_path: Path) -> None:
+    """
+    Test that data past the header's frame count is dropped on append.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    p: Path = tmp_path / "frames.npy"
+    np.save(p, np.arange(6.0).reshape(3, 2))
+    with p.open("ab") as fp:
+        fp.write(b"torn write")
+
+    append_frames(p, np.full((1, 2), 9.0))
+
+    out = load_frames(p)
+    assert out.shape == (4, 2)
+    assert np.array_equal(out[-1], [9.0, 9.0])
+    assert p.stat().st_size == out.nbytes + 128
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from solsysgen import SolarSystem, Sun, SystemBatch, generate_catalog, generate_planets
+from solsysgen.constants import DAY_S
+from solsysgen.kepler import circular_speed_mps, period_s
+from solsysgen.soa import Categorical
+
+
+def _systems() -> list:
+    suns = [Sun(), Sun(name="Heavy", mass_kg=4e30), Sun(name="Empty")]
+    counts = [5, 3, 0]
+    return [
+        SolarSystem(sun=s, planets=generate_planets(s, n, seed=i))
+        for i, (s, n) in enumerate(zip(suns, counts))
+    ]
+
+
+def test_batch_step_matches_individual_systems():
+    systems = _systems()
+    batch = SystemBatch.from_systems(_systems())
+    dts = np.array([DAY_S, 3.5 * DAY_S, 2 * DAY_S])
+
+    assert len(batch) == 3
+    assert batch.n_planets == 8
+    assert batch.offsets.tolist() == [0, 5, 8, 8]
+
+    for _ in range(10):
+        batch.step(dts)
+        for s, dt in zip(systems, dts):
+            s.step(float(dt))
+    batch.step(DAY_S)
+    for s in systems:
+        s.step(DAY_S)
+
+    views = batch.system_positions_m()
+    for i, s in enumerate(systems):
+        extracted = batch.system(i)
+        assert extracted.sun == s.sun
+        assert extracted.planets == s.planets
+        assert np.array_equal(views[i], s.positions_m())
+    assert views[2].shape == (0, 2)
+
+
+def test_batch_from_catalog_roundtrips():
+    catalog = generate_catalog(Sun(), 4, 3, root_seed=2, workers=1)
+    batch = SystemBatch.from_catalog(catalog)
+    for i in range(4):
+        assert batch.system(i).planets == catalog.system(i).planets
+
+
+def test_set_sun_rederives_orbits():
+    batch = SystemBatch.from_systems(_systems())
+    heavy = Sun(name="Heavier", mass_kg=8e30)
+    batch.set_sun(0, heavy)
+
+    system = batch.system(0)
+    assert batch.sun_mass_kg[0] == 8e30
+    for p in system.planets:
+        assert p.period_s == pytest.approx(period_s(p.distance_m, 8e30), rel=1e-15)
+        assert p.orbital_speed_mps == pytest.approx(
+            circular_speed_mps(p.distance_m, 8e30), rel=1e-15
+        )
+    assert batch.system(1).planets == _systems()[1].planets
+
+
+def test_batch_rejects_bad_dt():
+    batch = SystemBatch.from_systems(_systems())
+    with pytest.raises(ValueError):
+        batch.step(np.ones(2))
+    with pytest.raises(ValueError):
+        batch.step(np.array([1.0, -1.0, 1.0]))
+
+
+def test_from_catalog_shares_names_across_systems():
+    catalog = generate_catalog(Sun(), 30, 12, root_seed=2, workers=1)
+    batch = SystemBatch.from_catalog(catalog)
+    names = batch.arrays.names
+    assert isinstance(names, Categorical)
+    assert len(names.categories) == 12 and names.codes.dtype == np.int8
+    assert names.tolist() == catalog.name.tolist()
+    assert batch.system(4).planets[0].name == "Planet 1"
+
+
+def test_from_systems_shares_names_across_systems():
+    systems = _systems()
+    batch = SystemBatch.from_systems(systems)
+    names = batch.arrays.names
+    assert isinstance(names, Categorical)
+    assert names.tolist() == [p.name for s in systems for p in s.planets]
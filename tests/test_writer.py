@@ -0,0 +1,125 @@
+"""
+Tests for the background checkpoint writer.
+
+These tests verify that queued checkpoints are written from a snapshot
+of the submitted arrays, that write errors reach the caller, and that
+a failed save never replaces an existing checkpoint.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import waterio.iodata
+from waterio import CheckpointWriter, load_checkpoint, save_checkpoint
+from waterio.writer import snapshot
+
+
+def test_writer_saves_snapshots(tmp_path: Path) -> None:
+    """
+    Test that arrays mutated after submit are saved as submitted.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    state = np.zeros(4)
+    with CheckpointWriter(max_pending=1, compression="fast") as writer:
+        for i in range(3):
+            state[:] = i
+            writer.submit(tmp_path / f"ckpt{i}.npz", state=state)
+        writer.flush()
+        assert writer.pending == 0
+
+    for i in range(3):
+        out = load_checkpoint(tmp_path / f"ckpt{i}.npz")["state"]
+        assert np.array_equal(out, np.full(4, i))
+
+
+def test_snapshot_copies_only_writeable_arrays() -> None:
+    """
+    Test that frozen arrays are shared and writeable arrays are copied.
+    """
+    a = np.arange(5.0)
+    assert snapshot(a) is not a
+
+    frozen = np.arange(5.0)
+    frozen.flags.writeable = False
+    assert snapshot(frozen) is frozen
+
+    view = a[1:]
+    view.flags.writeable = False
+    assert snapshot(view) is not view
+
+    tail = frozen[1:]
+    assert snapshot(tail) is tail
+    from_bytes = np.frombuffer(b"\x00" * 16)
+    assert snapshot(from_bytes) is from_bytes
+
+
+def test_snapshot_copies_read_only_views_of_mutable_memory(tmp_path: Path) -> None:
+    """
+    Test that read-only views over memory that can still change are copied.
+    """
+    buf = bytearray(16)
+    over_bytearray = np.frombuffer(buf)
+    over_bytearray.flags.writeable = False
+    assert snapshot(over_bytearray) is not over_bytearray
+
+    path = tmp_path / "data.npy"
+    np.save(path, np.arange(4.0))
+    mapped = np.load(path, mmap_mode="r")
+    copied = snapshot(mapped)
+    assert copied is not mapped and not np.shares_memory(copied, mapped)
+
+
+def test_writer_reports_errors(tmp_path: Path) -> None:
+    """
+    Test that a failed background write is raised on flush.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    writer = CheckpointWriter()
+    writer.submit(tmp_path / "missing" / "ckpt.npz", a=np.arange(3))
+    with pytest.raises(FileNotFoundError):
+        writer.flush()
+    assert len(writer.errors) == 1
+
+    writer.submit(tmp_path / "ok.npz", a=np.arange(3))
+    writer.close()
+    assert (tmp_path / "ok.npz").exists()
+    with pytest.raises(ValueError):
+        writer.submit(tmp_path / "late.npz", a=np.arange(3))
+
+
+def test_failed_save_keeps_previous_checkpoint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that an interrupted save leaves the old file and no temp files.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    monkeypatch : pytest.MonkeyPatch
+        Used to make the NPZ writer fail part-way through.
+    """
+    p: Path = tmp_path / "ckpt.npz"
+    save_checkpoint(p, a=np.arange(3))
+
+    def broken(fp, arrays, *args, **kwargs):
+        fp.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(waterio.iodata, "write_npz", broken)
+    with pytest.raises(OSError):
+        save_checkpoint(p, a=np.arange(10))
+
+    assert np.array_equal(load_checkpoint(p)["a"], np.arange(3))
+    assert [f.name for f in tmp_path.iterdir()] == ["ckpt.npz"]